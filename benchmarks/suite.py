@@ -0,0 +1,216 @@
+"""Benchmark suite for parsing, validation, layout and writing across CV sizes.
+
+Times `parse_yaml_file`, `validate_cv_data`, `generatepdf` and
+`CVGenerator.generate` (pdf and html) on synthetic CVs of every size in
+`synthetic.SIZES`, recording the best wall time and the peak traced memory
+of each. The shared paragraph cache is cleared before every call, so each
+one times a cold render. Results are compared against a stored baseline and
+the run fails when a benchmark regresses beyond the tolerances.
+
+Run with:
+
+    python benchmarks/suite.py                    # compare with baseline.json
+    python benchmarks/suite.py --save-baseline    # record a new baseline
+    python benchmarks/suite.py --size small --output results.json
+
+Timings depend on the machine, so record the baseline on the machine that
+runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import yaml
+from synthetic import SIZES, make_cv_data, make_legacy_cv_data
+
+from generatecv.cache import get_paragraph_cache
+from generatecv.cv_generator import CVData, CVGenerator
+from generatecv.models import CV
+from generatecv.parser.yaml import parse_yaml_file, validate_cv_data
+from generatecv.pdf_generator import generatepdf
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Slowdowns under this many seconds are timer noise, whatever the ratio
+MIN_TIME_DELTA = 0.001
+
+
+def _cases(size: str, tmp_dir: Path) -> Iterator[tuple[str, Callable[[], object]]]:
+    """Yield (benchmark name, function to time) pairs for one CV size."""
+    data = make_cv_data(size)
+    cv_data = CV.model_validate(data)
+    legacy_data = CVData.model_validate(make_legacy_cv_data(size))
+    yaml_path = tmp_dir / f"{size}.yaml"
+    yaml_path.write_text(yaml.safe_dump(data), "utf-8")
+    pdf_generator = CVGenerator(output_format="pdf")
+    html_generator = CVGenerator(output_format="html")
+
+    yield "parse_yaml_file", lambda: parse_yaml_file(str(yaml_path))
+    yield "validate_cv_data", lambda: validate_cv_data(data)
+    yield "generatepdf", lambda: generatepdf(cv_data, str(tmp_dir / "cv.pdf"))
+    yield (
+        "CVGenerator.generate[pdf]",
+        lambda: pdf_generator.generate(legacy_data, tmp_dir / "legacy.pdf"),
+    )
+    yield (
+        "CVGenerator.generate[html]",
+        lambda: html_generator.generate(legacy_data, tmp_dir / "legacy.html"),
+    )
+
+
+def _clear_paragraph_cache() -> None:
+    """Forget paragraphs parsed and wrapped by earlier calls."""
+    paragraph_cache = get_paragraph_cache()
+    if paragraph_cache is not None:
+        paragraph_cache.clear()
+
+
+def _measure(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Return the best wall time and the peak traced memory of a function."""
+    # Silence progress output some code paths print while rendering.
+    with redirect_stdout(StringIO()):
+        func()  # warm up imports and style sheets
+        timings = []
+        # Like timeit, keep collector pauses out of the timings.
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                _clear_paragraph_cache()
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+        # Traced separately, since tracing slows the code down.
+        _clear_paragraph_cache()
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def run(sizes: list[str], repeat: int) -> dict[str, dict[str, float]]:
+    """Run every benchmark for the given sizes.
+
+    Returns:
+        Mapping of "<benchmark>/<size>" to its best time and peak memory
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            for name, func in _cases(size, Path(tmp_dir)):
+                key = f"{name}/{size}"
+                results[key] = _measure(func, repeat)
+                print(
+                    f"{key:38} {results[key]['seconds'] * 1000:10.2f} ms"
+                    f" {results[key]['peak_bytes'] / 1024:10.0f} KiB"
+                )
+    return results
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Compare results with a baseline.
+
+    Args:
+        results: Results of the current run
+        baseline: Results of the baseline run
+        time_tolerance: Allowed relative slowdown, e.g. 0.25 for 25%
+        memory_tolerance: Allowed relative growth of peak memory
+
+    Returns:
+        One message per regressed benchmark; benchmarks missing from the
+        baseline are not compared
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        seconds, base_seconds = current["seconds"], previous["seconds"]
+        if (
+            seconds > base_seconds * (1 + time_tolerance)
+            and seconds - base_seconds > MIN_TIME_DELTA
+        ):
+            regressions.append(
+                f"{key}: {seconds * 1000:.2f} ms vs {base_seconds * 1000:.2f} ms"
+            )
+        peak, base_peak = current["peak_bytes"], previous["peak_bytes"]
+        if peak > base_peak * (1 + memory_tolerance):
+            regressions.append(
+                f"{key}: peak {peak / 1024:.0f} KiB vs {base_peak / 1024:.0f} KiB"
+            )
+    return regressions
+
+
+def _environment() -> dict[str, str]:
+    """Describe the machine, so baselines from elsewhere can be spotted."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main() -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", choices=list(SIZES), action="append", dest="sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="Also write results here")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = run(args.sizes or list(SIZES), args.repeat)
+    report: dict[str, Any] = {"environment": _environment(), "results": results}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", "utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", "utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text("utf-8"))
+    if baseline["environment"] != report["environment"]:
+        print("Warning: the baseline was recorded in a different environment.")
+    regressions = find_regressions(
+        results, baseline["results"], args.time_tolerance, args.memory_tolerance
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if regressions:
+        return 1
+    print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Synthetic CV data for benchmarks.
+
+Builds CV dictionaries that validate against `generatecv.models.CV`, scaled
+so parse, validation and layout costs can be compared across CV sizes.
+"""
+
+from typing import Any
+
+# Number of (companies, roles per company, publications) per size
+SIZES: dict[str, tuple[int, int, int]] = {
+    "small": (1, 1, 0),
+    "typical": (4, 2, 10),
+    "huge": (40, 4, 1000),
+}
+
+
+def make_cv_data(size: str = "typical") -> dict[str, Any]:
+    """Build a CV dictionary of the given size.
+
+    Args:
+        size: One of the keys of `SIZES`
+
+    Returns:
+        Dict that validates as a `CV`
+    """
+    companies, roles, publications = SIZES[size]
+    return {
+        "personal_info": {
+            "name": "Jane Benchmark",
+            "email": "jane@example.com",
+            "phone": "+1 555 0100",
+            "location": "Remote",
+            "website": "https://example.com",
+            "linkedin": "https://linkedin.com/in/jane",
+            "summary": "Engineer who writes a lot of papers. " * 5,
+            "title": "Principal Engineer",
+        },
+        "education": [
+            {
+                "institution": f"University {i}",
+                "degree": "Doctor of Philosophy in Computer Science",
+                "start_date": "2010",
+                "end_date": "2014",
+                "location": "Somewhere",
+                "gpa": "3.9/4.0",
+            }
+            for i in range(max(1, companies // 4))
+        ],
+        "experience": [
+            {
+                "company": f"Company {c}",
+                "location": "Remote",
+                "roles": [
+                    {
+                        "title": f"Engineer {r}",
+                        "start_date": "Jan 2020",
+                        "end_date": "Present" if r == 0 else "Dec 2021",
+                        "description": "Built and operated distributed systems. " * 3,
+                        "achievements": [
+                            f"Shipped feature {a} to production" for a in range(5)
+                        ],
+                    }
+                    for r in range(roles)
+                ],
+            }
+            for c in range(companies)
+        ],
+        "skills": [
+            {"category": f"Category {i}", "name": "Python, Go, SQL, Kubernetes"}
+            for i in range(max(1, companies // 2))
+        ],
+        "projects": [
+            {
+                "name": f"Project {i}",
+                "description": "An open source tool.",
+                "technologies": ["Python", "PostgreSQL"],
+                "link": f"https://example.com/project/{i}",
+                "achievements": ["Reached 1k stars"],
+            }
+            for i in range(companies)
+        ],
+        "publications": [
+            f"J. Benchmark et al. Paper number {i}. Journal of Examples, "
+            f"{2000 + i % 25}."
+            for i in range(publications)
+        ],
+        "awards": ["Best Paper Award"],
+        "interests": ["Climbing", "Chess"],
+    }
+
+
+def make_legacy_cv_data(size: str = "typical") -> dict[str, Any]:
+    """Build a `CVGenerator` CV dictionary of the given size.
+
+    Args:
+        size: One of the keys of `SIZES`
+
+    Returns:
+        Dict that validates as a `generatecv.cv_generator.CVData`
+    """
+    companies, roles, publications = SIZES[size]
+    return {
+        "personal_info": {
+            "name": "Jane Benchmark",
+            "email": "jane@example.com",
+            "phone": "+1 555 0100",
+            "address": "Remote",
+            "website": "https://example.com",
+        },
+        "summary": "Engineer who writes a lot of papers. " * 5,
+        "education": [
+            {
+                "institution": f"University {i}",
+                "degree": "Doctor of Philosophy",
+                "field": "Computer Science",
+                "start_date": "2010",
+                "end_date": "2014",
+                "gpa": 3.9,
+            }
+            for i in range(max(1, companies // 4))
+        ],
+        "experience": [
+            {
+                "company": f"Company {c}",
+                "position": f"Engineer {r}",
+                "start_date": "Jan 2020",
+                "end_date": "Dec 2021",
+                "location": "Remote",
+                "description": "Built and operated distributed systems. " * 3,
+                "achievements": [
+                    f"Shipped feature {a} to production" for a in range(5)
+                ],
+            }
+            for c in range(companies)
+            for r in range(roles)
+        ],
+        "skills": [
+            {"category": f"Category {i}", "skills": ["Python", "Go", "SQL"]}
+            for i in range(max(1, companies // 2))
+        ],
+        "certifications": [f"Certificate {i}" for i in range(publications // 10)],
+        "languages": ["English", "Indonesian"],
+        "interests": ["Climbing", "Chess"],
+    }
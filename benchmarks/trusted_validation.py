@@ -0,0 +1,47 @@
+"""Benchmark trusted CV construction against full validation.
+
+Run with:
+
+    python benchmarks/trusted_validation.py [--size huge] [--repeat 20]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from synthetic import SIZES, make_cv_data
+
+from generatecv.models import CV
+from generatecv.parser.yaml import validate_cv_data
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the fastest of `repeat` calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the trusted construction benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=list(SIZES), default="huge")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Trusted data is the JSON dump of an already validated CV.
+    data = CV.model_validate(make_cv_data(args.size)).model_dump(mode="json")
+
+    validated = _best_of(args.repeat, lambda: validate_cv_data(data))
+    trusted = _best_of(args.repeat, lambda: validate_cv_data(data, trusted=True))
+
+    print(f"{args.size} CV, best of {args.repeat}:")
+    print(f"  validated: {validated * 1000:8.3f} ms")
+    print(f"  trusted  : {trusted * 1000:8.3f} ms  ({validated / trusted:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the libyaml-backed loader against the pure-Python loader.
+
+Run with:
+
+    python benchmarks/yaml_loader.py [--size huge] [--repeat 5]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from synthetic import SIZES, make_cv_data
+
+from generatecv.parser.yaml import parse_yaml_file
+
+
+def _best_of(repeat: int, yaml_path: str, use_libyaml: bool) -> float:
+    """Return the fastest of `repeat` parses of the file, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_yaml_file(yaml_path, use_libyaml=use_libyaml)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the YAML loader benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=list(SIZES), default="huge")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not yaml.__with_libyaml__:
+        print("PyYAML was built without libyaml; both runs use the Python loader.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yaml_path = Path(tmp_dir) / "cv.yaml"
+        yaml_path.write_text(yaml.safe_dump(make_cv_data(args.size)), "utf-8")
+        size_kib = yaml_path.stat().st_size / 1024
+
+        pure = _best_of(args.repeat, str(yaml_path), use_libyaml=False)
+        fast = _best_of(args.repeat, str(yaml_path), use_libyaml=True)
+
+    print(f"{args.size} CV ({size_kib:.0f} KiB), best of {args.repeat}:")
+    print(f"  SafeLoader : {pure * 1000:8.2f} ms")
+    print(f"  CSafeLoader: {fast * 1000:8.2f} ms  ({pure / fast:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,230 @@
+"""generatecv: generate professional CVs from structured data.
+
+The public API is importable from the package root. Names are resolved lazily
+on first access, so `import generatecv` stays cheap and reportlab, pydantic
+and PyYAML are only imported by code paths that actually use them.
+"""
+
+from importlib import import_module
+
+# Not imported from `typing`, which alone would triple the import time of the
+# package; type checkers understand this spelling too.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from generatecv.aio import (
+        AsyncRenderer,
+        agenerate_pdf,
+        arender_pdf_bytes,
+        ayamltocv,
+    )
+    from generatecv.batch import (
+        BatchRenderer,
+        BatchSummary,
+        FileResult,
+    )
+    from generatecv.cache import (
+        ParagraphCache,
+        RenderCache,
+        SectionCache,
+        get_paragraph_cache,
+        set_paragraph_cache,
+    )
+    from generatecv.cv_generator import CVGenerator
+    from generatecv.document import Document, build_document
+    from generatecv.html_generator import render_html, write_html
+    from generatecv.inputs import collect_inputs
+    from generatecv.instrumentation import PhaseRecord, Tracer, trace
+    from generatecv.layout import LayoutResult, SectionSpan
+    from generatecv.lint import LintError, LintResult, lint_file, lint_files
+    from generatecv.models import (
+        CV,
+        Certificate,
+        CompanyExperience,
+        Education,
+        Language,
+        PersonalInfo,
+        Project,
+        Reference,
+        Role,
+        Skill,
+    )
+    from generatecv.outputs import OutputRenderer, render_outputs
+    from generatecv.packet import (
+        CandidateSpan,
+        PacketBuilder,
+        PacketResult,
+        generate_packet,
+    )
+    from generatecv.parser.json import iter_jsonl_cvs, validate_cv_json
+    from generatecv.parser.yaml import (
+        CVDocument,
+        iter_yaml_cvs,
+        parse_yaml_file,
+        validate_cv_data,
+    )
+    from generatecv.pdf_generator import (
+        PDFJobResult,
+        PDFRenderer,
+        generatepdf,
+        generatepdf_many,
+        generatepdf_variants,
+        layout_pdf,
+        render_pdf_bytes,
+        render_pdf_variants,
+        yamltocv,
+    )
+    from generatecv.styles import get_style, style_names
+    from generatecv.text_generator import render_text, write_text
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AsyncRenderer": "generatecv.aio",
+    "agenerate_pdf": "generatecv.aio",
+    "arender_pdf_bytes": "generatecv.aio",
+    "ayamltocv": "generatecv.aio",
+    "BatchRenderer": "generatecv.batch",
+    "BatchSummary": "generatecv.batch",
+    "FileResult": "generatecv.batch",
+    "ParagraphCache": "generatecv.cache",
+    "RenderCache": "generatecv.cache",
+    "SectionCache": "generatecv.cache",
+    "get_paragraph_cache": "generatecv.cache",
+    "set_paragraph_cache": "generatecv.cache",
+    "CVGenerator": "generatecv.cv_generator",
+    "Document": "generatecv.document",
+    "build_document": "generatecv.document",
+    "render_html": "generatecv.html_generator",
+    "write_html": "generatecv.html_generator",
+    "collect_inputs": "generatecv.inputs",
+    "PhaseRecord": "generatecv.instrumentation",
+    "Tracer": "generatecv.instrumentation",
+    "trace": "generatecv.instrumentation",
+    "LayoutResult": "generatecv.layout",
+    "SectionSpan": "generatecv.layout",
+    "LintError": "generatecv.lint",
+    "LintResult": "generatecv.lint",
+    "lint_file": "generatecv.lint",
+    "lint_files": "generatecv.lint",
+    "CV": "generatecv.models",
+    "Certificate": "generatecv.models",
+    "CompanyExperience": "generatecv.models",
+    "Education": "generatecv.models",
+    "Language": "generatecv.models",
+    "PersonalInfo": "generatecv.models",
+    "Project": "generatecv.models",
+    "Reference": "generatecv.models",
+    "Role": "generatecv.models",
+    "Skill": "generatecv.models",
+    "OutputRenderer": "generatecv.outputs",
+    "render_outputs": "generatecv.outputs",
+    "CandidateSpan": "generatecv.packet",
+    "PacketBuilder": "generatecv.packet",
+    "PacketResult": "generatecv.packet",
+    "generate_packet": "generatecv.packet",
+    "iter_jsonl_cvs": "generatecv.parser.json",
+    "validate_cv_json": "generatecv.parser.json",
+    "CVDocument": "generatecv.parser.yaml",
+    "iter_yaml_cvs": "generatecv.parser.yaml",
+    "parse_yaml_file": "generatecv.parser.yaml",
+    "validate_cv_data": "generatecv.parser.yaml",
+    "PDFJobResult": "generatecv.pdf_generator",
+    "PDFRenderer": "generatecv.pdf_generator",
+    "generatepdf": "generatecv.pdf_generator",
+    "layout_pdf": "generatecv.pdf_generator",
+    "generatepdf_many": "generatecv.pdf_generator",
+    "generatepdf_variants": "generatecv.pdf_generator",
+    "render_pdf_bytes": "generatecv.pdf_generator",
+    "render_pdf_variants": "generatecv.pdf_generator",
+    "yamltocv": "generatecv.pdf_generator",
+    "get_style": "generatecv.styles",
+    "style_names": "generatecv.styles",
+    "render_text": "generatecv.text_generator",
+    "write_text": "generatecv.text_generator",
+}
+
+__all__ = [
+    "CV",
+    "AsyncRenderer",
+    "BatchRenderer",
+    "BatchSummary",
+    "CVDocument",
+    "CVGenerator",
+    "CandidateSpan",
+    "Certificate",
+    "CompanyExperience",
+    "Document",
+    "Education",
+    "FileResult",
+    "Language",
+    "LayoutResult",
+    "LintError",
+    "LintResult",
+    "OutputRenderer",
+    "PDFJobResult",
+    "PDFRenderer",
+    "PacketBuilder",
+    "PacketResult",
+    "ParagraphCache",
+    "PersonalInfo",
+    "PhaseRecord",
+    "Project",
+    "Reference",
+    "RenderCache",
+    "Role",
+    "SectionCache",
+    "SectionSpan",
+    "Skill",
+    "Tracer",
+    "agenerate_pdf",
+    "arender_pdf_bytes",
+    "ayamltocv",
+    "build_document",
+    "collect_inputs",
+    "generate_packet",
+    "generatepdf",
+    "generatepdf_many",
+    "generatepdf_variants",
+    "get_paragraph_cache",
+    "get_style",
+    "hello",
+    "iter_jsonl_cvs",
+    "iter_yaml_cvs",
+    "layout_pdf",
+    "lint_file",
+    "lint_files",
+    "parse_yaml_file",
+    "render_html",
+    "render_outputs",
+    "render_pdf_bytes",
+    "render_pdf_variants",
+    "render_text",
+    "set_paragraph_cache",
+    "style_names",
+    "trace",
+    "validate_cv_data",
+    "validate_cv_json",
+    "write_html",
+    "write_text",
+    "yamltocv",
+]
+
+
+def __getattr__(name: str) -> object:
+    """Import public names from their defining module on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily importable names alongside the loaded ones."""
+    return sorted({*globals(), *__all__})
+
+
 def hello() -> str:
     return "Hello from generatecv!"
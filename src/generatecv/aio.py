@@ -0,0 +1,190 @@
+"""Asynchronous API for CV Builder.
+
+This module provides coroutine counterparts of the PDF generation functions
+for use from asyncio applications. Parsing, validation and layout run in an
+executor so the event loop is never blocked, and a semaphore caps the number
+of renders in flight.
+"""
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import cache
+from weakref import WeakKeyDictionary
+
+from generatecv.models import CV
+from generatecv.pdf_generator import generatepdf, render_pdf_bytes, yamltocv
+
+# Renders allowed in flight by the renderer behind the module-level functions
+DEFAULT_MAX_CONCURRENCY = os.cpu_count() or 1
+
+_default_renderers: WeakKeyDictionary[asyncio.AbstractEventLoop, "AsyncRenderer"]
+_default_renderers = WeakKeyDictionary()
+
+
+@cache
+def _default_executor() -> Executor:
+    """Thread pool shared by renderers that are not given an executor."""
+    return ThreadPoolExecutor(
+        max_workers=DEFAULT_MAX_CONCURRENCY, thread_name_prefix="generatecv"
+    )
+
+
+class AsyncRenderer:
+    """Renders CVs from asyncio code with a cap on renders in flight.
+
+    Work runs in `executor`, so the event loop is never blocked. Work sent to
+    a thread pool runs in a copy of the caller's context, so an active
+    `trace()` records it. A renderer must only be used from a single event
+    loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        executor: Executor | None = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            max_concurrency (int): Number of renders allowed in flight at
+                once (default is the number of CPUs).
+            executor (Executor | None): Executor to run work in (default is
+                a shared thread pool). A `ProcessPoolExecutor` avoids
+                contention on the GIL.
+        """
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self._limiter = asyncio.Semaphore(max_concurrency)
+
+    async def generate_pdf(
+        self,
+        cv_data: CV,
+        output_path: str,
+        style: str = "classic",
+        page_size: str = "A4",
+    ) -> str:
+        """Generate a PDF CV; see `generatepdf`."""
+        return await self._run(generatepdf, cv_data, output_path, style, page_size)
+
+    async def render_pdf_bytes(
+        self, cv_data: CV, style: str = "classic", page_size: str = "A4"
+    ) -> bytes:
+        """Render a PDF CV in memory; see `render_pdf_bytes`."""
+        return await self._run(render_pdf_bytes, cv_data, style, page_size)
+
+    async def yamltocv(self, yaml_path: str, trusted: bool = False) -> CV:
+        """Parse and validate a YAML CV file; see `yamltocv`."""
+        return await self._run(yamltocv, "", yaml_path, "classic", "A4", trusted)
+
+    async def _run[**P, T](
+        self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a blocking function in the executor once a slot is free.
+
+        Cancelling the caller while it waits for a slot or for a free worker
+        means the function never runs. Work already running cannot be
+        interrupted; its result is discarded and its slot is only released
+        when it finishes, so the cap on renders in flight holds.
+        """
+        loop = asyncio.get_running_loop()
+        await self._limiter.acquire()
+        try:
+            executor = self.executor or _default_executor()
+            if isinstance(executor, ThreadPoolExecutor):
+                # Run in a copy of this context so an active trace sees it.
+                context = copy_context()
+
+                def call() -> T:
+                    return context.run(lambda: func(*args, **kwargs))
+
+                future = executor.submit(call)
+            else:
+                # pyrefly cannot forward ParamSpec arguments to another callable.
+                future = executor.submit(func, *args, **kwargs)  # type: ignore[bad-argument-type, not-iterable, bad-unpacking]
+        except BaseException:
+            self._limiter.release()
+            raise
+
+        def release(_: object) -> None:
+            try:
+                # Unbound, as pyrefly rejects zero-argument callbacks here.
+                loop.call_soon_threadsafe(asyncio.Semaphore.release, self._limiter)
+            except RuntimeError:  # the loop was closed before the work finished
+                pass
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+
+def _default_renderer() -> AsyncRenderer:
+    """Renderer shared by the module-level functions on the running loop."""
+    loop = asyncio.get_running_loop()
+    renderer = _default_renderers.get(loop)
+    if renderer is None:
+        renderer = _default_renderers[loop] = AsyncRenderer()
+    return renderer
+
+
+async def agenerate_pdf(
+    cv_data: CV, output_path: str, style: str = "classic", page_size: str = "A4"
+) -> str:
+    """Generate a PDF CV without blocking the event loop.
+
+    Renders share one `AsyncRenderer` per event loop; create your own to pick
+    the executor or the number of renders in flight.
+
+    Args:
+        cv_data: CV model containing the CV data
+        output_path: Path where the PDF will be saved
+        style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+
+    Returns:
+        Path to the generated PDF file
+    """
+    return await _default_renderer().generate_pdf(
+        cv_data, output_path, style, page_size
+    )
+
+
+async def arender_pdf_bytes(
+    cv_data: CV, style: str = "classic", page_size: str = "A4"
+) -> bytes:
+    """Render a PDF CV in memory without blocking the event loop.
+
+    Args:
+        cv_data: CV model containing the CV data
+        style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+
+    Returns:
+        The PDF document as bytes
+    """
+    return await _default_renderer().render_pdf_bytes(cv_data, style, page_size)
+
+
+async def ayamltocv(
+    output_path: str,
+    yaml_path: str,
+    style: str = "classic",
+    page_size: str = "A4",
+    trusted: bool = False,
+) -> CV:
+    """Convert a YAML file to a CV object without blocking the event loop.
+
+    Args:
+        output_path: Path where the PDF will be saved
+        yaml_path: Path to the YAML file containing the CV data
+        style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+        trusted: Skip validation of pre-validated data (default is False)
+
+    Returns:
+        CV object created from the YAML data
+    """
+    return await _default_renderer()._run(
+        yamltocv, output_path, yaml_path, style, page_size, trusted
+    )
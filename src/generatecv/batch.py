@@ -0,0 +1,232 @@
+"""Batch rendering of CV files for CV Builder.
+
+This module renders many YAML or JSON CV files into a directory of PDFs,
+parsing, validating and laying them out in parallel worker processes. Files
+whose PDF is already up to date are skipped, judged either by modification
+time or by a hash of the input kept in a manifest next to the PDFs.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+from generatecv.pdf_generator import generatepdf
+
+from .cache import library_version
+from .inputs import describe_error, load_cv
+
+# How to decide that an existing PDF is up to date
+SkipMode = Literal["mtime", "hash", "never"]
+
+# Records the input hash of each PDF in an output directory, for "hash" mode
+MANIFEST_NAME = ".generatecv-manifest.json"
+
+# A render job: (input_path, output_path, style, page_size)
+_RenderJob = tuple[str, str, str, str]
+
+
+class FileResult(NamedTuple):
+    """Outcome of one input file of a batch."""
+
+    input_path: Path
+    output_path: Path
+    status: Literal["rendered", "skipped", "failed"]
+    error: str | None = None
+
+
+class BatchSummary(NamedTuple):
+    """Outcome of a whole batch."""
+
+    results: list[FileResult]
+    seconds: float
+
+    def count(self, status: str) -> int:
+        """Return the number of files with the given status."""
+        return sum(result.status == status for result in self.results)
+
+    @property
+    def failures(self) -> list[FileResult]:
+        """The files that failed to render."""
+        return [result for result in self.results if result.status == "failed"]
+
+    @property
+    def docs_per_second(self) -> float:
+        """Rendered documents per second of wall time."""
+        rendered = self.count("rendered")
+        return rendered / self.seconds if self.seconds > 0 else 0.0
+
+
+def _render_job(job: _RenderJob) -> str | None:
+    """Render one file, returning an error message instead of raising."""
+    input_path, output_path, style, page_size = job
+    try:
+        generatepdf(load_cv(input_path), output_path, style, page_size)
+    except Exception as e:
+        # One line per file keeps the failure summary readable.
+        return describe_error(e)
+    return None
+
+
+def _input_digest(input_path: Path, style: str, page_size: str) -> str:
+    """Hash an input file together with the settings it is rendered with."""
+    digest = hashlib.sha256()
+    settings = f"{library_version()}\0{style.lower()}\0{page_size.lower()}\0"
+    digest.update(settings.encode("utf-8"))
+    digest.update(input_path.read_bytes())
+    return digest.hexdigest()
+
+
+class BatchRenderer:
+    """Renders CV files to PDFs in parallel, skipping up to date outputs."""
+
+    def __init__(
+        self,
+        style: str = "classic",
+        page_size: str = "A4",
+        jobs: int | None = None,
+        skip: SkipMode = "mtime",
+    ):
+        """Initialize the batch renderer.
+
+        Args:
+            style (str): Style of the CVs (default is "classic").
+            page_size (str): Size of the PDF pages (default is "A4").
+            jobs (int | None): Number of worker processes (default is the
+                number of CPUs). Use 1 to render in the current process.
+            skip (str): "mtime" skips PDFs newer than their input, "hash"
+                skips PDFs whose input and settings are unchanged since they
+                were rendered, and "never" renders everything (default is
+                "mtime").
+        """
+        self.style = style
+        self.page_size = page_size
+        self.jobs = jobs or os.cpu_count() or 1
+        self.skip = skip
+
+    def render(
+        self, inputs: Iterable[Path], output_dir: str | os.PathLike[str]
+    ) -> BatchSummary:
+        """Render every input file to `<output_dir>/<input stem>.pdf`.
+
+        A failing file does not abort the batch; its result carries the
+        error message instead.
+
+        Args:
+            inputs: YAML or JSON CV files, e.g. from `collect_inputs`
+            output_dir: Directory to write the PDFs to; created if missing
+
+        Returns:
+            The result of every input, in input order, and the elapsed time
+        """
+        start = time.perf_counter()
+        output_dir = Path(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = self._read_manifest(output_dir)
+
+        results: list[FileResult | None] = []
+        pending: list[tuple[int, _RenderJob, str | None]] = []
+        seen: set[Path] = set()
+        for input_path in inputs:
+            output_path = output_dir / f"{input_path.stem}.pdf"
+            result, digest = self._check(input_path, output_path, manifest, seen)
+            if result is None:
+                job = (str(input_path), str(output_path), self.style, self.page_size)
+                pending.append((len(results), job, digest))
+            results.append(result)
+
+        errors = self._run([job for _, job, _ in pending])
+        for (index, job, digest), error in zip(pending, errors, strict=True):
+            input_path, output_path = Path(job[0]), Path(job[1])
+            if error is None:
+                results[index] = FileResult(input_path, output_path, "rendered")
+                if digest is not None:
+                    manifest[output_path.name] = digest
+            else:
+                results[index] = FileResult(input_path, output_path, "failed", error)
+                manifest.pop(output_path.name, None)
+
+        if self.skip == "hash" and pending:
+            self._write_manifest(output_dir, manifest)
+        return BatchSummary(
+            [result for result in results if result is not None],
+            time.perf_counter() - start,
+        )
+
+    def _check(
+        self,
+        input_path: Path,
+        output_path: Path,
+        manifest: dict[str, str],
+        seen: set[Path],
+    ) -> tuple[FileResult | None, str | None]:
+        """Decide whether an input needs rendering.
+
+        Returns:
+            A skipped or failed result, or None if the input needs rendering,
+            and the hash of the input in "hash" mode
+        """
+        if output_path in seen:
+            error = f"Another input already renders to {output_path}"
+            return FileResult(input_path, output_path, "failed", error), None
+        seen.add(output_path)
+        try:
+            digest = self._digest(input_path)
+            up_to_date = self._is_up_to_date(input_path, output_path, digest, manifest)
+        except OSError as e:
+            error = f"{type(e).__name__}: {e}"
+            return FileResult(input_path, output_path, "failed", error), None
+        if up_to_date:
+            return FileResult(input_path, output_path, "skipped"), digest
+        return None, digest
+
+    def _run(self, jobs: list[_RenderJob]) -> list[str | None]:
+        """Render jobs over the worker pool, returning their errors."""
+        workers = min(self.jobs, len(jobs))
+        if workers <= 1:
+            return [_render_job(job) for job in jobs]
+        # As in generatepdf_many, a few chunks per worker keep IPC cheap
+        # without leaving workers idle at the end of the batch.
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_render_job, jobs, chunksize=chunksize))
+
+    def _digest(self, input_path: Path) -> str | None:
+        """Hash an input in "hash" mode; None in the other modes."""
+        if self.skip != "hash":
+            return None
+        return _input_digest(input_path, self.style, self.page_size)
+
+    def _is_up_to_date(
+        self,
+        input_path: Path,
+        output_path: Path,
+        digest: str | None,
+        manifest: dict[str, str],
+    ) -> bool:
+        """Whether the existing PDF for an input can be kept."""
+        if self.skip == "never" or not output_path.exists():
+            return False
+        if self.skip == "hash":
+            return manifest.get(output_path.name) == digest
+        return output_path.stat().st_mtime >= input_path.stat().st_mtime
+
+    def _read_manifest(self, output_dir: Path) -> dict[str, str]:
+        """Load the input hashes recorded in an output directory."""
+        if self.skip != "hash":
+            return {}
+        try:
+            return json.loads((output_dir / MANIFEST_NAME).read_text("utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_manifest(self, output_dir: Path, manifest: dict[str, str]) -> None:
+        """Save the input hashes of an output directory."""
+        path = output_dir / MANIFEST_NAME
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), "utf-8")
+        os.replace(tmp_path, path)
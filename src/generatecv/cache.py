@@ -0,0 +1,411 @@
+"""Render caches for CV Builder.
+
+This module provides a content-addressed cache of rendered PDFs, keyed by a
+stable hash of the validated CV and the render settings, with least recently
+used eviction under a byte budget. It also provides a cache of per-section
+flowables for incremental re-rendering of edited CVs, and a process-wide
+cache of parsed and wrapped paragraph text shared by every render.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pydantic_core import to_json
+
+from generatecv.models import CV
+
+from .document import Document
+
+if TYPE_CHECKING:
+    from reportlab.platypus import Flowable
+
+# Suffix of the files of an on-disk RenderCache; other files are left alone
+_ENTRY_SUFFIX = ".rendercache"
+
+
+class CacheStats(NamedTuple):
+    """Counters describing the state of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int  # always 0 for caches bounded by entry count
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits, or 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@cache
+def library_version() -> str:
+    """Return the installed generatecv version, keying caches to the release."""
+    try:
+        return version("generatecv")
+    except PackageNotFoundError:  # pragma: no cover - running from a checkout
+        return "unknown"
+
+
+def render_cache_key(
+    cv_data: CV | Document,
+    style: str,
+    page_size: str,
+    max_pages: int | None = None,
+) -> str:
+    """Compute the cache key for rendering a CV with the given settings.
+
+    Args:
+        cv_data: Validated CV model, or its document tree
+        style: Style name used for rendering
+        page_size: Page size name used for rendering
+        max_pages: Page count the CV was fitted to, if any
+
+    Returns:
+        Hex digest that changes whenever the CV, the settings or the
+        library version change
+    """
+    digest = hashlib.sha256()
+    header = f"{library_version()}\0{style.lower()}\0{page_size.lower()}\0"
+    if max_pages is not None:
+        header += f"{max_pages}\0"
+    digest.update(header.encode("utf-8"))
+    if isinstance(cv_data, Document):
+        digest.update(to_json(cv_data))
+    else:
+        digest.update(cv_data.model_dump_json(warnings=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered documents.
+
+    Entries live in memory by default. When `directory` is given they are
+    stored as `<key>.rendercache` files instead, so the cache survives
+    restarts and can be shared by worker processes; other files in the
+    directory are never indexed or deleted. Recency is then tracked through
+    file mtimes, a key missing from the index is looked up on disk so
+    entries written by other processes are hits. The directory is rescanned
+    on `put` when the budget is reached and at least every `rescan_interval`
+    seconds, so the budget covers the entries of all processes, with an
+    overshoot bounded by what the other processes write between rescans.
+    The cache is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: str | os.PathLike[str] | None = None,
+        rescan_interval: float = 1.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_bytes (int): Total size of cached documents to keep
+                (default is 64 MiB).
+            directory (str | PathLike | None): Directory to store entries in,
+                or None to keep them in memory.
+            rescan_interval (float): Seconds after which `put` rescans the
+                directory for entries of other processes (default is 1).
+        """
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.rescan_interval = rescan_interval
+        self._scanned_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> document (in memory) or document size (on disk), oldest first
+        self._entries: OrderedDict[str, bytes | int] = OrderedDict()
+        self._size_bytes = 0
+
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            with self._lock:
+                self._scan()
+                self._evict()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached document for a key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if isinstance(entry, bytes):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if self.directory is None:
+                self.misses += 1
+                return None
+        # Read from disk even if the key is not indexed, since another
+        # process sharing the directory may have written or evicted it.
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(key)
+                self.misses += 1
+            return None
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = len(data)
+            self._size_bytes += len(data)
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a document, evicting least recently used ones if needed.
+
+        Documents larger than the whole budget are not stored.
+        """
+        if len(data) > self.max_bytes:
+            return
+        if self.directory is not None:
+            self._write_file(key, data)
+            with self._lock:
+                self._drop(key)
+                self._entries[key] = len(data)
+                self._size_bytes += len(data)
+                stale = time.monotonic() - self._scanned_at >= self.rescan_interval
+                if stale or self._size_bytes > self.max_bytes:
+                    self._scan()
+                self._evict()
+            return
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = data
+            self._size_bytes += len(data)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key, delete_file=True)
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current hit/miss counters and cache size."""
+        with self._lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self._size_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def _scan(self) -> None:
+        """Rebuild the index from the directory; caller must hold the lock."""
+        assert self.directory is not None
+        existing = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # evicted by another process meanwhile
+                    continue
+                key = entry.name.removesuffix(_ENTRY_SUFFIX)
+                existing.append((stat.st_mtime_ns, key, stat.st_size))
+        existing.sort()
+        self._scanned_at = time.monotonic()
+        self._entries = OrderedDict((key, size) for _, key, size in existing)
+        self._size_bytes = sum(size for _, _, size in existing)
+
+    def _write_file(self, key: str, data: bytes) -> None:
+        """Write an entry atomically so readers never see partial files."""
+        assert self.directory is not None
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _drop(self, key: str, delete_file: bool = False) -> None:
+        """Forget an entry; the caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size_bytes -= entry if isinstance(entry, int) else len(entry)
+        if delete_file and self.directory is not None:
+            self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Evict oldest entries until within budget; caller must hold the lock."""
+        while self._size_bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest, delete_file=True)
+            self.evictions += 1
+
+
+def section_cache_key(section: str, data: Any, style: str) -> str:
+    """Compute the cache key for the flowables of one CV section.
+
+    Args:
+        section: Name of the section, e.g. "experience"
+        data: The section's content, e.g. its blocks in the document tree
+        style: Style name used for rendering
+
+    Returns:
+        Hex digest that changes whenever the section data or style change
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{style.lower()}\0{section}\0".encode())
+    digest.update(to_json(data))
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """LRU cache of the flowables built for individual CV sections.
+
+    When one bullet of a CV is edited, only the section containing it misses
+    the cache; every other section reuses its flowables. Cached flowables are
+    reused as-is by reportlab's layout, so a cache must not be shared by
+    renders running concurrently in different threads.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Number of sections to keep (default is 256).
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, list[Flowable]] = OrderedDict()
+
+    def get(self, key: str) -> list["Flowable"] | None:
+        """Return the cached flowables for a key, or None on a miss."""
+        flowables = self._entries.get(key)
+        if flowables is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return flowables
+
+    def put(self, key: str, flowables: list["Flowable"]) -> None:
+        """Store a section's flowables, evicting the oldest if needed."""
+        self._entries[key] = flowables
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current hit/miss counters and number of entries."""
+        return CacheStats(self.hits, self.misses, self.evictions, len(self), 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ParagraphCache:
+    """LRU cache of parsed paragraph markup and line-wrapping results.
+
+    Entries are keyed on the paragraph text, its style and, for wrapping,
+    the available width, so headings, date ranges and labels repeated
+    across the CVs of a batch are parsed and measured once. Cached values
+    are shared between paragraphs and must not be modified. The cache is
+    safe to use from multiple threads.
+    """
+
+    def __init__(self, max_entries: int = 8192):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Number of entries to keep (default is 8192).
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for a key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entries if needed."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current hit/miss counters and number of entries."""
+        with self._lock:
+            return CacheStats(
+                self.hits, self.misses, self.evictions, len(self._entries), 0
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_paragraph_cache: ParagraphCache | None = ParagraphCache()
+
+
+def get_paragraph_cache() -> ParagraphCache | None:
+    """Return the paragraph cache shared by renders in this process.
+
+    Read its `stats()` to see how often repeated text was reused.
+    """
+    return _paragraph_cache
+
+
+def set_paragraph_cache(paragraph_cache: ParagraphCache | None) -> None:
+    """Replace the shared paragraph cache; None turns paragraph caching off.
+
+    Only paragraphs created afterwards use the new cache.
+    """
+    global _paragraph_cache  # noqa: PLW0603 - process-wide setting
+    _paragraph_cache = paragraph_cache
@@ -0,0 +1,266 @@
+"""Command line interface for CV Builder.
+
+Provides the `generatecv` command. Subcommands import their dependencies
+only when they run, so `generatecv --help` stays fast.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from generatecv.models import CV
+
+
+def _unknown_style(style: str) -> bool:
+    """Report a style that does not exist, as argparse reports bad choices."""
+    from generatecv.styles import style_names  # noqa: PLC0415 - keeps startup fast
+
+    if style.lower() in style_names():
+        return False
+    choices = ", ".join(style_names())
+    print(
+        f"generatecv: error: unknown style {style!r} (choose from {choices})",
+        file=sys.stderr,
+    )
+    return True
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """Run the `serve` subcommand."""
+    from generatecv.server import serve  # noqa: PLC0415 - keeps startup fast
+
+    serve(args.host, args.port, args.workers, args.queue_size, args.timeout)
+    return 0
+
+
+def _render(args: argparse.Namespace) -> int:
+    """Run the `render` subcommand."""
+    from generatecv.batch import BatchRenderer  # noqa: PLC0415 - keeps startup fast
+    from generatecv.inputs import collect_inputs  # noqa: PLC0415
+
+    if _unknown_style(args.style):
+        return 2
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("No input files matched.")
+        return 1
+    renderer = BatchRenderer(args.style, args.page_size, args.jobs, args.skip)
+    summary = renderer.render(inputs, args.output_dir)
+
+    for failure in summary.failures:
+        print(f"FAILED {failure.input_path}: {failure.error}")
+    print(
+        f"Rendered {summary.count('rendered')}, skipped {summary.count('skipped')}, "
+        f"failed {summary.count('failed')} in {summary.seconds:.2f}s "
+        f"({summary.docs_per_second:.1f} docs/sec)"
+    )
+    return 1 if summary.failures else 0
+
+
+def _lint(args: argparse.Namespace) -> int:
+    """Run the `lint` subcommand."""
+    from generatecv.inputs import collect_inputs  # noqa: PLC0415 - keeps startup fast
+    from generatecv.lint import lint_files  # noqa: PLC0415
+
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("No input files matched.", file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    results = lint_files(inputs, args.jobs)
+    seconds = time.perf_counter() - start
+
+    for result in results:
+        if not (args.errors_only and result.ok):
+            print(json.dumps(result.as_dict()))
+    invalid = sum(not result.ok for result in results)
+    rate = len(results) / seconds if seconds > 0 else 0.0
+    print(
+        f"Checked {len(results)} files, {invalid} invalid in {seconds:.2f}s "
+        f"({rate:.0f} files/sec)",
+        file=sys.stderr,
+    )
+    return 1 if invalid else 0
+
+
+def _packet(args: argparse.Namespace) -> int:
+    """Run the `packet` subcommand."""
+    from generatecv.inputs import (  # noqa: PLC0415 - keeps startup fast
+        collect_inputs,
+        describe_error,
+        load_cv,
+    )
+    from generatecv.packet import generate_packet  # noqa: PLC0415
+
+    if _unknown_style(args.style):
+        return 2
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("No input files matched.")
+        return 1
+    skipped = 0
+
+    def candidates() -> Iterator["CV"]:
+        # Files are loaded as the packet reaches them, one at a time.
+        nonlocal skipped
+        for input_path in inputs:
+            try:
+                yield load_cv(input_path)
+            except Exception as e:
+                skipped = skipped + 1  # pyrefly rejects += on nonlocal names
+                print(f"SKIPPED {input_path}: {describe_error(e)}")
+
+    start = time.perf_counter()
+    try:
+        result = generate_packet(candidates(), args.output, args.style, args.page_size)
+    except ValueError as e:
+        print(f"FAILED {args.output}: {e}")
+        return 1
+    seconds = time.perf_counter() - start
+    print(
+        f"Wrote {len(result.candidates)} CVs on {result.page_count} pages to "
+        f"{args.output}, skipped {skipped} in {seconds:.2f}s"
+    )
+    return 1 if skipped else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the `generatecv` command."""
+    parser = argparse.ArgumentParser(
+        prog="generatecv", description="Generate professional CVs from YAML or JSON"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local HTTP server that renders CVs"
+    )
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="Interface to listen on"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=8000, help="Port to listen on (default: 8000)"
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    serve_parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=16,
+        help="Requests allowed to wait for a worker before 503 (default: 16)",
+    )
+    serve_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds a request may take before 504 (default: 30)",
+    )
+    serve_parser.set_defaults(handler=_serve)
+
+    render_parser = subparsers.add_parser(
+        "render", help="Render YAML or JSON CV files to PDFs"
+    )
+    render_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="CV files, directories of them or glob patterns like 'cvs/**/*.yaml'",
+    )
+    render_parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=".",
+        help="Directory to write the PDFs to (default: current directory)",
+    )
+    render_parser.add_argument(
+        "--style", default="classic", help="Style of the CVs (default: classic)"
+    )
+    render_parser.add_argument(
+        "--page-size",
+        default="A4",
+        choices=["A4", "letter"],
+        help="Size of the pages (default: A4)",
+    )
+    render_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    render_parser.add_argument(
+        "--skip",
+        default="mtime",
+        choices=["mtime", "hash", "never"],
+        help=(
+            "Skip PDFs newer than their input (mtime), skip PDFs whose input "
+            "and settings are unchanged (hash), or render everything (never); "
+            "default: mtime"
+        ),
+    )
+    render_parser.set_defaults(handler=_render)
+
+    lint_parser = subparsers.add_parser(
+        "lint",
+        help="Validate CV files without rendering them",
+        description=(
+            "Validate CV files against the CV model. Prints one JSON object "
+            "per file with its errors, and a summary on stderr."
+        ),
+    )
+    lint_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="CV files, directories of them or glob patterns like 'cvs/**/*.yaml'",
+    )
+    lint_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    lint_parser.add_argument(
+        "--errors-only", action="store_true", help="Only print invalid files"
+    )
+    lint_parser.set_defaults(handler=_lint)
+
+    packet_parser = subparsers.add_parser(
+        "packet", help="Combine many CV files into one PDF with a bookmark each"
+    )
+    packet_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="CV files, directories of them or glob patterns like 'cvs/**/*.yaml'",
+    )
+    packet_parser.add_argument(
+        "-o", "--output", required=True, help="Path of the packet PDF to write"
+    )
+    packet_parser.add_argument(
+        "--style", default="classic", help="Style of the CVs (default: classic)"
+    )
+    packet_parser.add_argument(
+        "--page-size",
+        default="A4",
+        choices=["A4", "letter"],
+        help="Size of the pages (default: A4)",
+    )
+    packet_parser.set_defaults(handler=_packet)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point for the `generatecv` command."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from html import escape
 from pathlib import Path
-from typing import Any, ClassVar, Literal, TypedDict
+from typing import Any, ClassVar, Literal, TextIO, TypedDict
 
 import yaml
 from pydantic import BaseModel, EmailStr, Field, field_validator
@@ -10,6 +12,9 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
+from generatecv.html_generator import is_link
+from generatecv.parser.yaml import get_yaml_loader
+
 
 class PersonalInfo(BaseModel):
     """Personal information for CV."""
@@ -157,12 +162,15 @@ class CVGenerator:
         }
         return custom_styles
 
-    def load_data_from_yaml(self, yaml_path: str | Path) -> CVData:
+    def load_data_from_yaml(
+        self, yaml_path: str | Path, use_libyaml: bool = True
+    ) -> CVData:
         """
         Load CV data from YAML file.
 
         Args:
             yaml_path: Path to the YAML file containing CV data
+            use_libyaml: Parse with the C loader when available (default is True)
 
         Returns:
             Parsed and validated CV data
@@ -172,7 +180,8 @@ class CVGenerator:
             raise FileNotFoundError(f"YAML file not found: {yaml_path}")
 
         with open(path, encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
+            loader = get_yaml_loader(use_libyaml)
+            yaml_data = yaml.load(f, Loader=loader)  # nosec B506 - safe loader
 
         # Parse and validate using Pydantic
         return CVData.model_validate(yaml_data)
@@ -265,17 +274,40 @@ class CVGenerator:
 
     def _generate_html(self, cv_data: CVData, output_path: Path) -> Path:
         """Generate HTML version of the CV."""
-        # Simple HTML generation for demonstration
-        html_content = f"""<!DOCTYPE html>
+        with open(output_path, "w", encoding="utf-8") as f:
+            self.write_html(cv_data, f)
+
+        return output_path
+
+    def write_html(self, cv_data: CVData, stream: TextIO) -> None:
+        """
+        Stream the HTML version of the CV to a text stream.
+
+        The document is written in small chunks as it is produced, so time is
+        linear and extra memory is constant in the size of the CV. Any text
+        stream works, e.g. an open file or `socket.makefile("w")`.
+
+        Args:
+            cv_data: CV data to include in the document
+            stream: Writable text stream that receives the HTML
+        """
+        for chunk in self._iter_html(cv_data):
+            stream.write(chunk)
+
+    def _iter_html(self, cv_data: CVData) -> Iterator[str]:
+        """Yield the HTML document for the CV chunk by chunk."""
+        info = cv_data.personal_info
+        name = escape(info.name)
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{cv_data.personal_info.name} - CV</title>
+    <title>{name} - CV</title>
     <style>
-        body {{ 
-            font-family: {self.template["font_name"]}, Arial, sans-serif; 
-            margin: 0; 
-            padding: 20px; 
+        body {{
+            font-family: {self.template["font_name"]}, Arial, sans-serif;
+            margin: 0;
+            padding: 20px;
         }}
         h1 {{ color: {self.template["primary_color"]}; }}
         h2 {{ color: {self.template["primary_color"]}; border-bottom: 1px solid #eee; }}
@@ -283,36 +315,93 @@ class CVGenerator:
     </style>
 </head>
 <body>
-    <h1>{cv_data.personal_info.name}</h1>
-    <p>Email: {cv_data.personal_info.email}</p>
-    <p>Phone: {cv_data.personal_info.phone}</p>
+    <h1>{name}</h1>
 """
+        yield f"<p>Email: {escape(info.email)}</p>\n"
+        yield f"<p>Phone: {escape(info.phone)}</p>\n"
+        if info.address:
+            yield f"<p>Address: {escape(info.address)}</p>\n"
+        for label, url in (
+            ("Website", info.website),
+            ("LinkedIn", info.linkedin),
+            ("GitHub", info.github),
+        ):
+            if url:
+                yield f"<p>{label}: {_html_link(url)}</p>\n"
 
         if cv_data.summary:
-            html_content += f"<h2>Summary</h2>\n<p>{cv_data.summary}</p>\n"
-
-        if cv_data.experience:
-            html_content += "<h2>Professional Experience</h2>\n"
-            for exp in cv_data.experience:
-                date_range = f"{exp.start_date} - {exp.end_date or 'Present'}"
-                html_content += f"<h3>{exp.position} at {exp.company}</h3>\n"
-                html_content += f"<p>{date_range}</p>\n"
-
-                if exp.description:
-                    html_content += f"<p>{exp.description}</p>\n"
-
-                if exp.achievements:
-                    html_content += "<ul>\n"
-                    for achievement in exp.achievements:
-                        html_content += f"<li>{achievement}</li>\n"
-                    html_content += "</ul>\n"
-
-        html_content += "</body>\n</html>"
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            yield f"<h2>Summary</h2>\n<p>{escape(cv_data.summary)}</p>\n"
+
+        yield from self._iter_html_experience(cv_data.experience)
+        yield from self._iter_html_education(cv_data.education)
+
+        if cv_data.skills:
+            yield "<h2>Skills</h2>\n"
+            for skill in cv_data.skills:
+                skills = escape(", ".join(skill.skills))
+                yield f"<p><strong>{escape(skill.category)}:</strong> {skills}</p>\n"
+
+        for title, items in (
+            ("Certifications", cv_data.certifications),
+            ("Languages", cv_data.languages),
+            ("Interests", cv_data.interests),
+        ):
+            if items:
+                yield f"<h2>{title}</h2>\n"
+                yield from self._iter_html_list(items)
+
+        yield "</body>\n</html>"
+
+    def _iter_html_experience(self, experience: list[ExperienceEntry]) -> Iterator[str]:
+        """Yield the HTML experience section."""
+        if not experience:
+            return
+        yield "<h2>Professional Experience</h2>\n"
+        for exp in experience:
+            date_range = f"{exp.start_date} - {exp.end_date or 'Present'}"
+            if exp.location:
+                date_range += f" | {exp.location}"
+            yield (
+                f"<h3>{escape(exp.position)} at {escape(exp.company)}</h3>\n"
+                f"<p>{escape(date_range)}</p>\n"
+            )
+            if exp.description:
+                yield f"<p>{escape(exp.description)}</p>\n"
+            yield from self._iter_html_list(exp.achievements)
+
+    def _iter_html_education(self, education: list[EducationEntry]) -> Iterator[str]:
+        """Yield the HTML education section."""
+        if not education:
+            return
+        yield "<h2>Education</h2>\n"
+        for edu in education:
+            date_range = f"{edu.start_date} - {edu.end_date or 'Present'}"
+            yield (
+                f"<h3>{escape(edu.degree)} in {escape(edu.field)}, "
+                f"{escape(edu.institution)}</h3>\n"
+                f"<p>{escape(date_range)}</p>\n"
+            )
+            if edu.gpa is not None:
+                yield f"<p>GPA: {edu.gpa}</p>\n"
+            yield from self._iter_html_list(edu.achievements)
 
-        return output_path
+    @staticmethod
+    def _iter_html_list(items: list[str]) -> Iterator[str]:
+        """Yield an HTML bullet list, or nothing if there are no items."""
+        if not items:
+            return
+        yield "<ul>\n"
+        for item in items:
+            yield f"<li>{escape(item)}</li>\n"
+        yield "</ul>\n"
+
+
+def _html_link(url: str) -> str:
+    """Return a URL as an HTML link, or as escaped text if it is not http(s)."""
+    text = escape(url)
+    if not is_link(url):
+        return text
+    return f'<a href="{text}">{text}</a>'
 
 
 def create_sample_cv() -> CVData:
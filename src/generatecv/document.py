@@ -0,0 +1,330 @@
+"""Renderer-agnostic document tree for CV Builder.
+
+This module turns a validated `CV` into a `Document`: the sections of the
+CV in display order, each a flat run of typed blocks holding their final
+text. The content decisions, such as section order, headings, labels and
+date ranges, are made here once. The PDF, HTML and text backends only
+decide how each kind of block looks.
+
+Documents are nested tuples of strings, so they pickle cheaply, compare by
+value and round-trip through compact JSON with `to_json` and `from_json`.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Literal, NamedTuple, Self, cast, get_args
+
+from generatecv.models import (
+    CV,
+    Certificate,
+    CompanyExperience,
+    Education,
+    Language,
+    PersonalInfo,
+    Project,
+    Reference,
+    Skill,
+)
+
+from .instrumentation import phase
+
+# What a block is, which decides how backends present it:
+# - name: the person's name
+# - headline: their professional title
+# - contact: contact details, one inline per item
+# - heading: the heading of a section
+# - entry: the title of an entry, e.g. a company, degree or project
+# - role: a role held within an entry
+# - details: secondary details of an entry, e.g. dates and location
+# - text: running text
+# - bullets: a bullet list, one inline per item
+BlockKind = Literal[
+    "name",
+    "headline",
+    "contact",
+    "heading",
+    "entry",
+    "role",
+    "details",
+    "text",
+    "bullets",
+]
+
+
+class Inline(NamedTuple):
+    """A run of text, optionally with a label and a link target."""
+
+    text: str
+    label: str | None = None
+    href: str | None = None
+
+    def plain(self) -> str:
+        """Return the text prefixed by its label, e.g. "Phone: 555-0100"."""
+        return f"{self.label}: {self.text}" if self.label else self.text
+
+
+class Block(NamedTuple):
+    """One paragraph-level element of a section."""
+
+    kind: BlockKind
+    content: tuple[Inline, ...]
+
+
+class Section(NamedTuple):
+    """The blocks of one section of a CV.
+
+    `key` names the section, e.g. "experience" or "custom:<title>" for
+    custom sections, and is stable across CVs so it can key caches.
+    """
+
+    key: str
+    blocks: tuple[Block, ...]
+
+
+class Document(NamedTuple):
+    """A CV ready to be rendered by any backend."""
+
+    title: str
+    sections: tuple[Section, ...]
+
+    def to_json(self) -> str:
+        """Serialize the document as compact JSON."""
+        return json.dumps(self, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Self:
+        """Load a document serialized with `to_json`.
+
+        Raises:
+            ValueError: If the data is not a serialized document, e.g. it
+                holds a block of an unknown kind
+        """
+        try:
+            title, sections = json.loads(data)
+            return cls(
+                title,
+                tuple(
+                    Section(
+                        key,
+                        tuple(
+                            Block(
+                                _block_kind(kind),
+                                tuple(Inline(*inline) for inline in content),
+                            )
+                            for kind, content in blocks
+                        ),
+                    )
+                    for key, blocks in sections
+                ),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid document JSON: {e}") from e
+
+
+_BLOCK_KINDS: frozenset[str] = frozenset(get_args(BlockKind))
+
+
+def _block_kind(kind: str) -> BlockKind:
+    """Return a block kind read from JSON, rejecting unknown kinds.
+
+    Raises:
+        ValueError: If the kind is not a `BlockKind`
+    """
+    if kind not in _BLOCK_KINDS:
+        raise ValueError(f"unknown block kind {kind!r}")
+    return cast("BlockKind", kind)
+
+
+def build_document(cv_data: CV) -> Document:
+    """Build the document tree of a CV.
+
+    Args:
+        cv_data: CV model containing the CV data
+
+    Returns:
+        The sections of the CV in display order; empty sections are left out
+    """
+    with phase("document"):
+        sections = [
+            Section("personal_info", tuple(_personal_info(cv_data.personal_info)))
+        ]
+        for spec in (
+            _section("experience", "Experience", cv_data.experience, _company_exp),
+            _section("education", "Education", cv_data.education, _education),
+            _section("skills", "Skills", cv_data.skills, _skill),
+            _section("projects", "Projects", cv_data.projects, _project),
+            _section(
+                "certifications", "Certifications", cv_data.certifications, _certificate
+            ),
+            _section("languages", "Languages", cv_data.languages, _language),
+            _section("references", "References", cv_data.references, _reference),
+            _list_section("publications", "Publications", cv_data.publications),
+            _list_section("awards", "Awards", cv_data.awards),
+            _list_section("interests", "Interests", cv_data.interests),
+        ):
+            sections.extend(spec)
+        for title, content in (cv_data.custom_sections or {}).items():
+            if isinstance(content, str):
+                blocks = (_heading(title), _block("text", content))
+            else:
+                blocks = (_heading(title), *_bullets(content))
+            sections.append(Section(f"custom:{title}", blocks))
+        return Document(cv_data.personal_info.name, tuple(sections))
+
+
+def as_document(cv_data: CV | Document) -> Document:
+    """Return a document as is, or build the document tree of a CV."""
+    if isinstance(cv_data, Document):
+        return cv_data
+    return build_document(cv_data)
+
+
+def _section[T](
+    key: str,
+    title: str,
+    items: list[T] | None,
+    to_blocks: Callable[[T], Iterable[Block]],
+) -> Iterator[Section]:
+    """Yield a section with a heading and each item, or nothing if empty."""
+    if not items:
+        return
+    blocks = [_heading(title)]
+    for item in items:
+        blocks.extend(to_blocks(item))
+    yield Section(key, tuple(blocks))
+
+
+def _list_section(key: str, title: str, items: list[str] | None) -> Iterator[Section]:
+    """Yield a section holding a bullet list, or nothing if empty."""
+    if items:
+        yield Section(key, (_heading(title), *_bullets(items)))
+
+
+def _block(
+    kind: BlockKind, text: str, label: str | None = None, href: str | None = None
+) -> Block:
+    """Return a block holding a single inline."""
+    return Block(kind, (Inline(text, label, href),))
+
+
+def _heading(title: str) -> Block:
+    """Return the heading of a section."""
+    return _block("heading", title)
+
+
+def _bullets(items: Iterable[str]) -> Iterator[Block]:
+    """Yield a bullet list of the items, or nothing if there are none."""
+    content = tuple(Inline(item) for item in items)
+    if content:
+        yield Block("bullets", content)
+
+
+def _date_range(start: str, end: str | None, location: str | None) -> str:
+    """Format the dates of an entry, followed by its location if known."""
+    dates = f"{start} - {end or 'Present'}"
+    if location:
+        dates += f" | {location}"
+    return dates
+
+
+def _personal_info(info: PersonalInfo) -> Iterator[Block]:
+    """Yield the name, headline, contact details and summary."""
+    yield _block("name", info.name)
+    if info.title:
+        yield _block("headline", info.title)
+
+    contact = [Inline(info.email, "Email")]
+    if info.phone:
+        contact.append(Inline(info.phone, "Phone"))
+    if info.location:
+        contact.append(Inline(info.location, "Location"))
+    for label, url in (
+        ("Website", info.website),
+        ("LinkedIn", info.linkedin),
+        ("GitHub", info.github),
+    ):
+        if url:
+            contact.append(Inline(str(url), label, str(url)))
+    yield Block("contact", tuple(contact))
+
+    if info.summary:
+        yield _heading("Summary")
+        yield _block("text", info.summary)
+
+
+def _company_exp(company_exp: CompanyExperience) -> Iterator[Block]:
+    """Yield a company and all the roles held there."""
+    company_text = company_exp.company
+    if company_exp.location:
+        company_text += f" ({company_exp.location})"
+    yield _block("entry", company_text)
+
+    for role in company_exp.roles:
+        yield _block("role", role.title)
+        yield _block(
+            "details", _date_range(role.start_date, role.end_date, role.location)
+        )
+        if role.description:
+            yield _block("text", role.description)
+        yield from _bullets(role.achievements or ())
+
+
+def _education(education: Education) -> Iterator[Block]:
+    """Yield an education entry."""
+    yield _block("entry", f"{education.degree} - {education.institution}")
+    yield _block(
+        "details",
+        _date_range(education.start_date, education.end_date, education.location),
+    )
+    if education.gpa:
+        yield _block("text", education.gpa, "GPA")
+    if education.details:
+        yield _block("text", education.details)
+
+
+def _skill(skill: Skill) -> Iterator[Block]:
+    """Yield a skill category and its skills."""
+    yield _block("entry", skill.category)
+    yield _block("text", skill.name)
+
+
+def _project(project: Project) -> Iterator[Block]:
+    """Yield a project entry."""
+    yield _block(
+        "entry", project.name, href=str(project.link) if project.link else None
+    )
+    if project.start_date and project.end_date:
+        yield _block("details", f"{project.start_date} - {project.end_date}")
+    if project.description:
+        yield _block("text", project.description)
+    if project.technologies:
+        yield _block("text", ", ".join(project.technologies), "Technologies")
+    yield from _bullets(project.achievements or ())
+
+
+def _certificate(certificate: Certificate) -> Iterator[Block]:
+    """Yield a certificate entry."""
+    yield _block("entry", f"{certificate.name} - {certificate.issuer}")
+    if certificate.date:
+        yield _block("details", certificate.date, "Date")
+    if certificate.description:
+        yield _block("text", certificate.description)
+    if certificate.link:
+        link = str(certificate.link)
+        yield _block("text", link, "Link", link)
+
+
+def _language(language: Language) -> Iterator[Block]:
+    """Yield a language and the proficiency in it."""
+    yield _block("text", language.proficiency, language.name)
+
+
+def _reference(reference: Reference) -> Iterator[Block]:
+    """Yield a reference entry."""
+    yield _block("entry", reference.name)
+    yield _block("details", reference.position)
+    yield _block("details", reference.company)
+    if reference.contact:
+        yield _block("text", reference.contact, "Contact")
+    if reference.relation:
+        yield _block("text", reference.relation, "Relation")
@@ -0,0 +1,120 @@
+"""HTML generation for CV Builder.
+
+This module renders the document tree of a CV as a standalone HTML document
+with the same sections, in the same order, as the PDF generator. All
+user-supplied text is escaped.
+"""
+
+from collections.abc import Iterator
+from html import escape
+from io import StringIO
+from typing import TextIO
+from urllib.parse import urlsplit
+
+from generatecv.models import CV
+
+from .document import Block, BlockKind, Document, Inline, as_document
+
+_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{name} - CV</title>
+    <style>
+        body {{ font-family: "Times New Roman", serif; margin: 0; padding: 20px; }}
+        h1 {{ font-family: Helvetica, Arial, sans-serif; margin-bottom: 4px; }}
+        h2 {{ border-bottom: 1px solid #eee; }}
+        .contact {{ font-family: Helvetica, Arial, sans-serif; }}
+        .details {{ font-style: italic; }}
+    </style>
+</head>
+<body>
+"""
+
+# URL schemes rendered as HTML links; other URLs are shown as plain text
+_LINK_SCHEMES = frozenset({"http", "https"})
+
+
+def is_link(url: str) -> bool:
+    """Return whether a URL may be rendered as an HTML link.
+
+    Only http(s) URLs are, which keeps `javascript:` and other active URLs
+    out of `href` attributes.
+    """
+    try:
+        scheme = urlsplit(url).scheme
+    except ValueError:
+        return False
+    return scheme.lower() in _LINK_SCHEMES
+
+
+def write_html(cv_data: CV | Document, stream: TextIO) -> None:
+    """Stream the HTML version of a CV to a text stream.
+
+    The document is written in small chunks as it is produced, so any text
+    stream works, e.g. an open file or an HTTP response body.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        stream: Writable text stream that receives the HTML
+    """
+    for chunk in _iter_html(as_document(cv_data)):
+        stream.write(chunk)
+
+
+def render_html(cv_data: CV | Document) -> str:
+    """Render a CV as an HTML document.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+
+    Returns:
+        The HTML document as a string
+    """
+    buffer = StringIO()
+    write_html(cv_data, buffer)
+    return buffer.getvalue()
+
+
+# Opening tag of each kind of block other than bullet lists
+_TAGS: dict[BlockKind, tuple[str, str]] = {
+    "name": ("h1", ""),
+    "headline": ("p", ' class="contact"'),
+    "contact": ("p", ' class="contact"'),
+    "heading": ("h2", ""),
+    "entry": ("h3", ""),
+    "role": ("h4", ""),
+    "details": ("p", ' class="details"'),
+    "text": ("p", ""),
+}
+
+
+def _iter_html(document: Document) -> Iterator[str]:
+    """Yield the HTML document chunk by chunk."""
+    yield _HEAD.format(name=escape(document.title))
+    for section in document.sections:
+        for block in section.blocks:
+            yield _html_block(block)
+    yield "</body>\n</html>\n"
+
+
+def _html_block(block: Block) -> str:
+    """Return the HTML of one block."""
+    if block.kind == "bullets":
+        items = "".join(
+            f"<li>{_html_inline(inline)}</li>\n" for inline in block.content
+        )
+        return f"<ul>\n{items}</ul>\n"
+    tag, attributes = _TAGS[block.kind]
+    text = " | ".join(_html_inline(inline) for inline in block.content)
+    return f"<{tag}{attributes}>{text}</{tag}>\n"
+
+
+def _html_inline(inline: Inline) -> str:
+    """Return the escaped text of an inline, as a link if it has an http(s) target."""
+    text = escape(inline.text)
+    if inline.href and is_link(inline.href):
+        text = f'<a href="{escape(inline.href)}">{text}</a>'
+    if inline.label:
+        text = f"{escape(inline.label)}: {text}"
+    return text
@@ -0,0 +1,95 @@
+"""Input file discovery and loading for CV Builder.
+
+This module finds YAML and JSON CV files from paths, directories and glob
+patterns, and loads them into validated `CV` models. It does not depend on
+the rendering stack, so validation-only tools stay free of reportlab.
+"""
+
+import glob
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from generatecv.models import CV
+from generatecv.parser.json import validate_cv_json
+from generatecv.parser.yaml import parse_yaml_file, validate_cv_data
+
+# Input file suffixes picked up from directories
+INPUT_SUFFIXES = (".yaml", ".yml", ".json")
+
+
+def collect_inputs(patterns: Iterable[str]) -> list[Path]:
+    """Expand files, directories and glob patterns into input files.
+
+    Directories contribute the YAML and JSON files directly inside them and
+    glob patterns support `**`. Each file is listed once, in the order it
+    was first matched.
+
+    Args:
+        patterns: File paths, directory paths or glob patterns
+
+    Returns:
+        The matching input files
+    """
+    inputs: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(
+                child for child in path.iterdir() if child.suffix in INPUT_SUFFIXES
+            )
+        elif glob.has_magic(pattern):
+            matches = [
+                Path(match) for match in sorted(glob.glob(pattern, recursive=True))
+            ]
+        else:
+            matches = [path]
+        for match in matches:
+            if not match.is_dir():
+                inputs.setdefault(match, None)
+    return list(inputs)
+
+
+def load_cv(input_path: str | os.PathLike[str]) -> CV:
+    """Parse and validate a CV file, as JSON if it ends in .json, else YAML.
+
+    Args:
+        input_path: Path to the CV file
+
+    Returns:
+        CV object if the file holds a valid CV
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If a YAML file cannot be parsed
+        ValueError: If a YAML file does not hold a mapping
+        ValidationError: If the data is not a valid CV, including malformed
+            JSON
+    """
+    path = Path(input_path)
+    if path.suffix == ".json":
+        return validate_cv_json(path.read_bytes())
+    return validate_cv_data(parse_yaml_file(str(path)))
+
+
+def describe_error(error: Exception) -> str:
+    """Summarize why a CV file could not be loaded or rendered, on one line.
+
+    Args:
+        error: The exception raised for the file
+
+    Returns:
+        The exception type and message, with validation errors listed as
+        "field.path: message" pairs
+    """
+    if isinstance(error, ValidationError):
+        details = "; ".join(
+            f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+            for detail in error.errors()
+        )
+        return f"ValidationError: {details}"
+    # YAML errors span several lines, pointing at the offending mark.
+    message = " ".join(str(error).split())
+    return f"{type(error).__name__}: {message}"
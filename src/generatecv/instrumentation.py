@@ -0,0 +1,167 @@
+"""Opt-in timing instrumentation for CV Builder.
+
+Wrap work in `trace()` to record how long each phase of the pipeline takes
+and how much it produced: YAML parsing, validation, flowable construction
+for each section, and reportlab layout. Outside of a trace every hook is a
+context variable lookup returning a shared no-op, so instrumentation can
+stay compiled into production code.
+
+Phases recorded by the library:
+
+- `parse`: reading and parsing a YAML file
+- `validate`: building the CV model from parsed data or JSON
+- `document`: building the renderer-agnostic document tree of a CV
+- `build:<section>`: creating the flowables of one section, with counts of
+  `paragraphs`, `lists` and `list_items`, and `cached` set on section cache
+  hits
+- `layout`: laying out and writing the PDF with reportlab, with a count of
+  `pages`
+- `fit`: one trial layout while fitting a CV on `max_pages` pages, with a
+  count of `pages`
+
+Traces follow the current context, so they cover work done in the calling
+thread or task, and the thread pool work of the asyncio API and of
+`render_outputs`, but not work sent to other processes.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import NamedTuple
+
+
+class PhaseRecord(NamedTuple):
+    """Duration and counts of one completed phase."""
+
+    name: str
+    seconds: float
+    counts: dict[str, int]
+
+
+class Tracer:
+    """Collects the phases recorded while it is active.
+
+    Attributes:
+        records: Completed phases, in the order they finished
+    """
+
+    def __init__(self, callback: Callable[[PhaseRecord], None] | None = None):
+        """Initialize the tracer.
+
+        Args:
+            callback (Callable | None): Called with each phase as it
+                completes, e.g. to forward it to a metrics system.
+        """
+        self.callback = callback
+        self.records: list[PhaseRecord] = []
+
+    def record(self, record: PhaseRecord) -> None:
+        """Store a completed phase and pass it to the callback."""
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def totals(self) -> dict[str, float]:
+        """Return the total seconds spent in each phase, by phase name."""
+        totals: dict[str, float] = {}
+        for record in self.records:
+            totals[record.name] = totals.get(record.name, 0.0) + record.seconds
+        return totals
+
+
+class Phase:
+    """Context manager timing one phase of an active trace."""
+
+    active = True
+
+    def __init__(self, tracer: Tracer, name: str):
+        self.tracer = tracer
+        self.name = name
+        self.counts: dict[str, int] = {}
+        self._start = 0.0
+
+    def count(self, **counts: int) -> None:
+        """Add to the counts reported with this phase."""
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def __enter__(self) -> "Phase":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        seconds = time.perf_counter() - self._start
+        self.tracer.record(PhaseRecord(self.name, seconds, self.counts))
+
+
+class _NullPhase(Phase):
+    """Phase returned when no trace is active; does nothing."""
+
+    active = False
+
+    def __init__(self) -> None:
+        pass
+
+    def count(self, **counts: int) -> None:
+        pass
+
+    def __enter__(self) -> "Phase":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+_current_tracer: ContextVar[Tracer | None] = ContextVar(
+    "generatecv_tracer", default=None
+)
+
+
+@contextmanager
+def trace(
+    callback: Callable[[PhaseRecord], None] | None = None,
+) -> Iterator[Tracer]:
+    """Record the phases of all work done inside the `with` block.
+
+    Args:
+        callback: Called with each phase as it completes
+
+    Yields:
+        The active Tracer, whose `records` hold the completed phases
+
+    Example:
+        >>> with trace() as tracer:
+        ...     generatepdf(cv, "cv.pdf")
+        >>> tracer.totals()["layout"]
+    """
+    tracer = Tracer(callback)
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def phase(name: str) -> Phase:
+    """Time a phase of the active trace; a no-op when no trace is active.
+
+    Check `Phase.active` before computing counts that are costly to gather.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NULL_PHASE
+    return Phase(tracer, name)
@@ -0,0 +1,314 @@
+"""Layout-only rendering for CV Builder.
+
+This module lays out the flowables of a CV against the page frame exactly
+as a real render would, wrapping and splitting them across pages, but
+never draws them or writes a PDF. It reports the page count, the pages
+each section occupies and problems worth a warning.
+
+It also provides the document template used for real renders, which can
+scale the whole story down to fit it on fewer pages.
+"""
+
+from collections.abc import Callable, Iterator
+from io import BytesIO
+from typing import Any, Literal, NamedTuple, override
+
+from reportlab import rl_config
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    BaseDocTemplate,
+    Flowable,
+    Frame,
+    ListFlowable,
+    PageTemplate,
+    Paragraph,
+    SimpleDocTemplate,
+)
+from reportlab.platypus.doctemplate import ActionFlowable
+from reportlab.platypus.flowables import LIIndenter
+
+from .cache import get_paragraph_cache
+
+# Lines running past the right margin by less than this are rounding noise
+_OVERFLOW_TOLERANCE = 0.5
+
+# Padding reportlab frames keep inside each edge, in points
+_FRAME_PADDING = 6
+
+# Paragraph attributes set by wrapping, which restore a wrap when reused
+_WRAP_STATE = (
+    "height",
+    "blPara",
+    "frags",
+    "_wrapWidths",
+    "_width_max",
+    "_splitLongWordCount",
+    "_hyphenations",
+)
+
+
+class SectionSpan(NamedTuple):
+    """Pages occupied by one section of a CV, numbered from 1."""
+
+    section: str
+    first_page: int
+    last_page: int
+
+
+class LayoutResult(NamedTuple):
+    """Outcome of laying out a CV without producing a PDF."""
+
+    page_count: int
+    sections: list[SectionSpan]
+    warnings: list[str]
+
+
+class SectionMarker(ActionFlowable):
+    """Zero-size flowable marking where a section starts in the story.
+
+    It takes no space and does not affect the spacing of its neighbours.
+    """
+
+    def __init__(self, section: str):
+        super().__init__()
+        self.section = section
+
+    @override
+    def apply(self, doc: BaseDocTemplate) -> None:
+        pass
+
+
+def _skip_draw(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for `Flowable.drawOn` during layout-only builds."""
+
+
+class MeasuredParagraph(Paragraph):
+    """Paragraph that reuses parsing and line breaking it has seen before.
+
+    Each paragraph remembers how it broke into lines at every width it was
+    wrapped to, so laying it out again, as the final render after fitting a
+    CV to a page count does, does not break the text again. Paragraphs
+    built from text also share parsed markup and wrap results with every
+    other paragraph of the same text and style through the process-wide
+    `ParagraphCache`.
+    """
+
+    width: float
+
+    def __init__(self, text: str, style: ParagraphStyle, **kwargs: Any):
+        self._cache = get_paragraph_cache() if text is not None else None
+        self._cache_key = (text, style)
+        super().__init__(text, style, **kwargs)
+
+    # The reportlab stubs leave out Paragraph._setup.
+    @override
+    def _setup(  # type: ignore[bad-override]
+        self,
+        text: str,
+        style: ParagraphStyle,
+        bulletText: Any,
+        frags: list[Any] | None,
+        cleaner: Callable[[str], str],
+    ) -> None:
+        if self._cache is None or frags is not None or bulletText is not None:
+            super()._setup(text, style, bulletText, frags, cleaner)
+            return
+        key = ("parse", *self._cache_key)
+        parsed = self._cache.get(key)
+        if parsed is None:
+            super()._setup(text, style, bulletText, frags, cleaner)
+            self._cache.put(key, (self.text, self.style, self.bulletText, self.frags))
+        else:
+            super()._setup(*parsed, cleaner)
+
+    @override
+    def wrap(self, aW: float, aH: float) -> tuple[float, float]:
+        if aW < rl_config._FUZZ:
+            return super().wrap(aW, aH)
+        memo = self.__dict__.setdefault("_wrap_memo", {})
+        state = memo.get(aW)
+        if state is None:
+            key = ("wrap", *self._cache_key, aW)
+            state = self._cache.get(key) if self._cache is not None else None
+            if state is None:
+                super().wrap(aW, aH)
+                state = {
+                    name: self.__dict__[name]
+                    for name in _WRAP_STATE
+                    if name in self.__dict__
+                }
+                if self._cache is not None:
+                    self._cache.put(key, state)
+            memo[aW] = state
+        self.__dict__.update(state)
+        self.width = aW
+        return self.width, self.height
+
+
+class ScaledDocTemplate(SimpleDocTemplate):
+    """Document template that draws its story scaled by a constant factor.
+
+    The story is laid out in a frame enlarged by `1 / scale` and every page
+    is drawn scaled by `scale`, so fonts, spacing and indents all shrink
+    together while the page size and margins stay the same.
+    """
+
+    frame_class: type[Frame] = Frame
+    canvasmaker: type[Canvas] = Canvas
+
+    def __init__(self, filename: Any, scale: float = 1.0, **kwargs: Any):
+        super().__init__(filename, **kwargs)
+        self.scale = scale
+
+    # Page callbacks and the canvas maker come from the template, so the
+    # parameters SimpleDocTemplate.build takes for them are ignored.
+    @override
+    def build(  # type: ignore[bad-override]
+        self, flowables: list[Flowable], *args: Any, **kwargs: Any
+    ) -> None:
+        """Lay out and draw the flowables on as many pages as they need."""
+        self._calc()
+        scale = self.scale
+        padding = _FRAME_PADDING / scale
+        frame = self.frame_class(
+            self.leftMargin / scale,
+            self.bottomMargin / scale,
+            self.width / scale,
+            self.height / scale,
+            leftPadding=padding,
+            bottomPadding=padding,
+            rightPadding=padding,
+            topPadding=padding,
+            id="normal",
+        )
+        self.addPageTemplates(
+            [
+                PageTemplate(
+                    id=name,
+                    frames=frame,
+                    onPage=self._scale_page,
+                    pagesize=self.pagesize,
+                )
+                for name in ("First", "Later")
+            ]
+        )
+        BaseDocTemplate.build(self, flowables, canvasmaker=self.canvasmaker)
+
+    def _scale_page(self, canv: Canvas, doc: BaseDocTemplate) -> None:
+        """Scale the drawing of a new page."""
+        if self.scale != 1:
+            canv.scale(self.scale, self.scale)
+
+    def pages_used(self) -> float:
+        """Return the pages the last build filled, the last one fractionally."""
+        frame = self.frame
+        filled = 1 - (frame._y - frame._y1p) / frame._aH
+        return self.page - 1 + filled
+
+
+class _LayoutFrame(Frame):
+    """Frame that places flowables without drawing them."""
+
+    # The reportlab stubs leave out Frame._add.
+    @override
+    def _add(  # type: ignore[bad-override]
+        self, flowable: Flowable, canv: Canvas, trySplit: int = 0
+    ) -> Literal[0, 1]:
+        # An instance attribute shadows the method for this call only.
+        flowable.drawOn = _skip_draw  # type: ignore[method-assign]
+        try:
+            placed = super()._add(flowable, canv, trySplit)
+        finally:
+            del flowable.drawOn
+        return placed
+
+    add = _add
+
+
+class _LayoutCanvas(Canvas):
+    """Canvas that never writes its document."""
+
+    @override
+    def save(self) -> None:
+        pass
+
+
+class LayoutDocTemplate(ScaledDocTemplate):
+    """Document template that lays a story out without rendering it.
+
+    Build it like a `SimpleDocTemplate`, with `SectionMarker` flowables at
+    the start of each section, then read the outcome from `result()`.
+    """
+
+    frame_class = _LayoutFrame
+    canvasmaker = _LayoutCanvas
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(BytesIO(), **kwargs)
+        self._spans: dict[str, SectionSpan] = {}
+        self._warnings: list[str] = []
+        self._section: str | None = None
+        # Page of the section's first flowable, until its second one lands
+        self._heading_page: int | None = None
+
+    @override
+    def afterFlowable(self, flowable: Flowable) -> None:
+        """Record where each section's flowables landed."""
+        if isinstance(flowable, SectionMarker):
+            self._section = flowable.section
+            self._heading_page = None
+            return
+        if self._section is None:
+            return
+
+        section = self._section
+        span = self._spans.get(section)
+        first_page = span.first_page if span else self.page
+        self._spans[section] = SectionSpan(section, first_page, self.page)
+
+        if span is None:
+            self._heading_page = self.page
+        elif self._heading_page is not None:
+            if self._heading_page != self.page:
+                self._warnings.append(
+                    f"{section}: heading is alone at the bottom of page "
+                    f"{self._heading_page}"
+                )
+            self._heading_page = None
+
+        for paragraph in _iter_paragraphs(flowable):
+            overflow = _overflow(paragraph)
+            if overflow > _OVERFLOW_TOLERANCE:
+                text = paragraph.getPlainText()[:40]
+                self._warnings.append(
+                    f"{section}: text runs {overflow:.1f}pt past the right "
+                    f"margin on page {self.page}: {text!r}"
+                )
+
+    def result(self) -> LayoutResult:
+        """Return the outcome of the last build."""
+        return LayoutResult(self.page, list(self._spans.values()), self._warnings)
+
+
+def _iter_paragraphs(flowable: Flowable) -> Iterator[Paragraph]:
+    """Yield the paragraphs in a flowable, including those in bullet lists."""
+    if isinstance(flowable, Paragraph):
+        yield flowable
+    elif isinstance(flowable, ListFlowable):
+        for item in flowable._content:
+            yield from _iter_paragraphs(item)
+    elif isinstance(flowable, LIIndenter):
+        yield from _iter_paragraphs(flowable._flowable)
+
+
+def _overflow(paragraph: Paragraph) -> float:
+    """Return how far the widest line of a wrapped paragraph overflows."""
+    bl_para = getattr(paragraph, "blPara", None)
+    if bl_para is None:
+        return 0.0
+    extra_space = (
+        line[0] if isinstance(line, tuple) else line.extraSpace
+        for line in bl_para.lines
+    )
+    return max((-space for space in extra_space), default=0.0)
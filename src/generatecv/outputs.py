@@ -0,0 +1,239 @@
+"""Multi-format output for CV Builder.
+
+This module parses and validates a CV file once and writes it as any mix of
+PDF, HTML, plain text and normalized JSON from the same in-memory `CV`. The
+document tree is also built once and shared by the PDF, HTML and text
+renderers, which do not depend on each other and run concurrently in an
+executor.
+"""
+
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import Context, copy_context
+from functools import cache, partial
+from pathlib import Path
+from typing import Literal, get_args
+
+from generatecv.document import Document, build_document
+from generatecv.html_generator import write_html
+from generatecv.inputs import load_cv
+from generatecv.models import CV
+from generatecv.pdf_generator import generatepdf
+from generatecv.text_generator import write_text
+
+# Formats a CV can be written as; each is also its file suffix
+OutputFormat = Literal["pdf", "html", "txt", "json"]
+OUTPUT_FORMATS: tuple[OutputFormat, ...] = get_args(OutputFormat)
+
+
+@cache
+def _default_executor() -> Executor:
+    """Thread pool shared by renderers that are not given an executor."""
+    return ThreadPoolExecutor(
+        max_workers=len(OUTPUT_FORMATS), thread_name_prefix="generatecv-outputs"
+    )
+
+
+def _write_pdf(
+    document: Document,
+    output_path: Path,
+    style: str,
+    page_size: str,
+    max_pages: int | None,
+) -> None:
+    """Write the PDF version of a CV."""
+    generatepdf(document, str(output_path), style, page_size, max_pages)
+
+
+def _write_html(document: Document, output_path: Path) -> None:
+    """Write the HTML version of a CV."""
+    with open(output_path, "w", encoding="utf-8") as stream:
+        write_html(document, stream)
+
+
+def _write_text(document: Document, output_path: Path) -> None:
+    """Write the plain text version of a CV."""
+    with open(output_path, "w", encoding="utf-8") as stream:
+        write_text(document, stream)
+
+
+def _write_json(cv_data: CV, output_path: Path) -> None:
+    """Write a CV as JSON with every field present, defaults filled in."""
+    output_path.write_text(cv_data.model_dump_json(indent=2), "utf-8")
+
+
+def _write_in_context(
+    context: Context, writer: Callable[[Path], None], output_path: Path
+) -> None:
+    """Run a writer in the given context, e.g. a copy of the caller's."""
+    context.run(writer, output_path)
+
+
+class OutputRenderer:
+    """Writes a CV in several formats at once from a single parse."""
+
+    def __init__(
+        self,
+        formats: Iterable[OutputFormat] = OUTPUT_FORMATS,
+        style: str = "classic",
+        page_size: str = "A4",
+        executor: Executor | None = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            formats (Iterable[str]): Formats to write, any of "pdf", "html",
+                "txt" and "json" (default is all of them).
+            style (str): Style of the PDF (default is "classic").
+            page_size (str): Size of the PDF pages (default is "A4").
+            executor (Executor | None): Executor the formats are written in
+                concurrently (default is a shared thread pool). A
+                `ProcessPoolExecutor` avoids contention on the GIL.
+
+        Raises:
+            ValueError: If no formats or an unknown format are given
+        """
+        self.formats: tuple[OutputFormat, ...] = tuple(dict.fromkeys(formats))
+        unknown = [name for name in self.formats if name not in OUTPUT_FORMATS]
+        if unknown or not self.formats:
+            raise ValueError(
+                f"Formats must be some of {', '.join(OUTPUT_FORMATS)}, "
+                f"got {', '.join(unknown) or 'none'}"
+            )
+        self.style = style
+        self.page_size = page_size
+        self.executor = executor
+
+    def output_paths(
+        self, output_base: str | os.PathLike[str]
+    ) -> dict[OutputFormat, Path]:
+        """Return the path each format is written to for an output base."""
+        base = Path(output_base)
+        return {name: base.with_name(f"{base.name}.{name}") for name in self.formats}
+
+    def render(
+        self,
+        cv_data: CV,
+        output_base: str | os.PathLike[str],
+        max_pages: int | None = None,
+    ) -> dict[OutputFormat, Path]:
+        """Write a CV to `<output_base>.<format>` in each format.
+
+        Args:
+            cv_data: CV model containing the CV data
+            output_base: Output path without a suffix, e.g. "out/jane"
+            max_pages: Shrink the PDF as little as needed to fit on this many
+                pages
+
+        Returns:
+            The path written for each format, in the order of `formats`
+        """
+        return self._write(cv_data, self.output_paths(output_base), max_pages)
+
+    def _write(
+        self,
+        cv_data: CV,
+        paths: dict[OutputFormat, Path],
+        max_pages: int | None,
+    ) -> dict[OutputFormat, Path]:
+        """Write a CV in each format to the given paths."""
+        # The renderers share one document tree; JSON is written from the CV.
+        document = build_document(cv_data)
+        writers: dict[OutputFormat, Callable[[Path], None]] = {
+            "pdf": partial(
+                _write_pdf,
+                document,
+                style=self.style,
+                page_size=self.page_size,
+                max_pages=max_pages,
+            ),
+            "html": partial(_write_html, document),
+            "txt": partial(_write_text, document),
+            "json": partial(_write_json, cv_data),
+        }
+        if len(self.formats) == 1:
+            name = self.formats[0]
+            writers[name](paths[name])
+            return paths
+
+        executor = self.executor or _default_executor()
+        futures = []
+        for name in self.formats:
+            if isinstance(executor, ThreadPoolExecutor):
+                # Run in a copy of this context so an active trace sees it.
+                future = executor.submit(
+                    _write_in_context, copy_context(), writers[name], paths[name]
+                )
+            else:
+                future = executor.submit(writers[name], paths[name])
+            futures.append(future)
+        for future in futures:
+            future.result()
+        return paths
+
+    def render_file(
+        self,
+        input_path: str | os.PathLike[str],
+        output_base: str | os.PathLike[str] | None = None,
+        max_pages: int | None = None,
+    ) -> dict[OutputFormat, Path]:
+        """Parse and validate a YAML or JSON CV file once and write it out.
+
+        Args:
+            input_path: Path to the CV file, read as JSON if it ends in .json
+            output_base: Output path without a suffix (default is the input
+                path without its suffix, with the JSON of a JSON input going
+                to `<base>.normalized.json`)
+            max_pages: Shrink the PDF as little as needed to fit on this many
+                pages
+
+        Returns:
+            The path written for each format, in the order of `formats`
+
+        Raises:
+            ValueError: If an output would overwrite the input file
+        """
+        input_path = Path(input_path)
+        if output_base is None:
+            base = input_path.with_suffix("")
+            paths = self.output_paths(base)
+            if paths.get("json") == input_path:
+                paths["json"] = base.with_name(f"{base.name}.normalized.json")
+        else:
+            paths = self.output_paths(output_base)
+        if input_path in paths.values():
+            raise ValueError(f"Writing {input_path} would overwrite the input")
+        cv_data = load_cv(input_path)
+        return self._write(cv_data, paths, max_pages)
+
+
+def render_outputs(
+    input_path: str | os.PathLike[str],
+    output_base: str | os.PathLike[str] | None = None,
+    formats: Iterable[OutputFormat] = OUTPUT_FORMATS,
+    style: str = "classic",
+    page_size: str = "A4",
+) -> dict[OutputFormat, Path]:
+    """Write a CV file as PDF, HTML, text and JSON from a single parse.
+
+    The file is parsed and validated once, and every format is written
+    concurrently from the resulting `CV`.
+
+    Args:
+        input_path: Path to the YAML or JSON CV file
+        output_base: Output path without a suffix (default is the input path
+            without its suffix, with the JSON of a JSON input going to
+            `<base>.normalized.json`)
+        formats: Formats to write, any of "pdf", "html", "txt" and "json"
+        style: Style name for the PDF (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the PDF pages ('A4' or 'letter')
+
+    Returns:
+        The path written for each format
+
+    Raises:
+        ValueError: If an output would overwrite the input file
+    """
+    renderer = OutputRenderer(formats, style, page_size)
+    return renderer.render_file(input_path, output_base)
@@ -0,0 +1,186 @@
+"""Hiring packets for CV Builder.
+
+This module lays out many CVs into a single PDF in one pass, each candidate
+starting on a new page under an entry of the document outline. Candidates
+are pulled from their iterable only when the layout reaches them, so the
+CV data and flowables of at most one candidate are held at a time.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, override
+
+from reportlab.platypus import BaseDocTemplate, Flowable, PageBreak
+from reportlab.platypus.doctemplate import ActionFlowable
+
+from generatecv.document import Document, as_document
+from generatecv.instrumentation import phase
+from generatecv.layout import ScaledDocTemplate
+from generatecv.models import CV
+from generatecv.pdf_generator import PDFRenderer
+
+
+class CandidateSpan(NamedTuple):
+    """Pages of a packet occupied by one candidate, numbered from 1."""
+
+    name: str
+    first_page: int
+    last_page: int
+
+
+class PacketResult(NamedTuple):
+    """Outcome of building a hiring packet."""
+
+    page_count: int
+    candidates: list[CandidateSpan]
+
+
+class _PacketStep(ActionFlowable):
+    """Runs a step of building a packet when the layout reaches it."""
+
+    def __init__(self, step: Callable[[], None]):
+        super().__init__()
+        self.step = step
+
+    @override
+    def apply(self, doc: BaseDocTemplate) -> None:
+        self.step()
+
+
+class _PacketDocTemplate(ScaledDocTemplate):
+    """Document template that streams candidates into its story."""
+
+    def __init__(
+        self,
+        filename: Any,
+        candidates: Iterator[CV | Document],
+        renderer: PDFRenderer,
+        **kwargs: Any,
+    ):
+        super().__init__(filename, **kwargs)
+        self._candidates = candidates
+        self._renderer = renderer
+        self._story: list[Flowable] = []
+        self._loaded = 0
+        self._first_pages: list[tuple[str, int]] = []
+
+    def build_packet(self) -> PacketResult:
+        """Lay out and write every candidate.
+
+        Raises:
+            ValueError: If there are no candidates
+        """
+        self.load_next_candidate()
+        if not self._story:
+            raise ValueError("A packet needs at least one candidate")
+        # doc.build consumes this list, which load_next_candidate refills.
+        self.build(self._story)
+
+        spans = []
+        last_pages = [page - 1 for _, page in self._first_pages[1:]] + [self.page]
+        for (name, first_page), last_page in zip(
+            self._first_pages, last_pages, strict=True
+        ):
+            spans.append(CandidateSpan(name, first_page, last_page))
+        return PacketResult(self.page, spans)
+
+    def load_next_candidate(self) -> None:
+        """Queue the flowables of the next candidate, if any."""
+        candidate = next(self._candidates, None)
+        if candidate is None:
+            return
+        document = as_document(candidate)
+        if self._loaded:
+            self._story.append(PageBreak())
+        self._loaded += 1
+        self._story.append(_PacketStep(partial(self.start_candidate, document.title)))
+        self._story.extend(self._renderer.flowables(document))
+        self._story.append(_PacketStep(self.load_next_candidate))
+
+    def start_candidate(self, name: str) -> None:
+        """Bookmark the current page as the start of a candidate."""
+        key = f"candidate-{len(self._first_pages)}"
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(name, key, level=0)
+        if not self._first_pages:
+            self.canv.showOutline()
+        self._first_pages.append((name, self.page))
+
+
+class PacketBuilder:
+    """Builds hiring packets: many CVs laid out in one PDF."""
+
+    def __init__(self, style: str = "classic", page_size: str = "A4"):
+        """Initialize the builder and resolve its layout settings.
+
+        Args:
+            style (str): Style of the CVs (default is "classic").
+            page_size (str): Size of the PDF pages (default is "A4").
+        """
+        self.renderer = PDFRenderer(style, page_size)
+
+    def build(
+        self,
+        candidates: Iterable[CV | Document],
+        dest: str | os.PathLike[str] | BinaryIO,
+    ) -> PacketResult:
+        """Lay out the candidates into one PDF, each starting on a new page.
+
+        Every candidate gets a top-level outline entry with their name. Fonts
+        and other resources are written to the PDF once for all candidates.
+
+        Args:
+            candidates: CVs or their document trees, e.g. a generator that
+                loads each CV as it is needed
+            dest: Where to write the PDF
+
+        Returns:
+            The page count and the pages each candidate occupies
+
+        Raises:
+            ValueError: If there are no candidates
+        """
+        filename: str | BinaryIO
+        if isinstance(dest, str | os.PathLike):
+            output_path = Path(dest)
+            os.makedirs(output_path.parent, exist_ok=True)
+            filename = str(output_path)
+        else:
+            filename = dest
+        doc = _PacketDocTemplate(
+            filename,
+            iter(candidates),
+            self.renderer,
+            pagesize=self.renderer.page_size,
+            **self.renderer.margins,
+        )
+        with phase("layout") as layout:
+            result = doc.build_packet()
+            layout.count(pages=result.page_count)
+        return result
+
+
+def generate_packet(
+    candidates: Iterable[CV | Document],
+    output_path: str,
+    style: str = "classic",
+    page_size: str = "A4",
+) -> PacketResult:
+    """Generate a hiring packet PDF holding many CVs.
+
+    Args:
+        candidates: CVs or their document trees, e.g. a generator that loads
+            each CV as it is needed
+        output_path: Path where the PDF will be saved
+        style: Style name for the CVs (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+
+    Returns:
+        The page count and the pages each candidate occupies
+
+    Raises:
+        ValueError: If there are no candidates
+    """
+    return PacketBuilder(style, page_size).build(candidates, output_path)
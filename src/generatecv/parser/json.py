@@ -0,0 +1,88 @@
+"""JSON Parser for CV Builder.
+
+This module handles CV data supplied as JSON documents or JSON Lines files.
+Parsing and validation both run in pydantic-core, without building
+intermediate Python dictionaries.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from generatecv.instrumentation import phase
+from generatecv.models import CV
+from generatecv.parser.yaml import CVDocument, validate_cv_data
+
+
+def validate_cv_json(data: str | bytes | bytearray, trusted: bool = False) -> CV:
+    """Parse and validate a JSON document as a CV.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+        trusted: Skip validation of pre-validated data (default is False);
+            see `validate_cv_data`
+
+    Returns:
+        CV object if data is valid
+
+    Raises:
+        ValidationError: If the data is not valid JSON or not a valid CV
+    """
+    if trusted:
+        with phase("parse"):
+            try:
+                parsed = from_json(data)
+            except ValueError as e:
+                # Raise what CV.model_validate_json raises for malformed JSON.
+                raise ValidationError.from_exception_data(
+                    CV.__name__,
+                    [
+                        {
+                            "type": "json_invalid",
+                            "loc": (),
+                            "input": data,
+                            "ctx": {"error": str(e)},
+                        }
+                    ],
+                ) from e
+        return validate_cv_data(parsed, trusted=True)
+    with phase("validate"):
+        return CV.model_validate_json(data)
+
+
+def iter_jsonl_cvs(file_path: str, trusted: bool = False) -> Iterator[CVDocument]:
+    """Stream validated CVs from a JSON Lines file.
+
+    Each line holds one CV as a JSON object. Lines are read and validated one
+    at a time, and invalid lines are yielded with their error instead of
+    aborting the stream. Blank lines are skipped but still count towards the
+    index, so `index` is always the zero-based line number.
+
+    Args:
+        file_path: Path to the JSON Lines file
+        trusted: Skip validation of pre-validated data (default is False);
+            see `validate_cv_data`
+
+    Yields:
+        One CVDocument per non-blank line, in file order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    jsonl_path = Path(file_path)
+
+    if not jsonl_path.exists():
+        raise FileNotFoundError(f"JSONL file not found: {file_path}")
+
+    with open(jsonl_path, "rb") as jsonl_file:
+        for index, line in enumerate(jsonl_file):
+            if not line.strip():
+                continue
+            try:
+                cv = validate_cv_json(line, trusted)
+            except ValueError as e:  # includes ValidationError
+                yield CVDocument(index, error=e)
+            else:
+                yield CVDocument(index, cv=cv)
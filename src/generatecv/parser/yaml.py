@@ -3,20 +3,57 @@
 This module handles the parsing of YAML files containing CV data.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
-from generatecv.models import CV
+from generatecv.instrumentation import phase
+from generatecv.models import CV, PersonalInfo
 
+# Use the libyaml-backed loader when PyYAML was built with it; it parses the
+# same safe subset of YAML several times faster than the pure-Python loader.
+_FastSafeLoader: type[Any] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def parse_yaml_file(file_path: str) -> dict[str, Any]:
+
+class CVDocument(NamedTuple):
+    """A CV read from a multi-document YAML stream.
+
+    Exactly one of `cv` and `error` is set.
+    """
+
+    # Shadows tuple.index, which documents are never searched with.
+    index: int  # type: ignore[bad-override]
+    cv: CV | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document produced a valid CV."""
+        return self.error is None
+
+
+def get_yaml_loader(use_libyaml: bool = True) -> type[Any]:
+    """Return the safe YAML loader class to parse CV files with.
+
+    Args:
+        use_libyaml: Use the C loader when available (default is True).
+            Set to False to force the pure-Python loader.
+
+    Returns:
+        The `CSafeLoader` class if requested and available, else `SafeLoader`
+    """
+    return _FastSafeLoader if use_libyaml else yaml.SafeLoader
+
+
+def parse_yaml_file(file_path: str, use_libyaml: bool = True) -> dict[str, Any]:
     """Parse a YAML file and return its contents as a dictionary.
 
     Args:
         file_path: Path to the YAML file
+        use_libyaml: Parse with the C loader when available (default is True)
 
     Returns:
         Dict containing the parsed YAML data
@@ -31,8 +68,9 @@ def parse_yaml_file(file_path: str) -> dict[str, Any]:
         raise FileNotFoundError(f"YAML file not found: {file_path}")
 
     try:
-        with open(yaml_path, encoding="utf-8") as yaml_file:
-            data = yaml.safe_load(yaml_file)
+        with open(yaml_path, encoding="utf-8") as yaml_file, phase("parse"):
+            loader = get_yaml_loader(use_libyaml)
+            data = yaml.load(yaml_file, Loader=loader)  # nosec B506 - safe loader
         # Ensure we're returning a dictionary
         if data is None:
             return {}
@@ -43,17 +81,115 @@ def parse_yaml_file(file_path: str) -> dict[str, Any]:
         raise yaml.YAMLError(f"Error parsing YAML file: {e}") from e
 
 
-def validate_cv_data(data: dict[str, Any]) -> CV:
+def validate_cv_data(data: dict[str, Any], trusted: bool = False) -> CV:
     """Validates that the CV data is properly structured using Pydantic models.
 
     Args:
         data: Dictionary containing CV data from YAML
+        trusted: Skip the expensive checks meant for untrusted input, such
+            as email address validation (default is False). Only use this
+            for data that has already been validated, such as
+            `cv.model_dump(mode="json")` output kept in your own store.
+            Structurally invalid data is still rejected.
 
     Returns:
-        CV object if data is valid, or a list of validation errors if invalid
+        CV object if data is valid
+
+    Raises:
+        ValidationError: If the data is not a valid CV; `errors()` lists
+            every problem found
+    """
+    with phase("validate"):
+        if trusted:
+            return _construct_trusted_cv(data)
+        return CV.model_validate(data)
+
+
+class _TrustedPersonalInfo(PersonalInfo):
+    """PersonalInfo that accepts the email address without checking it."""
+
+    email: str = Field(description="Primary email address.")  # type: ignore[assignment]
+
+
+def _construct_trusted_cv(data: dict[str, Any]) -> CV:
+    """Build a CV from pre-validated data, skipping the costly checks.
+
+    Nearly all of `CV.model_validate` runs in pydantic-core and is cheaper than
+    building the nested models from Python with `model_construct`. The one
+    expensive step is the `EmailStr` check, which calls email-validator in
+    Python, so only `PersonalInfo` is built without it and handed to
+    pydantic-core as an existing instance, which is not revalidated. Data
+    that is not a mapping is left to `CV.model_validate` to reject, so it
+    fails with the same `ValidationError` as in untrusted mode.
     """
+    if isinstance(data, dict) and isinstance(data.get("personal_info"), dict):
+        info = _TrustedPersonalInfo.model_validate(data["personal_info"])
+        data = {
+            **data,
+            "personal_info": PersonalInfo.model_construct(
+                info.model_fields_set, **dict(info)
+            ),
+        }
+    return CV.model_validate(data)
+
+
+def _to_cv_document(index: int, data: Any, trusted: bool = False) -> CVDocument:
+    """Validate one parsed document, capturing any error on the result."""
+    if not isinstance(data, dict):
+        return CVDocument(
+            index, error=ValueError(f"Expected dict from YAML, got {type(data)}")
+        )
     try:
-        cv = CV.model_validate(data)
-        return cv
+        with phase("validate"):
+            if trusted:
+                return CVDocument(index, cv=_construct_trusted_cv(data))
+            return CVDocument(index, cv=CV.model_validate(data))
     except ValidationError as e:
-        raise ValidationError(f"Validation error: {e.errors()}") from e
+        return CVDocument(index, error=e)
+
+
+def iter_yaml_cvs(
+    file_path: str, use_libyaml: bool = True, trusted: bool = False
+) -> Iterator[CVDocument]:
+    """Stream validated CVs from a multi-document YAML file.
+
+    Documents separated by `---` are parsed and validated one at a time, so
+    memory stays bounded by the largest single CV. Invalid documents are
+    yielded with their error instead of aborting the stream; empty documents
+    are skipped but still count towards the index.
+
+    Args:
+        file_path: Path to the YAML file
+        use_libyaml: Parse with the C loader when available (default is True)
+        trusted: Skip validation of pre-validated data (default is False);
+            see `validate_cv_data`
+
+    Yields:
+        One CVDocument per non-empty document, in file order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the stream itself is malformed, since no later
+            document can be read reliably after a syntax error
+    """
+    yaml_path = Path(file_path)
+
+    if not yaml_path.exists():
+        raise FileNotFoundError(f"YAML file not found: {file_path}")
+
+    with open(yaml_path, encoding="utf-8") as yaml_file:
+        loader = get_yaml_loader(use_libyaml)
+        documents = yaml.load_all(yaml_file, Loader=loader)  # nosec B506
+        index = 0
+        while True:
+            try:
+                with phase("parse"):
+                    data = next(documents)
+            except StopIteration:
+                return
+            except yaml.YAMLError as e:
+                raise yaml.YAMLError(f"Error parsing YAML document {index}: {e}") from e
+
+            if data is not None:
+                yield _to_cv_document(index, data, trusted)
+            index += 1
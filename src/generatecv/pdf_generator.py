@@ -5,62 +5,132 @@ This module handles the generation of PDF files from CV data.
 
 import os
 from collections.abc import Callable, Iterable  # Added cast
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, BinaryIO, NamedTuple, cast
 
 from reportlab.lib.pagesizes import A4, letter
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.platypus import (
     Flowable,
     ListFlowable,
     ListItem,
     Paragraph,
-    SimpleDocTemplate,
 )
+from reportlab.platypus.flowables import LIIndenter
 
-from generatecv.models import (
-    CV,
-    Certificate,
-    CompanyExperience,
-    Education,
-    Language,
-    PersonalInfo,
-    Project,
-    Reference,
-    Skill,
-)  # Updated import
+from generatecv.models import CV
 from generatecv.parser.yaml import parse_yaml_file, validate_cv_data
 
-from .styles import get_style
-
-
-class _PDFGenerator:
-    """Class to generate PDF files from CV data."""
+from .cache import RenderCache, SectionCache, render_cache_key, section_cache_key
+from .document import Block, BlockKind, Document, Inline, as_document
+from .instrumentation import phase
+from .layout import (
+    LayoutDocTemplate,
+    LayoutResult,
+    MeasuredParagraph,
+    ScaledDocTemplate,
+    SectionMarker,
+)
+from .styles import shared_style
+
+# A batch job: (cv_data, output_path[, style[, page_size]])
+PDFJob = tuple[CV, str] | tuple[CV, str, str] | tuple[CV, str, str, str]
+
+# A variant of one CV: (style, page_size)
+PDFVariant = tuple[str, str]
+
+# Smallest scale a CV is shrunk to when fitting it on `max_pages` pages
+MIN_FIT_SCALE = 0.6
+# Fitting stops once the best scale is known to within this much
+FIT_SCALE_PRECISION = 0.01
+
+
+class PDFJobResult(NamedTuple):
+    """Outcome of a single job rendered by `generatepdf_many`."""
+
+    # Shadows tuple.index, which results are never searched with.
+    index: int  # type: ignore[bad-override]
+    output_path: str
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job produced a PDF."""
+        return self.error is None
+
+
+def _reset_for_reuse(flowable: Flowable) -> None:
+    """Clear the layout state a previous doc.build left on a flowable."""
+    # doc.build marks flowables pushed to the next frame and only clears the
+    # mark under multiBuild; a stale mark makes the next build reject the
+    # flowable as too large.
+    flowable.__dict__.pop("_postponed", None)
+    # ListFlowable memoizes the LIIndenter-wrapped items it splits into; both
+    # the wrappers and the items they indent get laid out and marked.
+    if isinstance(flowable, ListFlowable) and flowable._list_content is not None:
+        # The stubs type _list_content as object; it is a list of flowables.
+        for item in cast("list[Flowable]", flowable._list_content):
+            _reset_for_reuse(item)
+    elif isinstance(flowable, LIIndenter):
+        _reset_for_reuse(flowable._flowable)
+
+
+def _count_flowables(flowables: list[Flowable]) -> dict[str, int]:
+    """Count the paragraphs, bullet lists and list items among flowables."""
+    paragraphs = lists = list_items = 0
+    for flowable in flowables:
+        if isinstance(flowable, Paragraph):
+            paragraphs += 1
+        elif isinstance(flowable, ListFlowable):
+            lists += 1
+            # The items move from _flowables to _list_content on first layout.
+            items = getattr(flowable, "_flowables", None)
+            list_items += len(items if items is not None else flowable._content)
+    return {"paragraphs": paragraphs, "lists": lists, "list_items": list_items}
+
+
+class PDFRenderer:
+    """Reusable renderer for producing many CV PDFs with the same settings.
+
+    Style, page size, margins and bullet list settings are resolved once when
+    the renderer is created. Each call to `render` builds its own document,
+    so no state is shared between CVs. The style sheet in `styles` is the
+    process-wide one from `shared_style` and must not be modified.
+    """
 
     def __init__(
         self,
-        output_path: str,
-        cv_data: CV,
         style: str = "classic",
         page_size: str = "A4",
+        cache: RenderCache | None = None,
+        section_cache: SectionCache | None = None,
     ):
-        """Initialize the PDF generator with CV data.
+        """Initialize the renderer and resolve its layout settings.
 
         Args:
-            output_path (str): Path to save the generated PDF.
-            cv_data (CV): CV data object containing all the information.
             style (str): Style of the CV (default is "classic").
             page_size (str): Size of the PDF page (default is "A4").
+            cache (RenderCache | None): Cache of rendered PDFs to consult
+                before laying out a CV (default is None).
+            section_cache (SectionCache | None): Cache of per-section
+                flowables, so re-rendering an edited CV only rebuilds the
+                sections that changed (default is None).
         """
-        self.output_path = Path(output_path)
-        self.cv_data = cv_data
         # applying the style
         try:
-            self.cv_style = get_style(style)
-            self.styles = self.cv_style.get_styles()
+            self.cv_style = shared_style(style)
+            self.style_name = style.lower()
         except ValueError as e:
             print(f"Error applying style: {e}")
-            self.cv_style = get_style("classic")
-            self.styles = self.cv_style.get_styles()
+            self.cv_style = shared_style("classic")
+            self.style_name = "classic"
+        self.styles = self.cv_style.get_styles()
+        self.page_size_name = page_size.lower()
+        self.cache = cache
+        self.section_cache = section_cache
 
         # Set page size
         if page_size.lower() == "a4":
@@ -72,409 +142,550 @@ class _PDFGenerator:
                 f"Invalid page size: {page_size}. Choose 'A4' or 'letter'."
             )
 
-        os.makedirs(self.output_path.parent, exist_ok=True)
+        self.margins = {
+            "rightMargin": 72,
+            "leftMargin": 72,
+            "topMargin": 72,
+            "bottomMargin": 18,
+        }
+        self.list_options: dict[str, Any] = {
+            "bulletType": "bullet",
+            "leftIndent": 12,
+            "bulletFontName": "Helvetica-Bold",
+            "bulletFontSize": self.styles["Normal"].fontSize,
+        }
+        # StyleSheet1 lookups are typed as PropertySet; every style in our
+        # sheets is a ParagraphStyle.
+        styles = cast("dict[str, ParagraphStyle]", self.styles)
+        normal = styles["Normal"]
+        self.block_styles: dict[BlockKind, ParagraphStyle] = {
+            "name": styles["Name"],
+            "headline": styles.get("ContactInfo", normal),
+            "contact": styles["ContactInfo"],
+            "heading": styles["SectionHeading"],
+            "entry": styles.get("ExperienceTitle", normal),
+            "role": styles.get("RoleTitle", styles["ExperienceDetails"]),
+            "details": styles.get("ExperienceDetails", normal),
+            "text": normal,
+        }
+
+    def render(
+        self,
+        cv_data: CV | Document,
+        dest: str | os.PathLike[str] | BinaryIO,
+        max_pages: int | None = None,
+    ) -> Path | BinaryIO:
+        """Render a CV to a file path or binary file-like object.
+
+        Args:
+            cv_data (CV | Document): CV data, or its prebuilt document tree.
+            dest (str | PathLike | BinaryIO): Where to write the PDF.
+            max_pages (int | None): Shrink fonts and spacing as little as
+                needed for the CV to fit on this many pages (default is
+                None, which renders at full size).
+
+        Returns:
+            The output path or file-like object the PDF was written to.
+
+        Raises:
+            ValueError: If the CV does not fit on `max_pages` pages even at
+                `MIN_FIT_SCALE`.
+        """
+        if self.cache is None:
+            return _PDFGenerator(dest, cv_data, renderer=self).generate(max_pages)
+
+        key = render_cache_key(cv_data, self.style_name, self.page_size_name, max_pages)
+        pdf = self.cache.get(key)
+        if pdf is None:
+            buffer = BytesIO()
+            _PDFGenerator(buffer, cv_data, renderer=self).generate(max_pages)
+            pdf = buffer.getvalue()
+            self.cache.put(key, pdf)
+
+        if isinstance(dest, str | os.PathLike):
+            output_path = Path(dest)
+            os.makedirs(output_path.parent, exist_ok=True)
+            output_path.write_bytes(pdf)
+            return output_path
+        dest.write(pdf)
+        return dest
+
+    def layout(self, cv_data: CV | Document) -> LayoutResult:
+        """Lay out a CV without drawing it or producing a PDF.
+
+        Flowables are wrapped and split across pages exactly as `render`
+        would, so the page count always matches the rendered document.
+
+        Args:
+            cv_data (CV | Document): CV data, or its prebuilt document tree.
+
+        Returns:
+            The page count, the pages each section spans and layout warnings.
+        """
+        return _PDFGenerator(BytesIO(), cv_data, renderer=self).layout()
+
+    def flowables(self, cv_data: CV | Document) -> list[Flowable]:
+        """Build the flowables of a CV without laying them out.
+
+        This is what `render` lays out, for placing a CV in a larger
+        document such as a hiring packet.
+
+        Args:
+            cv_data (CV | Document): CV data, or its prebuilt document tree.
+
+        Returns:
+            The flowables of every section, in order.
+        """
+        generator = _PDFGenerator(BytesIO(), cv_data, renderer=self)
+        generator._add_content()
+        return generator.elements
+
+
+class _PDFGenerator:
+    """Class to generate PDF files from CV data."""
+
+    def __init__(
+        self,
+        output_path: str | os.PathLike[str] | BinaryIO,
+        cv_data: CV | Document,
+        style: str = "classic",
+        page_size: str = "A4",
+        renderer: PDFRenderer | None = None,
+    ):
+        """Initialize the PDF generator with CV data.
 
-        self.doc = SimpleDocTemplate(
-            str(self.output_path),
+        Args:
+            output_path (str | PathLike | BinaryIO): Path to save the generated
+                PDF, or a binary file-like object to write the PDF into.
+            cv_data (CV | Document): CV data, or its prebuilt document tree.
+            style (str): Style of the CV (default is "classic").
+            page_size (str): Size of the PDF page (default is "A4").
+            renderer (PDFRenderer | None): Pre-resolved settings to use instead
+                of `style` and `page_size`.
+        """
+        self.output_path: Path | BinaryIO = (
+            Path(output_path)
+            if isinstance(output_path, str | os.PathLike)
+            else output_path
+        )
+        self.cv_data = cv_data
+        self.renderer = renderer or PDFRenderer(style, page_size)
+        self.cv_style = self.renderer.cv_style
+        self.styles = self.renderer.styles
+        self.page_size = self.renderer.page_size
+
+        if isinstance(self.output_path, Path):
+            os.makedirs(self.output_path.parent, exist_ok=True)
+
+        self.doc = ScaledDocTemplate(
+            (
+                str(self.output_path)
+                if isinstance(self.output_path, Path)
+                else self.output_path
+            ),
             pagesize=self.page_size,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18,
+            **self.renderer.margins,
         )
 
         # Elements to be added to the PDF
         self.elements: list[Flowable] = []
+        # Whether to mark where each section starts, for layout-only builds
+        self._mark_sections = False
+
+    def generate(self, max_pages: int | None = None) -> Path | BinaryIO:
+        """Generate the PDF document.
 
-    def generate(self) -> Path:
-        """Generate the PDF document."""
+        Args:
+            max_pages (int | None): Scale the document down so it fits on
+                this many pages (default is None).
+
+        Returns:
+            The output path or file-like object the PDF was written to.
+        """
         # Add all sections
         self._add_content()
 
+        if max_pages is not None:
+            self.doc.scale = self._fit_scale(max_pages)
+            for flowable in self.elements:
+                _reset_for_reuse(flowable)
+
         # Build the document
-        self.doc.build(self.elements)
+        with phase("layout") as layout:
+            self.doc.build(self.elements)
+            layout.count(pages=self.doc.page)
 
         return self.output_path
 
-    def _add_content(self) -> None:
-        """Add all CV content to the PDF."""
-        # Add personal info
-        personal_info = self.cv_data.personal_info
-        if personal_info:
-            self._add_personal_info(personal_info)
-
-        # Add experience
-        experience = self.cv_data.experience
-        if experience:
-            self._add_section("Experience", experience, self._format_company_experience)
-
-        # Add education
-        education = self.cv_data.education
-        if education:
-            self._add_section("Education", education, self._format_education)
-
-        # Add skills
-        skills = self.cv_data.skills
-        if skills:
-            self._add_skills(skills)
-
-        # Add projects
-        projects = self.cv_data.projects
-        if projects:
-            self._add_section("Projects", projects, self._format_project)
-
-        # Add certifications
-        certifications = self.cv_data.certifications
-        if certifications:
-            self._add_section(
-                "Certifications", certifications, self._format_certificate
-            )
-
-        # Add languages
-        languages = self.cv_data.languages
-        if languages:
-            self._add_section("Languages", languages, self._format_language)
-
-        # Add references
-        references = self.cv_data.references
-        if references:
-            self._add_section("References", references, self._format_reference)
-
-        # Add publications
-        publications = self.cv_data.publications
-        if publications:
-            self._add_simple_list_section("Publications", publications)
-
-        # Add awards
-        awards = self.cv_data.awards
-        if awards:
-            self._add_simple_list_section("Awards", awards)
-
-        # Add interests
-        interests = self.cv_data.interests
-        if interests:
-            self._add_simple_list_section("Interests", interests)
-
-        # Add custom sections
-        custom_sections = self.cv_data.custom_sections
-        if custom_sections:
-            self._add_custom_sections(custom_sections)
-
-    def _add_personal_info(self, personal_info: PersonalInfo) -> None:
-        """Add personal information to the PDF."""
-        # Add name
-        if personal_info.name:
-            self.elements.append(Paragraph(personal_info.name, self.styles["Name"]))
-
-        # Add title if present
-        if personal_info.title:
-            self.elements.append(
-                Paragraph(
-                    personal_info.title,
-                    self.styles.get("ContactInfo", self.styles["Normal"]),
-                )
-            )  # Use ContactInfo or fallback to Normal
-
-        # Combine contact information
-        contact_parts: list[str] = []
-        if personal_info.email:
-            contact_parts.append(f"Email: {personal_info.email}")
-        if personal_info.phone:
-            contact_parts.append(f"Phone: {personal_info.phone}")
-        if personal_info.location:
-            contact_parts.append(f"Location: {personal_info.location}")
-        if personal_info.website:
-            contact_parts.append(f"Website: {personal_info.website}")
-        if personal_info.linkedin:
-            contact_parts.append(f"LinkedIn: {personal_info.linkedin}")
-
-        contact_info = " | ".join(contact_parts)
-        self.elements.append(Paragraph(contact_info, self.styles["ContactInfo"]))
-
-        if personal_info.summary:
-            self.elements.append(
-                Paragraph("Summary", self.styles["SectionHeading"])
-            )  # Add a section heading for summary
-            self.elements.append(
-                Paragraph(personal_info.summary, self.styles["Normal"])
-            )
-        # Add a spacer after personal info
-
-    def _add_section(
-        self, title: str, items: Iterable[Any], formatter: Callable[[Any], None]
-    ) -> None:
-        """Add a section to the PDF with formatted items."""
-        self.elements.append(Paragraph(title, self.styles["SectionHeading"]))
-
-        for item in items:
-            formatter(item)
-
-    def _format_company_experience(self, company_exp: CompanyExperience) -> None:
-        """Format a company experience entry, including all its roles."""
-        # Company name and optional location
-        company_text = company_exp.company
-        if company_exp.location:
-            company_text += f" ({company_exp.location})"
-        self.elements.append(
-            Paragraph(company_text, self.styles["ExperienceTitle"])
-        )  # Style for company name
-
-        for role in company_exp.roles:
-            # Role title
-            self.elements.append(
-                Paragraph(
-                    role.title,
-                    self.styles.get("RoleTitle", self.styles["ExperienceDetails"]),
-                )
-            )  # Use RoleTitle or fallback to ExperienceDetails
-
-            # Dates for the role
-            dates = f"{role.start_date} - {role.end_date or 'Present'}"
-            if role.location:  # Role-specific location
-                dates += f" | {role.location}"
-            self.elements.append(Paragraph(dates, self.styles["ExperienceDetails"]))
-
-            # Description for the role
-            if role.description:
-                self.elements.append(Paragraph(role.description, self.styles["Normal"]))
-
-            # Achievements for the role
-            if role.achievements:
-                items: list[Flowable] = []
-                for achievement in role.achievements:
-                    items.append(
-                        cast(
-                            "Flowable",
-                            ListItem(Paragraph(achievement, self.styles["Normal"])),
-                        )
-                    )  # Cast ListItem to Flowable
-                self.elements.append(
-                    ListFlowable(
-                        items,
-                        bulletType="bullet",
-                        leftIndent=12,
-                        bulletFontName="Helvetica-Bold",
-                        bulletFontSize=self.styles["Normal"].fontSize,
-                    )
-                )
+    def layout(self) -> LayoutResult:
+        """Lay the document out without drawing it.
 
-    def _format_education(self, education: Education) -> None:
-        """Format an education entry."""
-        # Degree and institution
-        degree_text = f"{education.degree} - {education.institution}"
-        self.elements.append(
-            Paragraph(degree_text, self.styles["ExperienceTitle"])
-        )  # Reusing ExperienceTitle for consistency
-
-        # Dates
-        dates = f"{education.start_date} - {education.end_date or 'Present'}"
-        if education.location:
-            dates += f" | {education.location}"
-        self.elements.append(Paragraph(dates, self.styles["ExperienceDetails"]))
-
-        # GPA/Details
-        if education.gpa:
-            self.elements.append(
-                Paragraph(f"GPA: {education.gpa}", self.styles["Normal"])
-            )
-        if education.details:
-            self.elements.append(Paragraph(education.details, self.styles["Normal"]))
-
-    def _add_skills(self, skills: Iterable[Skill]) -> None:
-        """Add skills section to the PDF."""
-        self.elements.append(Paragraph("Skills", self.styles["SectionHeading"]))
-
-        print("Skills:")
-        for skill_item in skills:
-            # Skill category (e.g., Programming Languages)
-            self.elements.append(
-                Paragraph(
-                    skill_item.category,
-                    self.styles.get("ExperienceTitle", self.styles["Normal"]),
-                )
-            )  # Reusing ExperienceTitle or similar
-
-            print("Category:", skill_item)
-            print(skill_item.category)
-            # List of skills in that category
-            self.elements.append(Paragraph((skill_item.name), self.styles["Normal"]))
-
-    def _format_project(self, project: Project) -> None:
-        """Format a project entry."""
-        # Project name and optional link
-        project_name_text = project.name
-        if project.link:
-            project_name_text += f" (Link: {project.link})"  # Basic link display
-        self.elements.append(
-            Paragraph(project_name_text, self.styles["ExperienceTitle"])
-        )
+        Returns:
+            The page count, the pages each section spans and layout warnings.
+        """
+        self._mark_sections = True
+        self._add_content()
 
-        # Dates
-        if project.start_date and project.end_date:
-            dates = f"{project.start_date} - {project.end_date or 'Ongoing'}"
-            self.elements.append(Paragraph(dates, self.styles["ExperienceDetails"]))
-
-        # Description
-        if project.description:
-            self.elements.append(Paragraph(project.description, self.styles["Normal"]))
-
-        # Technologies used
-        if project.technologies:
-            tech_text = "Technologies: " + ", ".join(project.technologies)
-            self.elements.append(Paragraph(tech_text, self.styles["Normal"]))
-
-        # Achievements/Key Features
-        if project.achievements:
-            items: list[Flowable] = []
-            for achievement in project.achievements:
-                items.append(
-                    cast(
-                        "Flowable",
-                        ListItem(Paragraph(achievement, self.styles["Normal"])),
-                    )
-                )  # Cast ListItem to Flowable
-            self.elements.append(
-                ListFlowable(
-                    items,
-                    bulletType="bullet",
-                    leftIndent=12,
-                    bulletFontName="Helvetica-Bold",
-                    bulletFontSize=self.styles["Normal"].fontSize,
-                )
-            )
+        doc = LayoutDocTemplate(pagesize=self.page_size, **self.renderer.margins)
+        with phase("layout") as layout:
+            doc.build(self.elements)
+            layout.count(pages=doc.page)
+        return doc.result()
 
-    def _format_certificate(self, certificate: Certificate) -> None:
-        """Format a certificate entry."""
-        cert_name_text = certificate.name
-        if certificate.issuer:
-            cert_name_text += f" - {certificate.issuer}"
-        self.elements.append(
-            Paragraph(
-                cert_name_text,
-                self.styles.get("ExperienceTitle", self.styles["Normal"]),
-            )
-        )  # Reusing ExperienceTitle
+    def _fit_scale(self, max_pages: int) -> float:
+        """Find the largest scale at which the document fits on `max_pages`.
 
-        if certificate.date:
-            self.elements.append(
-                Paragraph(
-                    f"Date: {certificate.date}",
-                    self.styles.get("ExperienceDetails", self.styles["Normal"]),
-                )
-            )
-        if certificate.description:
-            self.elements.append(
-                Paragraph(certificate.description, self.styles["Normal"])
-            )
-        if certificate.link:
-            self.elements.append(
-                Paragraph(f"Link: {certificate.link}", self.styles["Normal"])
-            )
+        Each candidate scale is tried with a layout-only build of the same
+        flowables, so the text is parsed once and the final render reuses
+        the lines measured at the chosen scale.
 
-    def _format_language(self, lang: Language) -> None:
-        """Format a language entry."""
-        lang_text = f"{lang.name}: {lang.proficiency}"
-        self.elements.append(Paragraph(lang_text, self.styles["Normal"]))
-
-    def _format_reference(self, reference: Reference) -> None:
-        """Format a reference entry."""
-        self.elements.append(
-            Paragraph(
-                reference.name,
-                self.styles.get("ExperienceTitle", self.styles["Normal"]),
-            )
-        )  # Reusing ExperienceTitle
-        if reference.position:
-            self.elements.append(
-                Paragraph(
-                    reference.position,
-                    self.styles.get("ExperienceDetails", self.styles["Normal"]),
+        Raises:
+            ValueError: If it does not fit even at `MIN_FIT_SCALE`.
+        """
+        if max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {max_pages}")
+        pages, used = self._probe(1.0)
+        if pages <= max_pages:
+            return 1.0
+
+        # The largest scale known to fit and the smallest known not to, with
+        # the pages filled at each; MIN_FIT_SCALE is not known to fit yet.
+        low, low_used = MIN_FIT_SCALE, None
+        high, high_used = 1.0, used
+        margin = FIT_SCALE_PRECISION / 2
+        while low_used is None or high - low > FIT_SCALE_PRECISION:
+            if low_used is None:
+                # Pages shrink at least as fast as the scale.
+                guess = high * max_pages / high_used
+            else:
+                guess = low + (high - low) * (max_pages - low_used) / (
+                    high_used - low_used
                 )
-            )
-        if reference.company:
-            self.elements.append(
-                Paragraph(
-                    reference.company,
-                    self.styles.get("ExperienceDetails", self.styles["Normal"]),
+            # Aim just past the estimate, so that a good one closes the
+            # bracket from both sides.
+            floor = low if low_used is None else low + margin
+            scale = max(min(guess + margin, high - margin), floor)
+
+            pages, used = self._probe(scale)
+            if pages <= max_pages:
+                low, low_used = scale, used
+            elif scale <= MIN_FIT_SCALE:
+                raise ValueError(
+                    f"The CV does not fit on {max_pages} page(s) even at "
+                    f"{MIN_FIT_SCALE:.0%} of its size"
                 )
-            )
-        if reference.contact:
-            self.elements.append(
-                Paragraph(f"Contact: {reference.contact}", self.styles["Normal"])
-            )
-        if reference.relation:
-            self.elements.append(
-                Paragraph(f"Relation: {reference.relation}", self.styles["Normal"])
-            )
+            else:
+                high, high_used = scale, used
+        return low
 
-    def _add_simple_list_section(self, title: str, items_list: Iterable[str]) -> None:
-        """Add a section with a simple list of strings."""
-        self.elements.append(Paragraph(title, self.styles["SectionHeading"]))
-        items: list[Flowable] = []
-        for item_text in items_list:
-            items.append(
-                cast("Flowable", ListItem(Paragraph(item_text, self.styles["Normal"])))
-            )
-        if (
-            items
-        ):  # Only add ListFlowable if there are items to avoid errors with empty lists
-            self.elements.append(
-                ListFlowable(
-                    items,
-                    bulletType="bullet",
-                    leftIndent=12,
-                    bulletFontName="Helvetica-Bold",
-                    bulletFontSize=self.styles["Normal"].fontSize,
-                )
+    def _probe(self, scale: float) -> tuple[int, float]:
+        """Lay the document out at a scale without drawing it.
+
+        Returns:
+            The page count, and the pages filled counting the last one by
+            the fraction of it that is used.
+        """
+        for flowable in self.elements:
+            _reset_for_reuse(flowable)
+        doc = LayoutDocTemplate(
+            scale=scale, pagesize=self.page_size, **self.renderer.margins
+        )
+        with phase("fit") as fit:
+            # doc.build consumes the list it is given.
+            doc.build(list(self.elements))
+            fit.count(pages=doc.page)
+        return doc.page, doc.pages_used()
+
+    def _add_content(self) -> None:
+        """Add all CV content to the PDF."""
+        for section in as_document(self.cv_data).sections:
+            self._add_cached(
+                section.key,
+                section.blocks,
+                partial(self._add_blocks, section.blocks),
             )
 
-    def _add_custom_sections(self, custom_sections: dict[str, str | list[str]]) -> None:
-        """Add custom sections to the PDF."""
-        for title, content in custom_sections.items():
-            self.elements.append(Paragraph(title, self.styles["SectionHeading"]))
-            if isinstance(content, str):
-                self.elements.append(Paragraph(content, self.styles["Normal"]))
-            elif isinstance(content, list):
-                items: list[Flowable] = []
-                for item_text in content:  # Assuming content is List[str] as per model
-                    items.append(
-                        cast(
-                            "Flowable",
-                            ListItem(Paragraph(str(item_text), self.styles["Normal"])),
-                        )
-                    )  # Ensure item_text is str
-                if items:  # Only add ListFlowable if there are items
-                    self.elements.append(
-                        ListFlowable(
-                            items,
-                            bulletType="bullet",
-                            leftIndent=12,
-                            bulletFontName="Helvetica-Bold",
-                            bulletFontSize=self.styles["Normal"].fontSize,
-                        )
+    def _add_cached(self, section: str, data: Any, build: Callable[[], None]) -> None:
+        """Add a section's flowables, reusing them from the section cache.
+
+        `build` appends the section's flowables to `self.elements`; it is only
+        called when the section's data or style changed since it was cached.
+        The work is recorded as a `build:<section>` phase of the active trace.
+        """
+        if self._mark_sections:
+            self.elements.append(SectionMarker(section))
+        start = len(self.elements)
+        with phase(f"build:{section}") as build_phase:
+            cached = self._build_section(section, data, build)
+            if build_phase.active:
+                build_phase.count(**_count_flowables(self.elements[start:]))
+                if cached:
+                    build_phase.count(cached=1)
+
+    def _build_section(
+        self, section: str, data: Any, build: Callable[[], None]
+    ) -> bool:
+        """Run `build`, or add the section's flowables from the cache.
+
+        Returns:
+            True if the flowables came from the section cache.
+        """
+        cache = self.renderer.section_cache
+        if cache is None:
+            build()
+            return False
+
+        key = section_cache_key(section, data, self.renderer.style_name)
+        flowables = cache.get(key)
+        if flowables is None:
+            start = len(self.elements)
+            build()
+            cache.put(key, self.elements[start:])
+            return False
+        for flowable in flowables:
+            _reset_for_reuse(flowable)
+        self.elements.extend(flowables)
+        return True
+
+    def _add_blocks(self, blocks: Iterable[Block]) -> None:
+        """Add a flowable for each block of a section."""
+        block_styles = self.renderer.block_styles
+        for block in blocks:
+            if block.kind == "bullets":
+                items = [
+                    cast(
+                        "Flowable",
+                        ListItem(
+                            MeasuredParagraph(_pdf_text(inline), block_styles["text"])
+                        ),
                     )
+                    for inline in block.content
+                ]
+                self.elements.append(ListFlowable(items, **self.renderer.list_options))
+            else:
+                text = " | ".join(_pdf_text(inline) for inline in block.content)
+                self.elements.append(MeasuredParagraph(text, block_styles[block.kind]))
+
+
+def _pdf_text(inline: Inline) -> str:
+    """Return the text of an inline, spelling out links that are not shown."""
+    text = inline.plain()
+    if inline.href and inline.href != inline.text:
+        text += f" (Link: {inline.href})"
+    return text
 
 
 def generatepdf(
-    cv_data: CV, output_path: str, style: str = "classic", page_size: str = "A4"
+    cv_data: CV | Document,
+    output_path: str,
+    style: str = "classic",
+    page_size: str = "A4",
+    max_pages: int | None = None,
 ) -> str:
     """Generate a PDF CV from the provided data.
 
     Args:
-        cv_data: CV model containing the CV data
+        cv_data: CV model, or its document tree from `build_document`
         output_path: Path where the PDF will be saved
         style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
         page_size: Size of the page ('A4' or 'letter')
+        max_pages: Shrink the CV as little as needed to fit on this many pages
 
     Returns:
         Path to the generated PDF file
     """
-    generator = _PDFGenerator(output_path, cv_data, style, page_size)
-    return str(generator.generate())
+    renderer = PDFRenderer(style, page_size)
+    return str(renderer.render(cv_data, output_path, max_pages))
+
+
+def render_pdf_bytes(
+    cv_data: CV | Document,
+    style: str = "classic",
+    page_size: str = "A4",
+    cache: RenderCache | None = None,
+    max_pages: int | None = None,
+) -> bytes:
+    """Render a PDF CV in memory without touching the filesystem.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+        cache: Cache of rendered PDFs to reuse unchanged CVs from
+        max_pages: Shrink the CV as little as needed to fit on this many pages
+
+    Returns:
+        The PDF document as bytes
+    """
+    buffer = BytesIO()
+    PDFRenderer(style, page_size, cache).render(cv_data, buffer, max_pages)
+    return buffer.getvalue()
+
+
+def layout_pdf(
+    cv_data: CV | Document, style: str = "classic", page_size: str = "A4"
+) -> LayoutResult:
+    """Lay out a PDF CV without producing it, e.g. to count its pages.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
+        page_size: Size of the page ('A4' or 'letter')
+
+    Returns:
+        The page count, the pages each section spans and layout warnings
+    """
+    return PDFRenderer(style, page_size).layout(cv_data)
+
+
+def _run_pdf_job(indexed_job: tuple[int, PDFJob]) -> PDFJobResult:
+    """Render one batch job, turning any failure into an error result."""
+    index, job = indexed_job
+    # Unpacking is inside the try so malformed jobs fail like any other.
+    output_path = ""
+    try:
+        cv_data, output_path, *options = job
+        style, page_size = (*options, "classic", "A4")[:2]
+        return PDFJobResult(index, generatepdf(cv_data, output_path, style, page_size))
+    except Exception as e:
+        return PDFJobResult(index, str(output_path), f"{type(e).__name__}: {e}")
+
+
+def generatepdf_many(
+    jobs: Iterable[PDFJob], workers: int | None = None
+) -> list[PDFJobResult]:
+    """Generate many PDF CVs in parallel over a process pool.
+
+    A failing job does not abort the batch: its result carries the error
+    message instead of raising.
+
+    Args:
+        jobs: Iterable of (cv_data, output_path[, style[, page_size]]) tuples
+        workers: Number of worker processes (default: number of CPUs).
+            Use 1 to render in the current process.
+
+    Returns:
+        One PDFJobResult per job, in the same order as the jobs
+    """
+    indexed_jobs = list(enumerate(jobs))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(indexed_jobs) <= 1:
+        return [_run_pdf_job(job) for job in indexed_jobs]
+
+    workers = min(workers, len(indexed_jobs))
+    # Hand each worker a few chunks so IPC overhead stays small without
+    # leaving cores idle at the tail of the batch.
+    chunksize = max(1, len(indexed_jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_pdf_job, indexed_jobs, chunksize=chunksize))
+
+
+def _render_variant(
+    document: Document,
+    variant: PDFVariant,
+    max_pages: int | None,
+    section_cache: SectionCache | None = None,
+) -> bytes:
+    """Render one variant of a CV's document tree to PDF bytes."""
+    style, page_size = variant
+    buffer = BytesIO()
+    renderer = PDFRenderer(style, page_size, section_cache=section_cache)
+    renderer.render(document, buffer, max_pages)
+    return buffer.getvalue()
+
+
+def render_pdf_variants(
+    cv_data: CV | Document,
+    variants: Iterable[PDFVariant],
+    max_pages: int | None = None,
+    executor: Executor | None = None,
+) -> dict[PDFVariant, bytes]:
+    """Render one CV in several styles and page sizes.
+
+    The CV's document tree is built once for all variants. Without an
+    executor the variants render in turn in this process, and variants of
+    the same style reuse each other's flowables, so each style's content is
+    only built once. With an executor the variants render in parallel, each
+    task receiving the prebuilt document tree instead of the CV.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        variants: (style, page_size) pairs, e.g. [("classic", "A4"),
+            ("classic", "letter")]; names are case-insensitive
+        max_pages: Shrink each variant as little as needed to fit on this
+            many pages
+        executor: Executor to render the variants in parallel, e.g. a
+            long-lived `ProcessPoolExecutor`
+
+    Returns:
+        The PDF of each distinct variant, keyed by its lowercased
+        (style, page_size), in the order the variants were given
+    """
+    document = as_document(cv_data)
+    variant_list = list(
+        dict.fromkeys(
+            (style.lower(), page_size.lower()) for style, page_size in variants
+        )
+    )
+    if executor is None:
+        # Shared between variants rendered in turn, never across threads.
+        section_cache = SectionCache()
+        return {
+            variant: _render_variant(document, variant, max_pages, section_cache)
+            for variant in variant_list
+        }
+    futures = [
+        executor.submit(_render_variant, document, variant, max_pages)
+        for variant in variant_list
+    ]
+    return {
+        variant: future.result()
+        for variant, future in zip(variant_list, futures, strict=True)
+    }
+
+
+def generatepdf_variants(
+    cv_data: CV | Document,
+    output_base: str | os.PathLike[str],
+    variants: Iterable[PDFVariant],
+    max_pages: int | None = None,
+    executor: Executor | None = None,
+) -> dict[PDFVariant, Path]:
+    """Generate PDF files of one CV in several styles and page sizes.
+
+    Each variant is written to `<output_base>-<style>-<page_size>.pdf`, e.g.
+    "out/jane-classic-a4.pdf"; see `render_pdf_variants` for how the work
+    is shared and parallelized.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        output_base: Output path without a suffix, e.g. "out/jane"
+        variants: (style, page_size) pairs; names are case-insensitive
+        max_pages: Shrink each variant as little as needed to fit on this
+            many pages
+        executor: Executor to render the variants in parallel
+
+    Returns:
+        The path written for each distinct variant, keyed by its lowercased
+        (style, page_size)
+    """
+    base = Path(output_base)
+    os.makedirs(base.parent, exist_ok=True)
+    paths = {}
+    pdfs = render_pdf_variants(cv_data, variants, max_pages, executor)
+    for (style, page_size), pdf in pdfs.items():
+        path = base.with_name(f"{base.name}-{style}-{page_size}.pdf")
+        path.write_bytes(pdf)
+        paths[style, page_size] = path
+    return paths
 
 
 def yamltocv(
-    output_path: str, yaml_path: str, style: str = "classic", page_size: str = "A4"
+    output_path: str,
+    yaml_path: str,
+    style: str = "classic",
+    page_size: str = "A4",
+    trusted: bool = False,
 ) -> CV:
     """Convert YAML file to CV object.
 
@@ -484,12 +695,14 @@ def yamltocv(
         style: Style name for the CV (e.g., 'classic', 'modern', 'minimal')
         page_size: Size of the page ('A4' or 'letter')
         yaml_path: Path to the YAML file containing the CV data
+        trusted: Skip validation of pre-validated data (default is False);
+            see `validate_cv_data`
 
     Returns:
         CV object created from the YAML data
     """  # Add AI summary generation logic here
 
     yaml_data = parse_yaml_file(yaml_path)
-    cv_data = validate_cv_data(yaml_data)
+    cv_data = validate_cv_data(yaml_data, trusted)
 
     return cv_data
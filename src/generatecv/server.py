@@ -0,0 +1,259 @@
+"""Local HTTP render server for CV Builder.
+
+This module serves CV rendering over HTTP using only the standard library.
+Renders run in a pool of worker processes that import reportlab, build the
+styles and load the fonts once at startup, so requests only pay for parsing,
+validation and layout.
+
+Endpoints:
+    POST /render?format=pdf|html&style=classic&page_size=A4
+        Body is a CV as JSON (`Content-Type: application/json`) or YAML
+        (any other content type). Responds with the rendered document.
+    GET /healthz
+        Responds with 200 once the server accepts requests.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+from pydantic import ValidationError
+
+from generatecv.html_generator import render_html
+from generatecv.models import CV
+from generatecv.parser.json import validate_cv_json
+from generatecv.parser.yaml import get_yaml_loader
+from generatecv.pdf_generator import render_pdf_bytes
+from generatecv.styles import style_names
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+_CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "html": "text/html; charset=utf-8",
+}
+
+_WARMUP_CV = {
+    "personal_info": {"name": "Warm Up", "email": "warm.up@example.com"},
+    "education": [],
+    "experience": [],
+}
+
+
+class BadRequestError(ValueError):
+    """Raised by workers when a request body is not a valid CV."""
+
+
+def _warm_worker() -> None:
+    """Load styles and fonts in a new worker before it takes requests."""
+    cv_data = CV.model_validate(_WARMUP_CV)
+    for style in style_names():
+        render_pdf_bytes(cv_data, style)
+
+
+def _render_request(
+    body: bytes, is_json: bool, output_format: str, style: str, page_size: str
+) -> bytes:
+    """Parse, validate and render one request body in a worker process."""
+    try:
+        if is_json:
+            cv_data = validate_cv_json(body)
+        else:
+            data = yaml.load(body, Loader=get_yaml_loader())  # nosec B506 - safe loader
+            cv_data = CV.model_validate(data)
+    except (ValidationError, yaml.YAMLError) as e:
+        # Re-raised as a plain exception so it pickles back to the server.
+        raise BadRequestError(str(e)) from None
+
+    if output_format == "html":
+        return render_html(cv_data).encode("utf-8")
+    try:
+        return render_pdf_bytes(cv_data, style, page_size)
+    except ValueError as e:
+        raise BadRequestError(str(e)) from None
+
+
+class RenderServer(ThreadingHTTPServer):
+    """HTTP server that renders CVs in a pool of pre-warmed processes.
+
+    At most `workers + queue_size` requests are accepted at once; further
+    requests are rejected with 503 until a slot frees up, so a burst of
+    traffic cannot queue unbounded work.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        workers: int | None = None,
+        queue_size: int = 16,
+        timeout: float = 30.0,
+    ):
+        """Start the worker pool and bind the server.
+
+        Args:
+            address (tuple[str, int]): Host and port to listen on; port 0
+                picks a free port.
+            workers (int | None): Number of worker processes (default is the
+                number of CPUs).
+            queue_size (int): Requests allowed to wait for a free worker
+                (default is 16).
+            timeout (float): Seconds a request may take before the server
+                responds with 504 (default is 30).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.render_timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_worker
+        )
+        # Start and warm every worker now rather than on the first requests.
+        wait([self.executor.submit(os.getpid) for _ in range(self.workers)])
+        super().__init__(address, _RenderRequestHandler)
+
+    def submit(self, *args: Any) -> Future[bytes] | None:
+        """Submit a render, or return None if the server is at capacity."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            future = self.executor.submit(_render_request, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Timed out work keeps its slot until it really finishes.
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def server_close(self) -> None:
+        """Stop accepting connections and shut the worker pool down."""
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _RenderRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for `RenderServer`."""
+
+    def do_GET(self) -> None:
+        """Answer health checks."""
+        if urlsplit(self.path).path == "/healthz":
+            self._respond(HTTPStatus.OK, b"ok\n", "text/plain; charset=utf-8")
+        else:
+            self._error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def do_POST(self) -> None:
+        """Render the CV in the request body."""
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        output_format = query.get("format", "pdf").lower()
+        if output_format not in _CONTENT_TYPES:
+            self._error(HTTPStatus.BAD_REQUEST, f"Invalid format: {output_format}")
+            return
+
+        length = self._content_length()
+        if length is None:
+            return
+        body = self.rfile.read(length)
+        content_type = self.headers.get("Content-Type", "")
+        is_json = content_type.split(";")[0].strip() == "application/json"
+
+        future = cast(RenderServer, self.server).submit(
+            body,
+            is_json,
+            output_format,
+            query.get("style", "classic"),
+            query.get("page_size", "A4"),
+        )
+        if future is None:
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy", retry=True)
+            return
+        self._send_result(future, output_format)
+
+    def _content_length(self) -> int | None:
+        """Return the length of the request body, or respond with an error."""
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self._error(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+            return None
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._error(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {header}")
+            return None
+        if length > MAX_BODY_BYTES:
+            self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+            return None
+        return length
+
+    def _send_result(self, future: Future[bytes], output_format: str) -> None:
+        """Wait for a render and send the document or the error."""
+        timeout = cast(RenderServer, self.server).render_timeout
+        try:
+            document = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._error(HTTPStatus.GATEWAY_TIMEOUT, "Render timed out")
+        except BadRequestError as e:
+            self._error(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+        except Exception as e:
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"Render failed: {e}")
+        else:
+            self._respond(HTTPStatus.OK, document, _CONTENT_TYPES[output_format])
+
+    def _error(self, status: HTTPStatus, message: str, retry: bool = False) -> None:
+        """Send a plain text error response."""
+        headers = {"Retry-After": "1"} if retry else {}
+        body = f"{message}\n".encode()
+        self._respond(status, body, "text/plain; charset=utf-8", headers)
+
+    def _respond(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Send a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int | None = None,
+    queue_size: int = 16,
+    timeout: float = 30.0,
+) -> None:
+    """Run a render server until interrupted.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on
+        workers: Number of worker processes (default is the number of CPUs)
+        queue_size: Requests allowed to wait for a free worker
+        timeout: Seconds a request may take before failing with 504
+    """
+    with RenderServer((host, port), workers, queue_size, timeout) as server:
+        print(f"Serving CV renders on http://{host}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
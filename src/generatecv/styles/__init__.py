@@ -1,12 +1,26 @@
 """Styles module for CV PDFs."""
 
+from functools import cache
+
 from .base_style import CVStyle
 from .classic_style import ClassicStyle
 
+_STYLES: dict[str, type[CVStyle]] = {
+    "classic": ClassicStyle,
+}
+
+
+def style_names() -> list[str]:
+    """Return the names of all available styles."""
+    return list(_STYLES)
+
 
 def get_style(style_name: str) -> CVStyle:
     """Get a CV style by name.
 
+    Each call returns a private instance, so callers are free to customise
+    it without affecting other renders.
+
     Args:
         style_name: Name of the style
 
@@ -16,14 +30,40 @@ def get_style(style_name: str) -> CVStyle:
     Raises:
         ValueError: If the style name is not valid
     """
-    styles = {
-        "classic": ClassicStyle,
-    }
+    return shared_style(style_name).copy()
+
+
+def shared_style(style_name: str) -> CVStyle:
+    """Get the process-wide instance of a CV style.
+
+    The instance is built once per name and shared by every `PDFRenderer`,
+    whose paragraph cache relies on it never changing. It must not be
+    modified; use `get_style` for a copy that can be.
+
+    Args:
+        style_name: Name of the style
 
-    if style_name.lower() not in styles:
-        valid_styles = ", ".join(styles.keys())
+    Returns:
+        CVStyle object
+
+    Raises:
+        ValueError: If the style name is not valid
+    """
+    if style_name.lower() not in _STYLES:
+        valid_styles = ", ".join(_STYLES.keys())
         raise ValueError(
             f"Invalid style name: {style_name}. Valid styles are: {valid_styles}"
         )
 
-    return styles[style_name.lower()]()
+    return _cached_style(style_name.lower())
+
+
+@cache
+def _cached_style(style_name: str) -> CVStyle:
+    """Build the shared instance of a style."""
+    return _STYLES[style_name]()
+
+
+def clear_style_cache() -> None:
+    """Drop all cached styles so they are rebuilt on next use."""
+    _cached_style.cache_clear()
@@ -6,7 +6,11 @@ from reportlab.lib.styles import StyleSheet1, getSampleStyleSheet
 
 
 class CVStyle(ABC):
-    """Base class for CV styling."""
+    """Base class for CV styling.
+
+    Instances handed out by `shared_style` are shared, so subclasses must build
+    everything in `_setup_styles` and never change the sheet afterwards.
+    """
 
     def __init__(self) -> None:
         """Initialize the style."""
@@ -21,3 +25,7 @@ class CVStyle(ABC):
     def get_styles(self) -> StyleSheet1:
         """Get the styles dictionary."""
         return self.styles
+
+    def copy(self) -> "CVStyle":
+        """Return a freshly built instance that is safe to modify."""
+        return type(self)()
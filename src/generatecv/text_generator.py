@@ -0,0 +1,59 @@
+"""Plain text generation for CV Builder.
+
+This module renders the document tree of a CV as plain text with the same
+sections, in the same order, as the PDF generator, e.g. for applicant
+tracking systems or email bodies.
+"""
+
+from io import StringIO
+from typing import TextIO
+
+from generatecv.models import CV
+
+from .document import Block, Document, Inline, as_document
+
+
+def write_text(cv_data: CV | Document, stream: TextIO) -> None:
+    """Stream the plain text version of a CV to a text stream.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+        stream: Writable text stream that receives the text
+    """
+    for section in as_document(cv_data).sections:
+        for block in section.blocks:
+            stream.write(_text_block(block))
+
+
+def render_text(cv_data: CV | Document) -> str:
+    """Render a CV as plain text.
+
+    Args:
+        cv_data: CV model, or its document tree from `build_document`
+
+    Returns:
+        The text, one line per paragraph and bullet
+    """
+    buffer = StringIO()
+    write_text(cv_data, buffer)
+    return buffer.getvalue()
+
+
+def _text_block(block: Block) -> str:
+    """Return the lines of one block."""
+    if block.kind == "bullets":
+        return "".join(f"  - {_text_inline(inline)}\n" for inline in block.content)
+    text = " | ".join(_text_inline(inline) for inline in block.content)
+    if block.kind == "name":
+        return f"{text}\n{'=' * len(text)}\n"
+    if block.kind == "heading":
+        return f"\n{text}\n{'-' * len(text)}\n"
+    return f"{text}\n"
+
+
+def _text_inline(inline: Inline) -> str:
+    """Return the text of an inline, with its link target if not shown."""
+    text = inline.plain()
+    if inline.href and inline.href != inline.text:
+        text += f" ({inline.href})"
+    return text
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+from generatecv.models import CV
+from generatecv.pdf_generator import yamltocv
+
+EXAMPLE_YAML = Path(__file__).parents[1] / "src" / "tool" / "example.yaml"
+
+
+@pytest.fixture
+def example_yaml() -> Path:
+    """Fixture providing the path of the bundled example CV."""
+    return EXAMPLE_YAML
+
+
+@pytest.fixture
+def example_cv() -> CV:
+    """Fixture providing the bundled example CV."""
+    return yamltocv("", str(EXAMPLE_YAML))
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from generatecv import aio
+from generatecv.aio import AsyncRenderer, agenerate_pdf, arender_pdf_bytes, ayamltocv
+from generatecv.instrumentation import trace
+from generatecv.models import CV
+
+
+class TestAsyncApi:
+    """Test suite for the asyncio rendering API."""
+
+    def test_renders_without_blocking(self, tmp_path: Path, example_yaml: Path) -> None:
+        """Test that the async functions produce the same output as sync ones."""
+
+        async def main() -> tuple[CV, str, bytes]:
+            cv = await ayamltocv("", str(example_yaml))
+            path = await agenerate_pdf(cv, str(tmp_path / "cv.pdf"))
+            return cv, path, await arender_pdf_bytes(cv)
+
+        cv, path, pdf = asyncio.run(main())
+
+        assert cv.personal_info.name
+        assert Path(path).stat().st_size == len(pdf)
+        assert pdf.startswith(b"%PDF-")
+
+    def test_trace_records_executor_work(self, example_cv: CV) -> None:
+        """Test that a trace around an awaited render records its phases."""
+
+        async def main() -> list[str]:
+            with trace() as tracer:
+                await arender_pdf_bytes(example_cv)
+            return [record.name for record in tracer.records]
+
+        names = asyncio.run(main())
+
+        assert "build:experience" in names
+        assert names[-1] == "layout"
+
+    def test_caps_renders_in_flight(
+        self, example_cv: CV, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that no more renders run at once than the limiter allows."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        def fake_render(*args: object) -> bytes:
+            nonlocal running, peak
+            with lock:
+                running = running + 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running = running - 1
+            return b"%PDF-"
+
+        monkeypatch.setattr(aio, "render_pdf_bytes", fake_render)
+
+        async def main() -> tuple[bytes, ...]:
+            renderer = AsyncRenderer(2, executor)
+            return await asyncio.gather(
+                *(renderer.render_pdf_bytes(example_cv) for _ in range(6))
+            )
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            assert list(asyncio.run(main())) == [b"%PDF-"] * 6
+        assert peak == 2
+
+    def test_cancelled_waiter_never_renders(
+        self, example_cv: CV, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cancelling a queued render skips it and frees its slot."""
+        calls: list[str] = []
+
+        def fake_render(cv_data: CV, *args: object) -> bytes:
+            calls.append(cv_data.personal_info.name)
+            time.sleep(0.05)
+            return b"%PDF-"
+
+        monkeypatch.setattr(aio, "render_pdf_bytes", fake_render)
+
+        def named(name: str) -> CV:
+            cv = example_cv.model_copy(deep=True)
+            cv.personal_info.name = name
+            return cv
+
+        async def main() -> bytes:
+            renderer = AsyncRenderer(max_concurrency=1)
+            first = asyncio.create_task(renderer.render_pdf_bytes(named("first")))
+            queued = asyncio.create_task(renderer.render_pdf_bytes(named("queued")))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await first
+            return await renderer.render_pdf_bytes(named("last"))
+
+        assert asyncio.run(main()) == b"%PDF-"
+        assert calls == ["first", "last"]
@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from generatecv.batch import BatchRenderer
+from generatecv.cli import main
+from generatecv.inputs import collect_inputs
+
+
+@pytest.fixture
+def input_dir(tmp_path: Path, example_yaml: Path) -> Path:
+    """Fixture providing a directory with two YAML CVs and one JSON CV."""
+    directory = tmp_path / "cvs"
+    directory.mkdir()
+    shutil.copy(example_yaml, directory / "alice.yaml")
+    shutil.copy(example_yaml, directory / "bob.yml")
+    cv = {
+        "personal_info": {"name": "Carol", "email": "carol@example.com"},
+        "education": [],
+        "experience": [],
+    }
+    (directory / "carol.json").write_text(json.dumps(cv), "utf-8")
+    (directory / "notes.txt").write_text("not a CV", "utf-8")
+    return directory
+
+
+class TestCollectInputs:
+    """Test suite for expanding input patterns."""
+
+    def test_expands_directories_and_globs(self, input_dir: Path) -> None:
+        """Test that directories, globs and files are listed once each."""
+        inputs = collect_inputs(
+            [str(input_dir), str(input_dir / "*.yaml"), str(input_dir / "notes.txt")]
+        )
+
+        assert [path.name for path in inputs] == [
+            "alice.yaml",
+            "bob.yml",
+            "carol.json",
+            "notes.txt",
+        ]
+
+
+class TestBatchRenderer:
+    """Test suite for batch rendering of CV files."""
+
+    def test_renders_every_input(self, input_dir: Path, tmp_path: Path) -> None:
+        """Test that each input becomes a PDF named after it."""
+        output_dir = tmp_path / "out"
+
+        summary = BatchRenderer(jobs=1).render(
+            collect_inputs([str(input_dir)]), output_dir
+        )
+
+        assert summary.count("rendered") == 3
+        assert summary.failures == []
+        assert summary.docs_per_second > 0
+        for name in ("alice", "bob", "carol"):
+            assert (output_dir / f"{name}.pdf").read_bytes().startswith(b"%PDF-")
+
+    def test_skips_outputs_newer_than_inputs(
+        self, input_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that only inputs modified since their render are redone."""
+        renderer = BatchRenderer(jobs=1)
+        inputs = collect_inputs([str(input_dir)])
+        renderer.render(inputs, tmp_path)
+        later = (tmp_path / "alice.pdf").stat().st_mtime + 10
+        os.utime(input_dir / "alice.yaml", (later, later))
+
+        summary = renderer.render(inputs, tmp_path)
+
+        statuses = {result.input_path.name: result.status for result in summary.results}
+        assert statuses == {
+            "alice.yaml": "rendered",
+            "bob.yml": "skipped",
+            "carol.json": "skipped",
+        }
+
+    def test_hash_mode_tracks_content_and_settings(
+        self, input_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that hash mode ignores mtimes but notices edits and settings."""
+        inputs = collect_inputs([str(input_dir / "*.json")])
+        BatchRenderer(jobs=1, skip="hash").render(inputs, tmp_path)
+        os.utime(input_dir / "carol.json")
+
+        unchanged = BatchRenderer(jobs=1, skip="hash").render(inputs, tmp_path)
+        other_size = BatchRenderer(page_size="letter", jobs=1, skip="hash").render(
+            inputs, tmp_path
+        )
+
+        assert unchanged.count("skipped") == 1
+        assert other_size.count("rendered") == 1
+
+    def test_failures_do_not_abort_batch(self, input_dir: Path, tmp_path: Path) -> None:
+        """Test that invalid inputs are reported while the rest render."""
+        (input_dir / "broken.yaml").write_text("personal_info: {}\n", "utf-8")
+        inputs = collect_inputs([str(input_dir)])
+
+        summary = BatchRenderer(jobs=2).render(inputs, tmp_path)
+
+        assert summary.count("rendered") == 3
+        [failure] = summary.failures
+        assert failure.input_path.name == "broken.yaml"
+        assert failure.error is not None
+        assert failure.error.startswith("ValidationError")
+        assert not (tmp_path / "broken.pdf").exists()
+
+
+class TestRenderCommand:
+    """Test suite for the `generatecv render` command."""
+
+    def test_prints_throughput_and_failures(
+        self, input_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the command reports failures and sets the exit code."""
+        output_dir = tmp_path / "out"
+        args = ["render", str(input_dir / "*"), "-o", str(output_dir), "--jobs", "1"]
+
+        assert main(args) == 1
+        output = capsys.readouterr().out
+        assert f"FAILED {input_dir / 'notes.txt'}" in output
+        assert "Rendered 3, skipped 0, failed 1" in output
+        assert "docs/sec" in output
+
+        (input_dir / "notes.txt").unlink()
+        assert main(args) == 0
+        assert "Rendered 0, skipped 3, failed 0" in capsys.readouterr().out
+
+    def test_no_matching_inputs(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that an empty match is an error."""
+        assert main(["render", str(tmp_path / "*.yaml")]) == 1
+        assert "No input files matched" in capsys.readouterr().out
+
+    def test_rejects_unknown_style(
+        self, input_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that an unknown style fails before anything is rendered."""
+        output_dir = tmp_path / "out"
+        args = ["render", str(input_dir), "-o", str(output_dir), "--style", "fancy"]
+
+        assert main(args) == 2
+        assert "unknown style 'fancy'" in capsys.readouterr().err
+        assert not output_dir.exists()
+
+    def test_failures_fit_on_one_line(
+        self, input_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that multi-line parser errors are reported on one line."""
+        (input_dir / "broken.yaml").write_text("a: [1,\nb: :\n", "utf-8")
+        args = ["render", str(input_dir / "*.yaml"), "-o", str(tmp_path), "-j", "1"]
+
+        assert main(args) == 1
+        [failure] = [
+            line for line in capsys.readouterr().out.splitlines() if "FAILED" in line
+        ]
+        assert failure.startswith(f"FAILED {input_dir / 'broken.yaml'}: YAMLError")
+        assert failure.endswith("line 2, column 4")
@@ -0,0 +1,265 @@
+from collections.abc import Iterator
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from generatecv.cache import (
+    ParagraphCache,
+    RenderCache,
+    SectionCache,
+    get_paragraph_cache,
+    render_cache_key,
+    set_paragraph_cache,
+)
+from generatecv.models import CV
+from generatecv.pdf_generator import PDFRenderer, render_pdf_bytes
+
+
+@pytest.fixture
+def minimal_cv() -> CV:
+    """Fixture providing a small valid CV."""
+    return CV.model_validate(
+        {
+            "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+            "education": [],
+            "experience": [],
+        }
+    )
+
+
+class TestRenderCacheKey:
+    """Test suite for render cache keys."""
+
+    def test_key_is_stable(self, minimal_cv: CV) -> None:
+        """Test that equal CVs and settings produce the same key."""
+        copy = CV.model_validate(minimal_cv.model_dump())
+
+        assert render_cache_key(minimal_cv, "classic", "A4") == render_cache_key(
+            copy, "Classic", "a4"
+        )
+
+    def test_key_changes_with_content_and_settings(self, minimal_cv: CV) -> None:
+        """Test that any change to the CV or settings changes the key."""
+        edited = minimal_cv.model_copy(deep=True)
+        edited.personal_info.name = "Jane Q. Doe"
+
+        keys = {
+            render_cache_key(minimal_cv, "classic", "A4"),
+            render_cache_key(minimal_cv, "classic", "letter"),
+            render_cache_key(edited, "classic", "A4"),
+        }
+        assert len(keys) == 3
+
+
+class TestRenderCache:
+    """Test suite for the LRU render cache."""
+
+    def test_lru_eviction_in_memory(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = RenderCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        assert cache.get("a") == b"aaaa"
+
+        cache.put("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"aaaa"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (2, 1, 1)
+        assert (stats.entries, stats.size_bytes) == (2, 8)
+
+    def test_oversized_entries_are_not_stored(self) -> None:
+        """Test that a document larger than the budget is skipped."""
+        cache = RenderCache(max_bytes=3)
+        cache.put("a", b"aaaa")
+
+        assert len(cache) == 0
+
+    def test_on_disk_cache_persists(self, tmp_path: Path) -> None:
+        """Test that a directory-backed cache survives re-creation."""
+        RenderCache(directory=tmp_path).put("a", b"%PDF-a")
+
+        reopened = RenderCache(max_bytes=100, directory=tmp_path)
+
+        assert reopened.get("a") == b"%PDF-a"
+        assert reopened.stats().size_bytes == 6
+
+    def test_on_disk_eviction_removes_files(self, tmp_path: Path) -> None:
+        """Test that evicted entries are deleted from disk."""
+        cache = RenderCache(max_bytes=10, directory=tmp_path)
+        cache.put("a", b"aaaaaa")
+        cache.put("b", b"bbbbbb")
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["b.rendercache"]
+
+    def test_on_disk_cache_ignores_other_files(self, tmp_path: Path) -> None:
+        """Test that files the cache did not write are never evicted."""
+        resume = tmp_path / "my_resume.pdf"
+        resume.write_bytes(b"%PDF-" + b"x" * 5000)
+
+        cache = RenderCache(max_bytes=4000, directory=tmp_path)
+        cache.put("a", b"aaaaaa")
+
+        assert resume.stat().st_size == 5005
+        assert cache.stats().size_bytes == 6
+
+    def test_on_disk_cache_is_shared(self, tmp_path: Path) -> None:
+        """Test that caches on one directory see each other's entries."""
+        first = RenderCache(max_bytes=10, directory=tmp_path)
+        second = RenderCache(max_bytes=10, directory=tmp_path)
+        first.put("a", b"aaaaaa")
+
+        assert second.get("a") == b"aaaaaa"
+        assert second.stats().hits == 1
+
+        second.put("b", b"bbbbbb")
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["b.rendercache"]
+        assert first.get("a") is None
+        assert first.get("b") == b"bbbbbb"
+        assert first.stats().size_bytes == 6
+
+
+class TestRendererCache:
+    """Test suite for cached rendering."""
+
+    def test_hit_returns_stored_pdf(self, minimal_cv: CV, tmp_path: Path) -> None:
+        """Test that re-rendering an unchanged CV is served from the cache."""
+        cache = RenderCache()
+        renderer = PDFRenderer(cache=cache)
+
+        first = BytesIO()
+        renderer.render(minimal_cv, first)
+        output_path = renderer.render(minimal_cv, tmp_path / "cv.pdf")
+
+        assert cache.stats().hits == 1
+        assert cache.stats().misses == 1
+        assert Path(str(output_path)).read_bytes() == first.getvalue()
+
+    def test_render_pdf_bytes_uses_cache(self, minimal_cv: CV) -> None:
+        """Test that in-memory rendering can share a cache."""
+        cache = RenderCache()
+
+        first = render_pdf_bytes(minimal_cv, cache=cache)
+        second = render_pdf_bytes(minimal_cv, cache=cache)
+
+        assert first == second
+        assert cache.stats().hits == 1
+
+
+class TestSectionCache:
+    """Test suite for incremental re-rendering with cached sections."""
+
+    def test_edit_only_rebuilds_changed_section(self, example_cv: CV) -> None:
+        """Test that editing one bullet only misses the edited section."""
+        section_cache = SectionCache()
+        renderer = PDFRenderer(section_cache=section_cache)
+        renderer.render(example_cv, BytesIO())
+        sections = section_cache.stats().misses
+
+        edited = example_cv.model_copy(deep=True)
+        edited.experience[0].roles[0].description = "Rewrote the billing system."
+        renderer.render(edited, BytesIO())
+
+        stats = section_cache.stats()
+        assert stats.misses == sections + 1
+        assert stats.hits == sections - 1
+
+    def test_cached_render_matches_fresh_render(self, example_cv: CV) -> None:
+        """Test that reusing cached flowables produces the same document."""
+        renderer = PDFRenderer(section_cache=SectionCache())
+        renderer.render(example_cv, BytesIO())
+
+        cached = BytesIO()
+        renderer.render(example_cv, cached)
+
+        assert len(cached.getvalue()) == len(render_pdf_bytes(example_cv))
+
+    def test_evicts_oldest_section(self) -> None:
+        """Test that the cache is bounded by its number of entries."""
+        section_cache = SectionCache(max_entries=1)
+        section_cache.put("a", [])
+        section_cache.put("b", [])
+
+        assert section_cache.get("a") is None
+        assert section_cache.get("b") == []
+        assert section_cache.stats().evictions == 1
+
+    def test_reuses_lists_split_across_pages(self) -> None:
+        """Test that cached bullet lists spanning page breaks lay out again."""
+        role = {
+            "title": "Engineer",
+            "start_date": "2020",
+            "achievements": [f"Shipped feature {i}" for i in range(40)],
+        }
+        cv = CV.model_validate(
+            {
+                "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+                "education": [],
+                "experience": [
+                    {"company": f"Company {i}", "roles": [role]} for i in range(4)
+                ],
+            }
+        )
+        renderer = PDFRenderer(section_cache=SectionCache())
+        first = BytesIO()
+        renderer.render(cv, first)
+
+        second = BytesIO()
+        renderer.render(cv, second)
+
+        assert len(second.getvalue()) == len(first.getvalue())
+
+
+class TestParagraphCache:
+    """Test suite for the process-wide paragraph cache."""
+
+    @pytest.fixture
+    def paragraph_cache(self) -> Iterator[ParagraphCache]:
+        """Fixture installing a fresh shared paragraph cache."""
+        previous = get_paragraph_cache()
+        paragraph_cache = ParagraphCache()
+        set_paragraph_cache(paragraph_cache)
+        yield paragraph_cache
+        set_paragraph_cache(previous)
+
+    def test_repeated_text_is_reused(
+        self, paragraph_cache: ParagraphCache, minimal_cv: CV
+    ) -> None:
+        """Test that a second render parses and wraps nothing new."""
+        render_pdf_bytes(minimal_cv)
+        entries = len(paragraph_cache)
+        render_pdf_bytes(minimal_cv)
+
+        stats = paragraph_cache.stats()
+        assert stats.entries == entries
+        assert stats.hits >= entries
+        assert stats.hit_rate >= 0.5
+
+    def test_cached_render_matches_uncached_render(
+        self,
+        paragraph_cache: ParagraphCache,
+        example_cv: CV,
+    ) -> None:
+        """Test that shared parsing and wrapping produce the same document."""
+        example_cv.publications = [f"Paper <b>number</b> {i} " * 12 for i in range(60)]
+        cached = [render_pdf_bytes(example_cv) for _ in range(2)]
+
+        set_paragraph_cache(None)
+        uncached = render_pdf_bytes(example_cv)
+
+        assert paragraph_cache.stats().hits > 0
+        assert [len(pdf) for pdf in cached] == [len(uncached)] * 2
+
+    def test_evicts_oldest_entry(self) -> None:
+        """Test that the cache is bounded by its number of entries."""
+        paragraph_cache = ParagraphCache(max_entries=1)
+        paragraph_cache.put(("a",), 1)
+        paragraph_cache.put(("b",), 2)
+
+        assert paragraph_cache.get(("a",)) is None
+        assert paragraph_cache.get(("b",)) == 2
+        assert paragraph_cache.stats().evictions == 1
+        assert paragraph_cache.stats().hit_rate == 0.5
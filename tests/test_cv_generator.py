@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import pytest
@@ -106,6 +107,49 @@ class TestCVGenerator:
         assert f"<h1>{sample_cv_data.personal_info.name}</h1>" in content
         assert "Tech Solutions Inc." in content
 
+    def test_generate_html_covers_all_sections(
+        self, sample_cv_data: CVData, tmp_path: Path
+    ) -> None:
+        """Test that every CV section is rendered in the HTML output."""
+        generator = CVGenerator(output_format="html")
+        output_path = generator.generate(sample_cv_data, tmp_path / "output.html")
+
+        content = output_path.read_text(encoding="utf-8")
+        for heading in ("Summary", "Professional Experience", "Education", "Skills"):
+            assert f"<h2>{heading}</h2>" in content
+        assert "<li>Dean&#x27;s List</li>" in content
+        assert "Python, JavaScript, TypeScript, Java, C++" in content
+        assert "<li>Spanish (Intermediate)</li>" in content
+        assert "<li>Photography</li>" in content
+
+    def test_write_html_escapes_text(self, sample_cv_data: CVData) -> None:
+        """Test that user text cannot inject markup into the HTML."""
+        sample_cv_data.summary = "<script>alert('x')</script> & more"
+        stream = io.StringIO()
+
+        CVGenerator(output_format="html").write_html(sample_cv_data, stream)
+
+        content = stream.getvalue()
+        assert "<script>" not in content
+        assert "&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt; &amp; more" in content
+        assert content.endswith("</body>\n</html>")
+
+    def test_write_html_only_links_http_urls(self, sample_cv_data: CVData) -> None:
+        """Test that URLs with other schemes are shown as text, not links."""
+        sample_cv_data.personal_info.website = "https://example.com/?a=1&b=2"
+        sample_cv_data.personal_info.linkedin = "javascript:alert(1)"
+        sample_cv_data.personal_info.github = " \tJavaScript:alert(1)"
+        stream = io.StringIO()
+
+        CVGenerator(output_format="html").write_html(sample_cv_data, stream)
+
+        content = stream.getvalue()
+        url = "https://example.com/?a=1&amp;b=2"
+        assert f'<p>Website: <a href="{url}">{url}</a></p>' in content
+        assert "<p>LinkedIn: javascript:alert(1)</p>" in content
+        assert "alert(1)</p>" in content.split("GitHub: ")[1]
+        assert content.count("<a ") == 1
+
     def test_invalid_output_format(
         self, sample_cv_data: CVData, tmp_path: Path
     ) -> None:
@@ -0,0 +1,78 @@
+import pickle
+from io import BytesIO
+
+import pytest
+
+from generatecv.document import Block, Document, Inline, build_document
+from generatecv.html_generator import render_html
+from generatecv.models import CV
+from generatecv.pdf_generator import PDFRenderer
+
+
+class TestBuildDocument:
+    """Test suite for building the document tree of a CV."""
+
+    def test_sections_in_display_order(self) -> None:
+        """Test that sections follow the PDF order and empty ones are left out."""
+        cv = CV.model_validate(
+            {
+                "personal_info": {
+                    "name": "Jane Doe",
+                    "email": "jane@example.com",
+                    "github": "https://github.com/jane",
+                },
+                "education": [],
+                "experience": [],
+                "awards": ["Best Paper"],
+                "custom_sections": {"Talks": "PyCon 2024"},
+            }
+        )
+
+        document = build_document(cv)
+
+        assert document.title == "Jane Doe"
+        assert [section.key for section in document.sections] == [
+            "personal_info",
+            "awards",
+            "custom:Talks",
+        ]
+        name, contact = document.sections[0].blocks
+        assert name == Block("name", (Inline("Jane Doe"),))
+        assert contact.content[-1] == Inline(
+            "https://github.com/jane", "GitHub", "https://github.com/jane"
+        )
+        assert document.sections[1].blocks[1] == Block(
+            "bullets", (Inline("Best Paper"),)
+        )
+
+    def test_round_trips_through_json_and_pickle(self, example_cv: CV) -> None:
+        """Test that documents can be stored and shipped between processes."""
+        document = build_document(example_cv)
+
+        assert Document.from_json(document.to_json()) == document
+        assert pickle.loads(pickle.dumps(document)) == document
+
+    def test_rejects_invalid_json(self) -> None:
+        """Test that malformed documents raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid document JSON"):
+            Document.from_json('{"title": "Jane"}')
+
+    def test_rejects_unknown_block_kinds(self) -> None:
+        """Test that blocks no backend can render are rejected on load."""
+        with pytest.raises(ValueError, match="unknown block kind 'bogus'"):
+            Document.from_json('["Jane",[["k",[["bogus",[["text",null,null]]]]]]]')
+
+
+class TestBackends:
+    """Test suite for rendering from a prebuilt document tree."""
+
+    def test_backends_accept_documents(self, example_cv: CV) -> None:
+        """Test that a document renders exactly like the CV it came from."""
+        document = Document.from_json(build_document(example_cv).to_json())
+        renderer = PDFRenderer()
+
+        assert render_html(document) == render_html(example_cv)
+        assert renderer.layout(document) == renderer.layout(example_cv)
+        pdf = renderer.render(document, BytesIO())
+        assert isinstance(pdf, BytesIO)
+        assert pdf.getvalue().startswith(b"%PDF-")
@@ -0,0 +1,58 @@
+from io import StringIO
+
+from generatecv.document import Document
+from generatecv.html_generator import render_html, write_html
+from generatecv.models import CV
+
+
+class TestRenderHtml:
+    """Test suite for HTML rendering of CV models."""
+
+    def test_renders_every_section(self, example_cv: CV) -> None:
+        """Test that each section of the example CV appears in the HTML."""
+        html = render_html(example_cv)
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.rstrip().endswith("</html>")
+        for heading in ("Summary", "Experience", "Education", "Skills", "Projects"):
+            assert f"<h2>{heading}</h2>" in html
+        assert example_cv.experience[0].roles[0].title in html
+
+    def test_escapes_user_text(self) -> None:
+        """Test that markup in CV fields is escaped."""
+        cv = CV.model_validate(
+            {
+                "personal_info": {"name": "<script>", "email": "jane@example.com"},
+                "education": [],
+                "experience": [],
+                "custom_sections": {"A & B": ["<b>bold</b>"]},
+            }
+        )
+
+        html = render_html(cv)
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "<h2>A &amp; B</h2>" in html
+        assert "<li>&lt;b&gt;bold&lt;/b&gt;</li>" in html
+
+    def test_only_links_http_urls(self) -> None:
+        """Test that documents cannot smuggle active URLs into links."""
+        document = Document.from_json(
+            '["t",[["k",[["text",[["click",null,"javascript:alert(1)"]]],'
+            '["text",[["site",null,"https://example.com"]]]]]]]'
+        )
+
+        html = render_html(document)
+
+        assert "javascript:" not in html
+        assert "<p>click</p>" in html
+        assert '<a href="https://example.com">site</a>' in html
+
+    def test_write_html_matches_render_html(self, example_cv: CV) -> None:
+        """Test that streaming produces the same document."""
+        stream = StringIO()
+
+        write_html(example_cv, stream)
+
+        assert stream.getvalue() == render_html(example_cv)
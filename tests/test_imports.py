@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+import generatecv
+
+# Cumulative import time allowed for `import generatecv`, in microseconds.
+# Importing the rendering stack takes ~0.5s; the package root must stay tiny.
+IMPORT_TIME_BUDGET_US = 50_000
+
+HEAVY_MODULES = ("reportlab", "pydantic", "yaml", "email_validator")
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    """Run a snippet in a fresh interpreter so module caches start empty."""
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestLazyImports:
+    """Test suite for the lazily loaded top-level API."""
+
+    def test_import_does_not_load_heavy_modules(self) -> None:
+        """Test that importing the package pulls in no heavy dependencies."""
+        result = _run_python(
+            "import sys, generatecv; "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & "
+            f"{set(HEAVY_MODULES)}))"
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_import_time_budget(self) -> None:
+        """Test that `import generatecv` stays within its import-time budget."""
+        result = _run_python("import generatecv", "-X", "importtime")
+
+        cumulative_us = next(
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.split("|")[-1].strip() == "generatecv"
+        )
+        assert cumulative_us < IMPORT_TIME_BUDGET_US
+
+    def test_public_names_resolve(self) -> None:
+        """Test that every exported name can be imported from the root."""
+        for name in generatecv.__all__:
+            assert getattr(generatecv, name) is not None
+        assert generatecv.CV.__module__ == "generatecv.models"
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = generatecv.missing  # type: ignore[attr-defined]
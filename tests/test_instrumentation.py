@@ -0,0 +1,80 @@
+from io import BytesIO
+from pathlib import Path
+
+from generatecv.cache import SectionCache
+from generatecv.instrumentation import PhaseRecord, phase, trace
+from generatecv.models import CV
+from generatecv.pdf_generator import PDFRenderer, yamltocv
+
+
+class TestTrace:
+    """Test suite for per-phase render instrumentation."""
+
+    def test_records_every_phase(self, example_yaml: Path) -> None:
+        """Test that parsing, validation, sections and layout are all timed."""
+        with trace() as tracer:
+            cv = yamltocv("", str(example_yaml))
+            PDFRenderer().render(cv, BytesIO())
+
+        names = [record.name for record in tracer.records]
+        assert names[:2] == ["parse", "validate"]
+        assert "build:personal_info" in names
+        assert "build:experience" in names
+        assert names[-1] == "layout"
+        assert all(record.seconds >= 0 for record in tracer.records)
+
+    def test_reports_counts(self, example_cv: CV) -> None:
+        """Test that sections report flowable counts and layout pages."""
+        with trace() as tracer:
+            PDFRenderer().render(example_cv, BytesIO())
+
+        records = {record.name: record for record in tracer.records}
+        achievements = sum(
+            len(role.achievements or [])
+            for company in example_cv.experience
+            for role in company.roles
+        )
+        assert records["build:experience"].counts["paragraphs"] > 0
+        assert records["build:experience"].counts["list_items"] == achievements
+        assert records["layout"].counts["pages"] >= 1
+
+    def test_section_cache_hits_are_marked(self, example_cv: CV) -> None:
+        """Test that sections reused from the cache report the same counts."""
+        renderer = PDFRenderer(section_cache=SectionCache())
+        with trace() as first:
+            renderer.render(example_cv, BytesIO())
+        with trace() as second:
+            renderer.render(example_cv, BytesIO())
+
+        built = {r.name: r.counts for r in first.records if r.name.startswith("build:")}
+        reused = {
+            r.name: r.counts for r in second.records if r.name.startswith("build:")
+        }
+        assert all("cached" not in counts for counts in built.values())
+        assert reused == {
+            name: {**counts, "cached": 1} for name, counts in built.items()
+        }
+
+    def test_callback_and_totals(self) -> None:
+        """Test that the callback sees each phase and totals add them up."""
+        seen: list[PhaseRecord] = []
+        with trace(seen.append) as tracer:
+            with phase("custom") as custom:
+                custom.count(items=2)
+            with phase("custom"):
+                pass
+
+        assert seen == tracer.records
+        assert seen[0].counts == {"items": 2}
+        assert tracer.totals()["custom"] == seen[0].seconds + seen[1].seconds
+
+    def test_inactive_outside_trace(self) -> None:
+        """Test that phases are no-ops when no trace is active."""
+        with trace() as tracer:
+            pass
+
+        with phase("ignored") as ignored:
+            ignored.count(items=1)
+
+        assert not ignored.active
+        assert tracer.records == []
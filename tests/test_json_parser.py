@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from generatecv.parser.json import iter_jsonl_cvs, validate_cv_json
+
+VALID_CV = {
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+    "education": [],
+    "experience": [
+        {
+            "company": "Tech Corp",
+            "roles": [{"title": "Engineer", "start_date": "2020"}],
+        }
+    ],
+}
+
+
+class TestValidateCvJson:
+    """Test suite for direct JSON validation."""
+
+    def test_accepts_bytes_and_str(self) -> None:
+        """Test that JSON bytes and text both validate into a CV."""
+        payload = json.dumps(VALID_CV)
+
+        from_bytes = validate_cv_json(payload.encode("utf-8"))
+        from_str = validate_cv_json(payload)
+
+        assert from_bytes == from_str
+        assert from_bytes.experience[0].roles[0].title == "Engineer"
+
+    def test_rejects_malformed_json(self) -> None:
+        """Test that broken JSON is reported as a validation error."""
+        with pytest.raises(ValidationError, match="json_invalid"):
+            validate_cv_json(b'{"personal_info": ')
+        with pytest.raises(ValidationError, match="json_invalid"):
+            validate_cv_json(b'{"personal_info": ', trusted=True)
+
+    def test_trusted_matches_validated(self) -> None:
+        """Test that the trusted path builds the same CV."""
+        payload = json.dumps(VALID_CV)
+
+        assert validate_cv_json(payload, trusted=True) == validate_cv_json(payload)
+
+
+class TestIterJsonlCvs:
+    """Test suite for streaming JSON Lines files."""
+
+    def test_bad_lines_do_not_abort_stream(self, tmp_path: Path) -> None:
+        """Test that each line is validated independently."""
+        invalid_cv = {**VALID_CV, "personal_info": {"name": "No Email"}}
+        stream = tmp_path / "cvs.jsonl"
+        stream.write_text(
+            "\n".join([json.dumps(VALID_CV), "", json.dumps(invalid_cv), "{oops", ""])
+            + json.dumps(VALID_CV),
+            encoding="utf-8",
+        )
+
+        documents = list(iter_jsonl_cvs(str(stream)))
+
+        assert [document.index for document in documents] == [0, 2, 3, 4]
+        assert [document.ok for document in documents] == [True, False, False, True]
+        assert isinstance(documents[1].error, ValidationError)
+
+    def test_trusted_non_object_line(self, tmp_path: Path) -> None:
+        """Test that a trusted line that is not an object fails on its own."""
+        stream = tmp_path / "cvs.jsonl"
+        stream.write_text(f"[1]\n{json.dumps(VALID_CV)}\n", encoding="utf-8")
+
+        trusted = list(iter_jsonl_cvs(str(stream), trusted=True))
+        untrusted = list(iter_jsonl_cvs(str(stream)))
+
+        assert [document.ok for document in trusted] == [False, True]
+        assert isinstance(trusted[0].error, ValidationError)
+        assert trusted[0].error.errors()[0]["type"] == "model_type"
+        assert type(trusted[0].error) is type(untrusted[0].error)
+
+    def test_missing_file(self) -> None:
+        """Test that a missing file raises immediately."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_jsonl_cvs("nonexistent.jsonl"))
@@ -0,0 +1,119 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from generatecv.cli import main
+from generatecv.lint import LintError, lint_file, lint_files
+
+INVALID_CV = """\
+personal_info:
+  name: Jane Doe
+  email: not-an-email
+experience:
+  - company: 42
+    roles: []
+"""
+
+
+@pytest.fixture
+def corpus(tmp_path: Path, example_yaml: Path) -> Path:
+    """Fixture providing a directory with valid and invalid CV files."""
+    shutil.copy(example_yaml, tmp_path / "a_valid.yaml")
+    (tmp_path / "b_invalid.yaml").write_text(INVALID_CV, "utf-8")
+    (tmp_path / "c_syntax.yaml").write_text("education: [1\nexperience: []\n")
+    (tmp_path / "d_broken.json").write_text('{"personal_info": ', "utf-8")
+    return tmp_path
+
+
+class TestLintFile:
+    """Test suite for checking a single CV file."""
+
+    def test_reports_every_validation_error(self, corpus: Path) -> None:
+        """Test that all field errors are listed with their locations."""
+        result = lint_file(corpus / "b_invalid.yaml")
+
+        assert not result.ok
+        assert [(error.loc, error.type) for error in result.errors] == [
+            (["personal_info", "email"], "value_error"),
+            (["education"], "missing"),
+            (["experience", 0, "company"], "string_type"),
+        ]
+
+    def test_reports_yaml_syntax_position(self, corpus: Path) -> None:
+        """Test that YAML syntax errors carry their line and column."""
+        [error] = lint_file(corpus / "c_syntax.yaml").errors
+
+        assert error.type == "yaml_syntax"
+        assert (error.line, error.column) == (2, 11)
+
+    def test_valid_and_unreadable_files(self, corpus: Path) -> None:
+        """Test that valid files pass and missing files are reported."""
+        assert lint_file(corpus / "a_valid.yaml").ok
+        assert lint_file(corpus / "d_broken.json").errors[0].type == "json_invalid"
+        assert lint_file(corpus / "missing.yaml").errors == [
+            LintError(
+                [], f"YAML file not found: {corpus / 'missing.yaml'}", "read_error"
+            )
+        ]
+
+
+class TestLintFiles:
+    """Test suite for checking many files in parallel."""
+
+    def test_parallel_results_keep_input_order(self, corpus: Path) -> None:
+        """Test that worker processes return results in input order."""
+        paths = sorted(corpus.iterdir()) * 3
+
+        results = lint_files(paths, workers=2)
+
+        assert [result.path for result in results] == [str(path) for path in paths]
+        assert [result.ok for result in results] == [True, False, False, False] * 3
+
+    def test_never_imports_reportlab(self, corpus: Path) -> None:
+        """Test that validating files leaves the rendering stack unloaded."""
+        code = (
+            "import sys; from generatecv.lint import lint_files; "
+            f"lint_files([{str(corpus / 'a_valid.yaml')!r}], workers=1); "
+            "print('reportlab' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+class TestLintCommand:
+    """Test suite for the `generatecv lint` command."""
+
+    def test_prints_json_per_file(
+        self, corpus: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that invalid files are printed as JSON lines and fail the run."""
+        assert main(["lint", str(corpus), "--errors-only", "--jobs", "1"]) == 1
+
+        captured = capsys.readouterr()
+        reports = [json.loads(line) for line in captured.out.splitlines()]
+        assert [Path(report["path"]).name for report in reports] == [
+            "b_invalid.yaml",
+            "c_syntax.yaml",
+            "d_broken.json",
+        ]
+        assert reports[0]["errors"][0]["loc"] == ["personal_info", "email"]
+        assert "Checked 4 files, 3 invalid" in captured.err
+
+    def test_valid_corpus_passes(
+        self,
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+        example_yaml: Path,
+    ) -> None:
+        """Test that a corpus of valid files exits successfully."""
+        shutil.copy(example_yaml, tmp_path / "cv.yaml")
+
+        assert main(["lint", str(tmp_path / "*.yaml")]) == 0
+        assert json.loads(capsys.readouterr().out)["valid"] is True
@@ -0,0 +1,86 @@
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from generatecv.html_generator import render_html
+from generatecv.instrumentation import trace
+from generatecv.models import CV
+from generatecv.outputs import OutputRenderer, render_outputs
+from generatecv.parser.json import validate_cv_json
+from generatecv.text_generator import render_text
+
+
+class TestRenderOutputs:
+    """Test suite for writing several formats from one parse."""
+
+    def test_writes_every_format_from_one_parse(
+        self, tmp_path: Path, example_cv: CV, example_yaml: Path
+    ) -> None:
+        """Test that the file is parsed once and every format is written."""
+        input_path = tmp_path / "jane.yaml"
+        shutil.copy(example_yaml, input_path)
+
+        with trace() as tracer:
+            paths = render_outputs(input_path)
+
+        assert paths == {
+            name: tmp_path / f"jane.{name}" for name in ("pdf", "html", "txt", "json")
+        }
+        names = [record.name for record in tracer.records]
+        assert names.count("parse") == 1
+        assert names.count("validate") == 1
+        assert names.count("document") == 1
+        assert "layout" in names
+        assert paths["pdf"].read_bytes().startswith(b"%PDF-")
+        assert paths["html"].read_text("utf-8") == render_html(example_cv)
+        assert paths["txt"].read_text("utf-8") == render_text(example_cv)
+        assert validate_cv_json(paths["json"].read_bytes()) == example_cv
+
+    def test_selected_formats_only(self, tmp_path: Path, example_yaml: Path) -> None:
+        """Test that only the requested formats are written."""
+        paths = render_outputs(example_yaml, tmp_path / "out", formats=["json"])
+
+        assert list(paths) == ["json"]
+        assert [path.name for path in tmp_path.iterdir()] == ["out.json"]
+
+    def test_json_input_with_default_output_base(
+        self, tmp_path: Path, example_cv: CV
+    ) -> None:
+        """Test that the JSON of a JSON input goes beside it by default."""
+        input_path = tmp_path / "cv.json"
+        input_path.write_text(example_cv.model_dump_json(), "utf-8")
+
+        paths = render_outputs(input_path)
+
+        assert paths["json"] == tmp_path / "cv.normalized.json"
+        assert paths["pdf"] == tmp_path / "cv.pdf"
+        assert input_path.read_text("utf-8") == example_cv.model_dump_json()
+        assert validate_cv_json(paths["json"].read_bytes()) == example_cv
+
+    def test_refuses_to_overwrite_input(self, tmp_path: Path, example_cv: CV) -> None:
+        """Test that the JSON output may not replace a JSON input."""
+        input_path = tmp_path / "cv.json"
+        input_path.write_text(example_cv.model_dump_json(), "utf-8")
+
+        with pytest.raises(ValueError, match="overwrite the input"):
+            render_outputs(input_path, tmp_path / "cv")
+
+
+class TestOutputRenderer:
+    """Test suite for the reusable multi-format renderer."""
+
+    def test_rejects_unknown_formats(self) -> None:
+        """Test that unknown formats are reported up front."""
+        with pytest.raises(ValueError, match="got docx"):
+            OutputRenderer(["pdf", "docx"])  # type: ignore[list-item]
+
+    def test_process_pool_executor(self, tmp_path: Path, example_cv: CV) -> None:
+        """Test that formats can be written in worker processes."""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            renderer = OutputRenderer(("pdf", "html"), executor=executor)
+            paths = renderer.render(example_cv, tmp_path / "cv", max_pages=1)
+
+        assert paths["pdf"].read_bytes().startswith(b"%PDF-")
+        assert paths["html"].read_text("utf-8").startswith("<!DOCTYPE html>")
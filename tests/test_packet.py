@@ -0,0 +1,115 @@
+import gc
+import re
+import shutil
+import weakref
+from collections.abc import Iterator
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from generatecv.cli import main
+from generatecv.document import build_document
+from generatecv.models import CV
+from generatecv.packet import CandidateSpan, PacketBuilder, generate_packet
+from generatecv.pdf_generator import layout_pdf
+
+
+class _TrackedCV(CV):
+    """CV that can be watched with a weak reference."""
+
+
+def _candidates(cv: CV, count: int) -> Iterator[_TrackedCV]:
+    """Yield differently named copies of a CV."""
+    for index in range(count):
+        data = cv.model_dump()
+        data["personal_info"]["name"] = f"Candidate {index}"
+        yield _TrackedCV.model_validate(data)
+
+
+class TestPacketBuilder:
+    """Test suite for laying many CVs out in one PDF."""
+
+    def test_candidates_start_on_new_pages_with_bookmarks(self, example_cv: CV) -> None:
+        """Test that each candidate gets its own pages and outline entry."""
+        pages = layout_pdf(example_cv).page_count
+        buffer = BytesIO()
+
+        result = PacketBuilder().build(_candidates(example_cv, 3), buffer)
+
+        assert result.page_count == 3 * pages
+        assert result.candidates == [
+            CandidateSpan(f"Candidate {i}", i * pages + 1, (i + 1) * pages)
+            for i in range(3)
+        ]
+        pdf = buffer.getvalue()
+        assert b"/PageMode /UseOutlines" in pdf
+        titles = re.findall(rb"/Title \((Candidate \d)\)", pdf)
+        assert titles == [b"Candidate 0", b"Candidate 1", b"Candidate 2"]
+
+    def test_holds_one_candidate_at_a_time(self, example_cv: CV) -> None:
+        """Test that candidates are pulled lazily and released once laid out."""
+        alive: list[weakref.ref[_TrackedCV]] = []
+        most_alive = 0
+
+        def tracked() -> Iterator[_TrackedCV]:
+            nonlocal most_alive
+            for cv in _candidates(example_cv, 6):
+                gc.collect()
+                most_alive = max(most_alive, sum(ref() is not None for ref in alive))
+                alive.append(weakref.ref(cv))
+                yield cv
+
+        result = PacketBuilder().build(tracked(), BytesIO())
+
+        assert len(result.candidates) == 6
+        assert most_alive <= 1
+
+    def test_accepts_documents_and_rejects_empty_packets(
+        self, tmp_path: Path, example_cv: CV
+    ) -> None:
+        """Test that document trees work and an empty packet is an error."""
+        documents = [build_document(cv) for cv in _candidates(example_cv, 2)]
+
+        result = generate_packet(documents, str(tmp_path / "out" / "packet.pdf"))
+
+        assert [span.name for span in result.candidates] == [
+            "Candidate 0",
+            "Candidate 1",
+        ]
+        with pytest.raises(ValueError, match="at least one candidate"):
+            generate_packet([], str(tmp_path / "empty.pdf"))
+
+
+class TestPacketCommand:
+    """Test suite for the `generatecv packet` command."""
+
+    def test_skips_invalid_files(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        example_yaml: Path,
+    ) -> None:
+        """Test that invalid files are reported and the rest are combined."""
+        shutil.copy(example_yaml, tmp_path / "a.yaml")
+        shutil.copy(example_yaml, tmp_path / "b.yaml")
+        (tmp_path / "c.yaml").write_text("personal_info: {}\n", "utf-8")
+        output = tmp_path / "packet.pdf"
+
+        assert main(["packet", str(tmp_path), "-o", str(output)]) == 1
+
+        printed = capsys.readouterr().out
+        assert f"SKIPPED {tmp_path / 'c.yaml'}: ValidationError" in printed
+        assert "Wrote 2 CVs" in printed
+        assert output.read_bytes().startswith(b"%PDF-")
+
+    def test_rejects_unknown_style(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], example_yaml: Path
+    ) -> None:
+        """Test that an unknown style fails before the packet is written."""
+        output = tmp_path / "packet.pdf"
+
+        args = ["packet", str(example_yaml), "-o", str(output), "--style", "fancy"]
+        assert main(args) == 2
+        assert "unknown style 'fancy'" in capsys.readouterr().err
+        assert not output.exists()
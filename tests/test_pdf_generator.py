@@ -0,0 +1,265 @@
+import itertools
+import re
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from generatecv.cache import RenderCache, SectionCache
+from generatecv.instrumentation import trace
+from generatecv.models import CV
+from generatecv.pdf_generator import (
+    PDFRenderer,
+    generatepdf,
+    generatepdf_many,
+    generatepdf_variants,
+    layout_pdf,
+    render_pdf_bytes,
+    render_pdf_variants,
+)
+
+
+class TestGeneratePdfMany:
+    """Test suite for batch PDF rendering."""
+
+    def test_renders_all_jobs_in_order(self, example_cv: CV, tmp_path: Path) -> None:
+        """Test that every job produces a PDF and results keep job order."""
+        jobs = [(example_cv, str(tmp_path / f"cv_{i}.pdf")) for i in range(3)]
+
+        results = generatepdf_many(jobs, workers=2)
+
+        assert [result.index for result in results] == [0, 1, 2]
+        for result, (_, output_path) in zip(results, jobs, strict=True):
+            assert result.ok
+            assert result.output_path == output_path
+            assert Path(output_path).stat().st_size > 0
+
+    def test_failing_job_does_not_abort_batch(
+        self, example_cv: CV, tmp_path: Path
+    ) -> None:
+        """Test that a bad job reports an error while the others still render."""
+        jobs = [
+            (example_cv, str(tmp_path / "good.pdf")),
+            (example_cv, str(tmp_path / "bad.pdf"), "classic", "B5"),
+        ]
+
+        results = generatepdf_many(jobs, workers=1)
+
+        assert results[0].ok
+        assert not results[1].ok
+        assert results[1].error is not None
+        assert "Invalid page size" in results[1].error
+        assert not (tmp_path / "bad.pdf").exists()
+
+    def test_malformed_job_does_not_abort_batch(
+        self, example_cv: CV, tmp_path: Path
+    ) -> None:
+        """Test that a job of the wrong shape is reported like any failure."""
+        jobs = [(example_cv, str(tmp_path / "good.pdf")), (example_cv,)]
+
+        results = generatepdf_many(jobs, workers=1)  # type: ignore[bad-argument-type]
+
+        assert results[0].ok
+        assert not results[1].ok
+        assert results[1].output_path == ""
+        assert results[1].error is not None
+        assert results[1].error.startswith("ValueError: not enough values")
+
+
+class TestRenderPdfBytes:
+    """Test suite for in-memory PDF rendering."""
+
+    def test_returns_pdf_bytes(self, example_cv: CV) -> None:
+        """Test that rendering in memory returns a complete PDF document."""
+        pdf = render_pdf_bytes(example_cv)
+
+        assert isinstance(pdf, bytes)
+        assert pdf.startswith(b"%PDF-")
+        assert pdf.rstrip().endswith(b"%%EOF")
+
+    def test_writes_nothing_to_disk(
+        self, example_cv: CV, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that in-memory rendering creates no files."""
+        monkeypatch.chdir(tmp_path)
+
+        render_pdf_bytes(example_cv, page_size="letter")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_matches_file_output_size(self, example_cv: CV, tmp_path: Path) -> None:
+        """Test that the in-memory PDF is equivalent to the file-based one."""
+        output_path = generatepdf(example_cv, str(tmp_path / "cv.pdf"))
+
+        assert len(render_pdf_bytes(example_cv)) == Path(output_path).stat().st_size
+
+
+class TestPDFRenderer:
+    """Test suite for the reusable PDF renderer."""
+
+    def test_render_many_without_leaking_state(self, example_cv: CV) -> None:
+        """Test that each render produces the same standalone document."""
+        renderer = PDFRenderer(page_size="letter")
+        minimal_cv = CV.model_validate(
+            {
+                "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+                "education": [],
+                "experience": [],
+            }
+        )
+
+        first = BytesIO()
+        renderer.render(example_cv, first)
+        small = BytesIO()
+        renderer.render(minimal_cv, small)
+        second = BytesIO()
+        renderer.render(example_cv, second)
+
+        assert len(first.getvalue()) == len(second.getvalue())
+        assert len(small.getvalue()) < len(first.getvalue())
+
+    def test_render_to_path(self, example_cv: CV, tmp_path: Path) -> None:
+        """Test that rendering to a path creates missing directories."""
+        output_path = tmp_path / "nested" / "cv.pdf"
+
+        result = PDFRenderer().render(example_cv, output_path)
+
+        assert result == output_path
+        assert output_path.stat().st_size > 0
+
+    def test_invalid_page_size(self) -> None:
+        """Test that unsupported page sizes are rejected up front."""
+        with pytest.raises(ValueError, match="Invalid page size"):
+            PDFRenderer(page_size="B5")
+
+
+def count_pages(pdf: bytes) -> int:
+    """Count the pages of a rendered PDF."""
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+class TestLayoutPdf:
+    """Test suite for layout-only rendering."""
+
+    def test_page_count_matches_render(self, example_cv: CV) -> None:
+        """Test that layout reports as many pages as the rendered PDF has."""
+        long_cv = example_cv.model_copy(deep=True)
+        long_cv.publications = [f"Paper number {i}" for i in range(150)]
+
+        for cv in (example_cv, long_cv):
+            result = layout_pdf(cv)
+            assert result.page_count == count_pages(render_pdf_bytes(cv))
+
+        assert layout_pdf(long_cv).page_count > layout_pdf(example_cv).page_count
+
+    def test_reports_section_spans(self, example_cv: CV) -> None:
+        """Test that every section gets a page span, in document order."""
+        cv = example_cv.model_copy(deep=True)
+        cv.publications = [f"Paper number {i}" for i in range(150)]
+
+        result = layout_pdf(cv)
+
+        sections = [span.section for span in result.sections]
+        assert sections[:3] == ["personal_info", "experience", "education"]
+        assert sections[-1] == "publications"
+        assert result.sections[0].first_page == 1
+        assert result.sections[-1].last_page == result.page_count
+        for span, following in itertools.pairwise(result.sections):
+            assert span.first_page <= span.last_page <= following.first_page
+
+    def test_reuses_cached_sections(self, example_cv: CV) -> None:
+        """Test that layout and rendering can share a section cache."""
+        renderer = PDFRenderer(section_cache=SectionCache())
+
+        first = renderer.layout(example_cv)
+        pdf = BytesIO()
+        renderer.render(example_cv, pdf)
+        second = renderer.layout(example_cv)
+
+        assert first == second
+        assert first.page_count == count_pages(pdf.getvalue())
+
+
+class TestPDFVariants:
+    """Test suite for rendering one CV in several styles and page sizes."""
+
+    def test_variants_share_document_and_flowables(self, example_cv: CV) -> None:
+        """Test that content is built once and reused by every page size."""
+        variants = [("classic", "A4"), ("classic", "letter")]
+
+        with trace() as tracer:
+            pdfs = render_pdf_variants(example_cv, variants)
+
+        assert list(pdfs) == [("classic", "a4"), ("classic", "letter")]
+        assert b"/MediaBox [ 0 0 595.2756 841.8898 ]" in pdfs["classic", "a4"]
+        assert b"/MediaBox [ 0 0 612 792 ]" in pdfs["classic", "letter"]
+        names = [record.name for record in tracer.records]
+        assert names.count("document") == 1
+        experience = [
+            record.counts
+            for record in tracer.records
+            if record.name == "build:experience"
+        ]
+        assert [counts.get("cached") for counts in experience] == [None, 1]
+
+    def test_parallel_variants_write_files(
+        self, example_cv: CV, tmp_path: Path
+    ) -> None:
+        """Test that variants render in an executor and land in named files."""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            paths = generatepdf_variants(
+                example_cv,
+                tmp_path / "out" / "jane",
+                [("classic", "A4"), ("Classic", "Letter"), ("Classic", "a4")],
+                executor=executor,
+            )
+
+        assert paths == {
+            ("classic", "a4"): tmp_path / "out" / "jane-classic-a4.pdf",
+            ("classic", "letter"): tmp_path / "out" / "jane-classic-letter.pdf",
+        }
+        expected = render_pdf_bytes(example_cv, page_size="letter")
+        assert len(paths["classic", "letter"].read_bytes()) == len(expected)
+
+
+class TestFitToPages:
+    """Test suite for fitting a CV on a maximum number of pages."""
+
+    def test_shrinks_to_max_pages(self, example_cv: CV) -> None:
+        """Test that a three-page CV is scaled down onto two pages."""
+        cv = example_cv.model_copy(deep=True)
+        cv.publications = [f"Paper number {i}" for i in range(40)]
+        assert layout_pdf(cv).page_count == 3
+
+        pdf = render_pdf_bytes(cv, max_pages=2)
+
+        assert count_pages(pdf) == 2
+
+    def test_leaves_fitting_cv_unscaled(self, example_cv: CV) -> None:
+        """Test that a CV already within the limit renders as usual."""
+        fitted = render_pdf_bytes(example_cv, max_pages=2)
+
+        assert len(fitted) == len(render_pdf_bytes(example_cv))
+
+    def test_rejects_cv_that_cannot_fit(self, example_cv: CV) -> None:
+        """Test that fitting fails rather than shrinking without bound."""
+        cv = example_cv.model_copy(deep=True)
+        cv.publications = [f"Paper number {i}" for i in range(150)]
+
+        with pytest.raises(ValueError, match="does not fit on 1 page"):
+            render_pdf_bytes(cv, max_pages=1)
+        with pytest.raises(ValueError, match="at least 1"):
+            render_pdf_bytes(cv, max_pages=0)
+
+    def test_cached_render_keeps_max_pages_apart(self, example_cv: CV) -> None:
+        """Test that fitted and full-size renders are cached separately."""
+        cv = example_cv.model_copy(deep=True)
+        cv.publications = [f"Paper number {i}" for i in range(40)]
+        cache = RenderCache()
+
+        full = render_pdf_bytes(cv, cache=cache)
+        fitted = render_pdf_bytes(cv, cache=cache, max_pages=2)
+
+        assert count_pages(full) == 3
+        assert count_pages(fitted) == 2
@@ -0,0 +1,133 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.client import HTTPConnection, HTTPResponse
+from pathlib import Path
+
+import pytest
+
+from generatecv.server import RenderServer
+
+MINIMAL_CV = {
+    "personal_info": {"name": "Jane <Doe>", "email": "jane@example.com"},
+    "education": [],
+    "experience": [],
+}
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[RenderServer]:
+    """Fixture running a render server with one worker on a free port."""
+    with RenderServer(("127.0.0.1", 0), workers=1, queue_size=1) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+
+def connect(server: RenderServer) -> HTTPConnection:
+    """Open a connection to the server."""
+    host, port = server.server_address[:2]
+    assert isinstance(host, str)
+    return HTTPConnection(host, port, timeout=30)
+
+
+def post_raw(server: RenderServer, headers: dict[str, str]) -> HTTPResponse:
+    """Send an empty POST /render request with exactly the given headers."""
+    connection = connect(server)
+    connection.putrequest("POST", "/render", skip_accept_encoding=True)
+    for name, value in headers.items():
+        connection.putheader(name, value)
+    connection.endheaders()
+    response = connection.getresponse()
+    response.read()
+    return response
+
+
+def post(
+    server: RenderServer, path: str, body: bytes, content_type: str
+) -> tuple[HTTPResponse, bytes]:
+    """Send a POST request to the server and read the response."""
+    connection = connect(server)
+    connection.request("POST", path, body, {"Content-Type": content_type})
+    response = connection.getresponse()
+    return response, response.read()
+
+
+class TestRenderServer:
+    """Test suite for the HTTP render server."""
+
+    def test_renders_json_to_pdf(self, server: RenderServer) -> None:
+        """Test that a JSON CV is rendered to a PDF document."""
+        response, body = post(
+            server, "/render", json.dumps(MINIMAL_CV).encode(), "application/json"
+        )
+
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/pdf"
+        assert body.startswith(b"%PDF-")
+
+    def test_renders_yaml_to_html(
+        self, server: RenderServer, example_yaml: Path
+    ) -> None:
+        """Test that a YAML CV is rendered to escaped HTML."""
+        response, body = post(
+            server,
+            "/render?format=html",
+            example_yaml.read_bytes(),
+            "application/yaml",
+        )
+
+        assert response.status == 200
+        assert body.startswith(b"<!DOCTYPE html>")
+
+    def test_invalid_cv_is_rejected(self, server: RenderServer) -> None:
+        """Test that an invalid CV gets a 422 response with the error."""
+        response, body = post(
+            server, "/render", b'{"personal_info": {}}', "application/json"
+        )
+
+        assert response.status == 422
+        assert b"personal_info.name" in body
+
+    def test_busy_server_applies_backpressure(self, server: RenderServer) -> None:
+        """Test that requests are rejected with 503 when all slots are taken."""
+        taken = 0
+        while server._slots.acquire(blocking=False):
+            taken += 1
+        try:
+            response, _ = post(
+                server, "/render", json.dumps(MINIMAL_CV).encode(), "application/json"
+            )
+        finally:
+            for _ in range(taken):
+                server._slots.release()
+
+        assert response.status == 503
+        assert response.getheader("Retry-After") == "1"
+
+    def test_missing_content_length(self, server: RenderServer) -> None:
+        """Test that a request without a Content-Length gets a 411 response."""
+        response = post_raw(server, {"Content-Type": "application/json"})
+
+        assert response.status == 411
+
+    @pytest.mark.parametrize("length", ["abc", "-1"])
+    def test_invalid_content_length(self, server: RenderServer, length: str) -> None:
+        """Test that a malformed or negative Content-Length gets a 400 response."""
+        response = post_raw(server, {"Content-Length": length})
+
+        assert response.status == 400
+
+    def test_slow_render_times_out(self, server: RenderServer) -> None:
+        """Test that a render exceeding the timeout gets a 504 response."""
+        timeout = server.render_timeout
+        server.render_timeout = 0
+        try:
+            response, _ = post(
+                server, "/render", json.dumps(MINIMAL_CV).encode(), "application/json"
+            )
+        finally:
+            server.render_timeout = timeout
+
+        assert response.status == 504
@@ -0,0 +1,41 @@
+import pytest
+
+from generatecv.styles import (
+    ClassicStyle,
+    clear_style_cache,
+    get_style,
+    shared_style,
+)
+
+
+class TestGetStyle:
+    """Test suite for the cached style registry."""
+
+    def test_returns_shared_instance(self) -> None:
+        """Test that shared styles are built once and reused across calls."""
+        assert shared_style("classic") is shared_style("Classic")
+
+    def test_clear_style_cache_rebuilds(self) -> None:
+        """Test that clearing the cache produces a new instance."""
+        before = shared_style("classic")
+        clear_style_cache()
+        after = shared_style("classic")
+
+        assert after is not before
+        assert isinstance(after, ClassicStyle)
+
+    def test_get_style_returns_private_copy(self) -> None:
+        """Test that customising a style leaves the shared one untouched."""
+        private = get_style("classic")
+        private.get_styles()["Normal"].fontSize = 20
+
+        assert private is not shared_style("classic")
+        assert shared_style("classic").get_styles()["Normal"].fontSize == 10
+        assert get_style("classic").get_styles()["Normal"].fontSize == 10
+
+    def test_invalid_style_name(self) -> None:
+        """Test that unknown styles raise a helpful error."""
+        with pytest.raises(ValueError, match="Valid styles are: classic"):
+            get_style("fancy")
+        with pytest.raises(ValueError, match="Valid styles are: classic"):
+            shared_style("fancy")
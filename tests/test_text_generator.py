@@ -0,0 +1,33 @@
+from io import StringIO
+
+from generatecv.models import CV
+from generatecv.text_generator import render_text, write_text
+
+
+class TestRenderText:
+    """Test suite for plain text rendering of CV models."""
+
+    def test_renders_every_section(self, example_cv: CV) -> None:
+        """Test that each section of the example CV appears in the text."""
+        text = render_text(example_cv)
+
+        assert text.startswith(f"{example_cv.personal_info.name}\n=")
+        for heading in ("Summary", "Experience", "Education", "Skills", "Projects"):
+            assert f"\n{heading}\n{'-' * len(heading)}\n" in text
+        assert f"\n{example_cv.experience[0].roles[0].title}\n" in text
+
+    def test_spells_out_links(self) -> None:
+        """Test that link targets are shown next to their text."""
+        cv = CV.model_validate(
+            {
+                "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+                "education": [],
+                "experience": [],
+                "projects": [{"name": "generatecv", "link": "https://example.com"}],
+            }
+        )
+        stream = StringIO()
+
+        write_text(cv, stream)
+
+        assert "generatecv (https://example.com/)\n" in stream.getvalue()
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from generatecv.models import CV
+from generatecv.parser.yaml import (
+    get_yaml_loader,
+    iter_yaml_cvs,
+    parse_yaml_file,
+    validate_cv_data,
+)
+
+VALID_CV = """\
+personal_info:
+  name: Jane Doe
+  email: jane@example.com
+education: []
+experience: []
+"""
+
+
+class TestYamlLoader:
+    """Test suite for YAML loader selection."""
+
+    def test_pure_python_loader_on_request(self) -> None:
+        """Test that the libyaml switch can force the Python loader."""
+        assert get_yaml_loader(use_libyaml=False) is yaml.SafeLoader
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML without libyaml")
+    def test_prefers_libyaml_loader(self) -> None:
+        """Test that the C loader is used when PyYAML was built with it."""
+        assert get_yaml_loader() is yaml.CSafeLoader
+
+    def test_loaders_agree(self, example_yaml: Path) -> None:
+        """Test that both loaders produce identical data."""
+        fast = parse_yaml_file(str(example_yaml))
+        pure = parse_yaml_file(str(example_yaml), use_libyaml=False)
+
+        assert fast == pure
+        assert fast["personal_info"]["name"] == "Muhamad Wijayanto"
+
+
+class TestIterYamlCvs:
+    """Test suite for streaming multi-document YAML files."""
+
+    def test_yields_each_document(self, tmp_path: Path) -> None:
+        """Test that every document in the stream becomes a CV."""
+        stream = tmp_path / "cvs.yaml"
+        stream.write_text("---\n".join([VALID_CV] * 3), encoding="utf-8")
+
+        documents = list(iter_yaml_cvs(str(stream)))
+
+        assert [document.index for document in documents] == [0, 1, 2]
+        assert all(document.ok for document in documents)
+        assert documents[2].cv is not None
+        assert documents[2].cv.personal_info.name == "Jane Doe"
+
+    def test_invalid_document_does_not_abort_stream(self, tmp_path: Path) -> None:
+        """Test that bad documents carry their index and the stream continues."""
+        invalid_cv = VALID_CV.replace("jane@example.com", "not-an-email")
+        stream = tmp_path / "cvs.yaml"
+        stream.write_text(
+            "---\n".join([VALID_CV, invalid_cv, "- a list\n", VALID_CV]),
+            encoding="utf-8",
+        )
+
+        documents = list(iter_yaml_cvs(str(stream)))
+
+        assert [document.ok for document in documents] == [True, False, False, True]
+        assert isinstance(documents[1].error, ValidationError)
+        assert documents[1].cv is None
+        assert isinstance(documents[2].error, ValueError)
+
+    def test_syntax_error_reports_document_index(self, tmp_path: Path) -> None:
+        """Test that a malformed stream names the document that broke it."""
+        stream = tmp_path / "cvs.yaml"
+        stream.write_text(VALID_CV + "---\nname: [unclosed\n", encoding="utf-8")
+
+        documents = iter_yaml_cvs(str(stream))
+
+        assert next(documents).ok
+        with pytest.raises(yaml.YAMLError, match="document 1"):
+            next(documents)
+
+
+class TestValidateCvData:
+    """Test suite for validating parsed CV data."""
+
+    def test_invalid_data_keeps_structured_errors(self) -> None:
+        """Test that every problem is reported through the ValidationError."""
+        data = yaml.safe_load(VALID_CV.replace("jane@example.com", "not-an-email"))
+        del data["education"]
+
+        with pytest.raises(ValidationError) as excinfo:
+            validate_cv_data(data)
+
+        locations = {error["loc"] for error in excinfo.value.errors()}
+        assert locations == {("personal_info", "email"), ("education",)}
+
+
+class TestTrustedValidation:
+    """Test suite for the trusted fast path."""
+
+    def test_trusted_matches_validated(self, example_yaml: Path) -> None:
+        """Test that trusted data round-trips to the same CV."""
+        cv = validate_cv_data(parse_yaml_file(str(example_yaml)))
+        stored = cv.model_dump(mode="json")
+
+        trusted = validate_cv_data(stored, trusted=True)
+
+        assert trusted == cv
+        assert type(trusted.personal_info) is type(cv.personal_info)
+        assert trusted.model_dump_json() == cv.model_dump_json()
+
+    def test_trusted_skips_email_check(self) -> None:
+        """Test that trusted mode does not run the email validator."""
+        data = yaml.safe_load(VALID_CV.replace("jane@example.com", "jane@local"))
+
+        with pytest.raises(ValidationError):
+            CV.model_validate(data)
+        assert validate_cv_data(data, trusted=True).personal_info.email == (
+            "jane@local"
+        )
+
+    def test_trusted_still_rejects_malformed_data(self) -> None:
+        """Test that structurally invalid data is still refused."""
+        with pytest.raises(ValidationError):
+            validate_cv_data({"personal_info": {"name": "No Email"}}, trusted=True)